@@ -0,0 +1,73 @@
+"""
+Cost of collides_with for each pair of collider kinds, and the temporary memory of a sword swing test.
+The pairs overlap, so the full test runs instead of an early out.
+"""
+
+import tracemalloc
+
+import pygame
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.entities.components.box_collider import BoxCollider
+from data.modules.entities.components.circle_collider import CircleCollider
+from data.modules.entities.components.line_collider import LineCollider
+
+REPEATS = 20_000
+
+
+def get_pairs() -> dict:
+	# Entities move every frame, so the box is moved before each test
+	enemy_pos = pygame.Vector2(100, 100)
+
+	def box():
+		return BoxCollider((40, 30)).link_pos(enemy_pos)
+
+	def circle():
+		return CircleCollider((120, 90), 25)
+
+	def line():
+		# A sword swing crossing the box without either end inside it
+		return LineCollider((40, 85), 270, 100, start_offset=10)
+
+	return {
+		"box / box (enemy vs enemy)": (box(), BoxCollider((40, 30), (110, 110))),
+		"box / circle (enemy vs explosion)": (box(), circle()),
+		"box / line (enemy vs sword swing)": (box(), line()),
+		"circle / circle": (circle(), CircleCollider((140, 90), 25)),
+		"circle / line": (CircleCollider((90, 95), 15), line()),
+		"line / line": (line(), LineCollider((100, 40), 180, 120))
+	}, enemy_pos
+
+
+def benchmark():
+	pairs, enemy_pos = get_pairs()
+
+	for name, (collider, other) in pairs.items():
+		def test():
+			enemy_pos.x = 200.001 - enemy_pos.x  # Between 100 and 100.001
+			return collider.collides_with(other)
+
+		def test_still():
+			return collider.collides_with(other)
+
+		assert test(), name
+
+		print(name)
+		report("  moved, per call", time_per_call(test, REPEATS), "us")
+		report("  still, per call", time_per_call(test_still, REPEATS), "us")
+
+	tracemalloc.start()
+	collider, other = pairs["box / line (enemy vs sword swing)"]
+	for _ in range(100):
+		collider.collides_with(other)
+	tracemalloc.reset_peak()
+	base = tracemalloc.get_traced_memory()[0]
+	collider.collides_with(other)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	report("Sword vs enemy peak temporary memory per test", peak - base, "")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,80 @@
+"""
+CollisionBatch against collides_with per pair: checks they agree on random pairs, then times both for each kind of pair.
+The crossover is where the batch becomes faster, BATCH_MIN_PAIRS should be around it.
+"""
+
+import random
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.entities.components.box_collider import BoxCollider
+from data.modules.entities.components.circle_collider import CircleCollider
+from data.modules.entities.components.collision_batch import CollisionBatch
+from data.modules.entities.components.line_collider import LineCollider
+
+NUM_CHECKED_PAIRS = 200_000
+NUM_PAIRS = (1, 4, 8, 16, 32, 64, 256, 1024)
+REPEATS = 200
+
+
+def random_value(scale: float) -> float:
+	# Often on a coarse grid, so touching edges and shared corners come up
+	if random.random() < 0.4:
+		return random.randint(-6, 6) * scale / 6
+
+	return random.uniform(-scale, scale)
+
+
+def random_box() -> BoxCollider:
+	return BoxCollider((abs(random_value(40)) or 1, abs(random_value(40)) or 1), (random_value(60), random_value(60)))
+
+
+def random_circle() -> CircleCollider:
+	return CircleCollider((random_value(60), random_value(60)), abs(random_value(40)) or 1)
+
+
+def random_line() -> LineCollider:
+	angle = random.choice((0, 90, 180, 270, random.uniform(0, 360)))
+	return LineCollider((random_value(60), random_value(60)), angle, abs(random_value(60)) or 1, random.choice((0, 10, 50)))
+
+
+COLLIDERS = {"box": random_box, "circle": random_circle, "line": random_line}
+
+
+def check_agreement():
+	collision_batch = CollisionBatch(min_batch_pairs=1)
+	for _ in range(NUM_CHECKED_PAIRS):
+		collision_batch.add(random.choice(tuple(COLLIDERS.values()))(), random.choice(tuple(COLLIDERS.values()))())
+
+	mismatches = {}
+	for (collider, other), hit in zip(collision_batch.pairs, collision_batch.resolve()):
+		if bool(collider.collides_with(other)) != hit:
+			kind = type(collider).__name__, type(other).__name__
+			mismatches[kind] = mismatches.get(kind, 0) + 1
+
+	print(f"{NUM_CHECKED_PAIRS} random pairs, mismatches against collides_with: {mismatches or 'none'}")
+
+
+def benchmark():
+	random.seed(0)
+
+	check_agreement()
+
+	for kind, other_kind in (("box", "circle"), ("box", "line"), ("circle", "line"), ("line", "line")):
+		print(f"{kind} against {other_kind}")
+
+		for num_pairs in NUM_PAIRS:
+			pairs = [(COLLIDERS[kind](), COLLIDERS[other_kind]()) for _ in range(num_pairs)]
+
+			def per_pair():
+				return [collider.collides_with(other) for collider, other in pairs]
+
+			collision_batch = CollisionBatch(min_batch_pairs=1)
+			for collider, other in pairs:
+				collision_batch.add(collider, other)
+
+			report(f"  {num_pairs} pairs, collides_with", time_per_call(per_pair, REPEATS), "us")
+			report(f"  {num_pairs} pairs, batch", time_per_call(collision_batch.resolve, REPEATS), "us")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
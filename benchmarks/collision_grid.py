@@ -0,0 +1,75 @@
+"""
+Per-call cost of tile collision queries, Level.get_tile against the CollisionGrid
+"""
+
+import random
+
+import pygame
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator
+
+NUM_QUERIES = 100_000
+
+
+def benchmark():
+	random.seed(0)
+	level = LevelGenerator(10, EntityManager(), 21, 1).generate_level()
+	grid = level.collision_grid
+
+	# Hitboxes around the walls of the level
+	wall_positions = [tile_pos for tile_pos, _ in level.tiles.iter_tiles(1)]
+	hitboxes = []
+	for _ in range(NUM_QUERIES):
+		tile_pos = random.choice(wall_positions)
+		hitboxes.append(pygame.FRect(
+			(tile_pos[0] + random.uniform(-1, 1)) * TILE_SIZE,
+			(tile_pos[1] + random.uniform(-1, 1)) * TILE_SIZE,
+			70, 50
+		))
+
+	def get_tile_points():
+		for hitbox in hitboxes:
+			level.get_tile(hitbox.topleft)
+
+	def grid_points():
+		for hitbox in hitboxes:
+			grid.is_solid(hitbox.topleft)
+
+	# What Movement.move_in_direction used to do, 4 corners per axis
+	def get_tile_corners():
+		for hitbox in hitboxes:
+			_ = level.get_tile(hitbox.topright) or level.get_tile(hitbox.bottomright)
+			_ = level.get_tile(hitbox.topleft) or level.get_tile(hitbox.bottomleft)
+			_ = level.get_tile(hitbox.bottomleft) or level.get_tile(hitbox.bottomright)
+			_ = level.get_tile(hitbox.topleft) or level.get_tile(hitbox.topright)
+
+	def grid_spans():
+		for hitbox in hitboxes:
+			top_row = int(hitbox.top // TILE_SIZE)
+			bottom_row = int(hitbox.bottom // TILE_SIZE)
+			left_col = int(hitbox.left // TILE_SIZE)
+			right_col = int(hitbox.right // TILE_SIZE)
+
+			grid.col_span_is_solid(right_col, top_row, bottom_row)
+			grid.col_span_is_solid(left_col, top_row, bottom_row)
+			grid.row_span_is_solid(bottom_row, left_col, right_col)
+			grid.row_span_is_solid(top_row, left_col, right_col)
+
+	def grid_rects():
+		for hitbox in hitboxes:
+			grid.rect_is_solid(hitbox)
+
+	report("Level.get_tile point", time_per_call(get_tile_points, 3) / NUM_QUERIES, "ns")
+	report("CollisionGrid.is_solid point", time_per_call(grid_points, 3) / NUM_QUERIES, "ns")
+	report("Level.get_tile 8 corners (old movement)", time_per_call(get_tile_corners, 3) / NUM_QUERIES, "ns")
+	report("CollisionGrid 4 spans (movement)", time_per_call(grid_spans, 3) / NUM_QUERIES, "ns")
+	report("CollisionGrid.rect_is_solid", time_per_call(grid_rects, 3) / NUM_QUERIES, "ns")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,67 @@
+"""
+Shared setup for the benchmarks. Run them from the repository root, e.g. `python -m benchmarks.tile_storage`
+"""
+
+import os
+import time
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pygbase
+
+import main
+
+
+def run_in_game(benchmark: Callable[[], None]):
+	"""
+	Runs the benchmark once resources and loaders are initialized (same as the game), then quits
+	"""
+
+	class BenchmarkState(pygbase.GameState, name="benchmark"):
+		def __init__(self):
+			super().__init__()
+
+			benchmark()
+
+			pygbase.Events.post_event(pygame.QUIT)
+
+		def update(self, delta: float):
+			pass
+
+		def draw(self, surface: pygame.Surface):
+			pass
+
+	main.setup()
+	main.run(BenchmarkState)
+
+
+class LegacyTile:
+	"""
+	Tile before it became a flyweight, one image lookup and rect per tile. Kept to compare against
+	"""
+
+	def __init__(self, sprite_sheet_name: str, image_index: int, pos: tuple | pygame.Vector2):
+		self.sprite_sheet_name = sprite_sheet_name
+		self.image_index = image_index
+
+		self.image: pygbase.Image = pygbase.Resources.get_resource("sprite_sheets", sprite_sheet_name).get_image(image_index)
+		self.rect: pygame.Rect = self.image.get_image().get_rect(bottomleft=pos)
+
+
+def time_per_call(function: Callable[[], ...], repeats: int) -> float:
+	"""
+	:return: Average time per call in seconds
+	"""
+
+	start = time.perf_counter()
+	for _ in range(repeats):
+		function()
+
+	return (time.perf_counter() - start) / repeats
+
+
+def report(name: str, value: float, unit: str = "us"):
+	scale = {"s": 1, "ms": 1e3, "us": 1e6, "ns": 1e9, "KiB": 1 / 1024, "": 1}[unit]
+	print(f"{name:<48} {value * scale:>12.3f} {unit}")
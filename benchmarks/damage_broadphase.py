@@ -0,0 +1,90 @@
+"""
+Damage checks of a crowd of enemies against their sword swings, every damage entity against the spatial hash broadphase
+"""
+
+import random
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.base.utils import to_scaled_sequence
+from data.modules.entities.attacks.sword_swing import SwordSwing
+from data.modules.entities.components.box_collider import BoxCollider
+from data.modules.entities.entity import Entity
+from data.modules.entities.entity_manager import EntityManager
+
+NUM_ENEMIES = (50, 200, 800)
+NUM_FRAMES = 20
+AREA_SIZE = 30 * TILE_SIZE
+
+
+class CrowdEnemy(Entity, tags=("enemy",)):
+	def __init__(self, pos, entity_manager: EntityManager):
+		super().__init__(pos)
+
+		self.collider = BoxCollider(to_scaled_sequence((11.2, 8))).link_pos(self.pos)
+		self.entity_manager = entity_manager
+
+		self.num_hits = 0
+
+	def check_all(self):
+		# What Enemy.update used to do
+		for entity in self.entity_manager.get_entities_of_tag("damage"):
+			if self.collider.collides_with(entity.collider):  # NoQA
+				self.num_hits += 1
+				break
+
+	def check_nearby(self):
+		for entity in self.entity_manager.query_rect(self.collider.rect, "damage"):
+			if self.collider.collides_with(entity.collider):  # NoQA
+				self.num_hits += 1
+				break
+
+
+def benchmark():
+	random.seed(0)
+
+	for num_enemies in NUM_ENEMIES:
+		entity_manager = EntityManager()
+
+		enemies = []
+		for _ in range(num_enemies):
+			enemy = CrowdEnemy((random.uniform(0, AREA_SIZE), random.uniform(0, AREA_SIZE)), entity_manager)
+			entity_manager.add_entity(enemy)
+			enemies.append(enemy)
+
+			# Every enemy swings at once
+			flip = random.choice((-1, 1))
+			entity_manager.add_entity(SwordSwing(enemy.pos, random.uniform(0, 360), TILE_SIZE * 1.2, 1, flip), ("from_enemy",))
+
+		entity_manager.update(0)
+
+		def check_all():
+			for enemy in enemies:
+				enemy.check_all()
+
+		def check_nearby():
+			for enemy in enemies:
+				enemy.check_nearby()
+
+		for enemy in enemies:
+			enemy.num_hits = 0
+		all_time = time_per_call(check_all, NUM_FRAMES)
+		all_hits = sum(enemy.num_hits for enemy in enemies)
+
+		for enemy in enemies:
+			enemy.num_hits = 0
+		nearby_time = time_per_call(check_nearby, NUM_FRAMES)
+		nearby_hits = sum(enemy.num_hits for enemy in enemies)
+
+		update_time = time_per_call(lambda: entity_manager.update(0), NUM_FRAMES)
+
+		print(f"{num_enemies} enemies, {num_enemies} swings ({all_hits // NUM_FRAMES} hits, {nearby_hits // NUM_FRAMES} with the spatial hash)")
+		report("  check every damage entity", all_time, "ms")
+		report("  check spatial hash candidates", nearby_time, "ms")
+		report("  entity manager update (hash upkeep)", update_time, "ms")
+
+		entity_manager.clear_entities()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
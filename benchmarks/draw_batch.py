@@ -0,0 +1,90 @@
+"""
+Wall tiles and the objects between them blitted one call at a time, against collected per frame and submitted with fblits.
+The room is crowded with static objects, like a room full of pots and crates.
+"""
+
+import math
+import random
+
+import pygame
+import pygbase
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator, Level
+from data.modules.level.tile_storage import EMPTY_ID
+from data.modules.objects.game_object import GameObject
+
+SEED = 3
+NUM_OBJECTS = (0, 100, 400)
+NUM_FRAMES = 200
+
+
+def draw_rows_legacy(level: Level, surface: pygame.Surface, camera: pygbase.Camera, top_left: tuple[int, int], bottom_right: tuple[int, int]):
+	# The rows of Level.draw before batching
+	render_queue = level.entity_manager.render_queue
+	entities = render_queue.entities
+	keys = render_queue.keys
+	index = render_queue.get_row_start(top_left[1])
+
+	for row in range(top_left[1], bottom_right[1]):
+		bottom = int((row + 1) * TILE_SIZE)
+		for col in range(top_left[0], bottom_right[0]):
+			palette_id = level.tiles.get_id(1, col, row)
+			if palette_id != EMPTY_ID:
+				tile_type = level._get_tile_type(palette_id)  # NoQA
+				tile_type.image.draw(surface, camera.world_to_screen((int(col * TILE_SIZE), bottom - tile_type.height)))
+
+		while index < len(entities) and keys[index][0] == row:
+			entity = entities[index]
+			if entity.visible:
+				entity.draw(surface, camera)
+
+			index += 1
+
+
+def benchmark():
+	random.seed(0)
+
+	level: Level = LevelGenerator(10, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+	entity_manager = level.entity_manager
+
+	camera = pygbase.Camera(pos=pygame.Vector2(10.5, 10.5) * TILE_SIZE - pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
+	surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+	top_left = math.floor(camera.pos.x / TILE_SIZE), math.floor(camera.pos.y / TILE_SIZE)
+	bottom_right = math.floor((camera.pos.x + SCREEN_WIDTH) / TILE_SIZE) + 2, math.floor((camera.pos.y + SCREEN_HEIGHT) / TILE_SIZE) + 2
+
+	# Any tile art will do as the sprite of the objects
+	sprites = [level._get_tile_type(palette_id).image for palette_id in range(1, len(level.tiles.palette))]  # NoQA
+
+	num_added = 0
+	for num_objects in NUM_OBJECTS:
+		for _ in range(num_objects - num_added):
+			pos = camera.pos + pygame.Vector2(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT))
+			entity_manager.add_entity(GameObject("crate", pos, True, random.choice(sprites)))
+		num_added = num_objects
+
+		entity_manager.update(0)
+
+		def draw_legacy():
+			draw_rows_legacy(level, surface, camera, top_left, bottom_right)
+
+		def draw_batched():
+			level.draw_batch.reset_stats()
+			level._draw_rows(surface, camera, top_left, bottom_right)  # NoQA
+
+		print(f"{num_objects} objects")
+		report("  blit per tile and object", time_per_call(draw_legacy, NUM_FRAMES), "ms")
+		report("  batched", time_per_call(draw_batched, NUM_FRAMES), "ms")
+
+		stats = level.draw_batch.get_stats()
+		report("  blits per frame", stats["batched"] + stats["direct"], "")
+		report("  draw calls per frame, batched", stats["draw_calls"], "")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
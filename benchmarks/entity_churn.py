@@ -0,0 +1,106 @@
+"""
+Spawning and removing thousands of short-lived entities a frame among a resident crowd.
+Compares the list bookkeeping EntityManager used to do with list.remove against the IndexedList swap-remove it does now,
+then times whole EntityManager updates.
+"""
+
+import random
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.entities.entity import Entity
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.indexed_list import IndexedList
+
+NUM_RESIDENTS = 1000
+NUM_SPAWNED = (100, 500, 2000)  # Per frame
+LIFETIME = 3  # Frames
+NUM_FRAMES = 30
+
+
+class Resident(Entity, tags=("enemy",)):
+	pass
+
+
+class ShortLived(Entity, tags=("damage", "attack")):
+	def __init__(self, pos):
+		super().__init__(pos)
+
+		self.frames_left = LIFETIME
+
+	def update(self, delta: float):
+		self.frames_left -= 1
+
+	def is_alive(self):
+		return self.frames_left > 0
+
+
+def churn_lists(list_type: type, num_spawned: int):
+	"""
+	:return: One frame of adds and removes on an entity list and the tag lists of the spawned entities
+	"""
+
+	residents = [Resident((0, 0)) for _ in range(NUM_RESIDENTS)]
+	entities = list_type()
+	tagged_entities = {tag: list_type() for tag in ShortLived.tags}
+	for entity in residents:
+		entities.append(entity)
+
+	# Oldest first, the same order entities die in
+	alive = []
+
+	def frame():
+		if len(alive) >= num_spawned * LIFETIME:
+			dying = alive[:num_spawned]
+			del alive[:num_spawned]
+
+			for entity in dying:
+				entities.remove(entity)
+				for tag in entity.tags:
+					tagged_entities[tag].remove(entity)
+
+		for _ in range(num_spawned):
+			entity = ShortLived((0, 0))
+			alive.append(entity)
+
+			entities.append(entity)
+			for tag in entity.tags:
+				tagged_entities[tag].append(entity)
+
+	# Fill up to a steady state first
+	for _ in range(LIFETIME):
+		frame()
+
+	return frame
+
+
+def benchmark():
+	random.seed(0)
+
+	for num_spawned in NUM_SPAWNED:
+		print(f"{NUM_RESIDENTS} residents, {num_spawned} spawned and {num_spawned} removed per frame")
+
+		report("  list.remove bookkeeping, per frame", time_per_call(churn_lists(list, num_spawned), NUM_FRAMES), "ms")
+		report("  IndexedList bookkeeping, per frame", time_per_call(churn_lists(IndexedList, num_spawned), NUM_FRAMES), "ms")
+
+		entity_manager = EntityManager()
+		for _ in range(NUM_RESIDENTS):
+			entity_manager.add_entity(Resident((random.uniform(0, 30 * TILE_SIZE), random.uniform(0, 30 * TILE_SIZE))))
+
+		def frame():
+			for _ in range(num_spawned):
+				entity_manager.add_entity(ShortLived((random.uniform(0, 30 * TILE_SIZE), random.uniform(0, 30 * TILE_SIZE))))
+
+			entity_manager.update(1 / 60)
+
+		for _ in range(LIFETIME + 1):
+			frame()
+
+		report("  entity manager update with the spawns, per frame", time_per_call(frame, NUM_FRAMES), "ms")
+		print(f"  {len(entity_manager.entities)} entities after, {len(entity_manager.get_entities_of_tag('damage'))} tagged damage")
+
+		entity_manager.clear_entities()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,106 @@
+"""
+Cost of publishing an event, and wave completion from EntityDied events against polling every enemy each frame.
+Enemies of the wave die one per frame in a random order, the wave is checked every frame like Battle.update does.
+"""
+
+import random
+import time
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.event_bus import EventBus
+from data.modules.entities.entity import Entity
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.events import EntityDied
+from data.modules.level.enemy_wave import EnemyWave
+
+REPEATS = 100_000
+WAVE_SIZES = (10, 100, 1000)
+
+
+class Target(Entity, tags=("enemy",)):
+	def __init__(self):
+		super().__init__((0, 0))
+		self.alive = True
+
+	def is_alive(self):
+		return self.alive
+
+
+class LegacyEnemyWave(EnemyWave):
+	def watch_enemies(self, enemies: list):
+		self.enemies.extend(enemies)
+
+	def check_done(self):
+		# Previous EnemyWave.check_done, asks every enemy until one is alive
+		for enemy in self.enemies:
+			if enemy.is_alive():
+				return False
+
+		return True
+
+
+def run_wave(wave_class: type, num_enemies: int) -> tuple[float, float, EventBus]:
+	"""
+	:return: Seconds spent checking the wave, seconds spent updating the entity manager, event bus used
+	"""
+
+	entity_manager = EntityManager()
+	entity_manager.events.track_stats = True
+
+	enemies = [Target() for _ in range(num_enemies)]
+	for enemy in enemies:
+		entity_manager.add_entity(enemy)
+
+	wave = wave_class({}, entity_manager)
+	wave.watch_enemies(enemies)
+
+	random.seed(0)
+	death_order = random.sample(enemies, num_enemies)
+
+	check_time = 0.0
+	update_time = 0.0
+	while True:
+		start = time.perf_counter()
+		entity_manager.update(1 / 60)
+		update_time += time.perf_counter() - start
+
+		start = time.perf_counter()
+		done = wave.check_done()
+		check_time += time.perf_counter() - start
+
+		if done:
+			break
+
+		if len(death_order) > 0:
+			death_order.pop().alive = False
+
+	wave.cleanup()
+	return check_time, update_time, entity_manager.events
+
+
+def benchmark():
+	for num_subscribers in (0, 1, 8):
+		event_bus = EventBus()
+		for _ in range(num_subscribers):
+			event_bus.subscribe(EntityDied, lambda event: None)
+
+		event = EntityDied(Entity((0, 0)))
+		report(f"Publish with {num_subscribers} subscribers, per event", time_per_call(lambda: event_bus.publish(event), REPEATS), "us")
+
+	for num_enemies in WAVE_SIZES:
+		print(f"wave of {num_enemies}, one death per frame")
+
+		for wave_class in (LegacyEnemyWave, EnemyWave):
+			check_time, update_time, event_bus = run_wave(wave_class, num_enemies)
+
+			report(f"  {wave_class.__name__} checks, per frame", check_time / (num_enemies + 1), "us")
+			report(f"  {wave_class.__name__} entity manager update, per frame", update_time / (num_enemies + 1), "us")
+
+			stats = event_bus.stats.get(EntityDied)
+			if stats is not None:
+				report(f"  {wave_class.__name__} EntityDied dispatch, per event", stats.get_time_per_event(), "us")
+				report(f"  {wave_class.__name__} EntityDied events published", stats.num_published, "")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,95 @@
+"""
+Movers driven through FixedTimestep by different frame time patterns, against stepping them once per frame.
+Checks where they end up after the same game time, then times a simulated second at a few tick rates.
+"""
+
+import random
+
+import pygame
+
+from benchmarks.common import run_in_game, time_per_call, report
+from benchmarks.movement import get_free_positions, create_movers
+from data.modules.base.fixed_timestep import FixedTimestep
+from data.modules.base.utils import to_scaled_sequence
+from data.modules.entities.components.movement import Movement
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator, Level
+
+SEED = 3
+NUM_MOVERS = 100
+GAME_TIME = 4
+TICK_RATES = (30, 60, 120)
+REPEATS = 5
+
+
+def get_frame_deltas(pattern: str) -> list[float]:
+	random.seed(1)
+
+	frame_deltas = []
+	while sum(frame_deltas) < GAME_TIME - 1e-9:
+		if pattern == "steady 60 fps":
+			frame_deltas.append(1 / 60)
+		elif pattern == "steady 144 fps":
+			frame_deltas.append(1 / 144)
+		elif pattern == "jittery 40 to 90 fps":
+			frame_deltas.append(1 / random.uniform(40, 90))
+		else:  # Hitches
+			frame_deltas.append(1 / 60 if random.random() < 0.95 else 0.2)
+
+	# Every pattern covers the same game time
+	frame_deltas[-1] -= sum(frame_deltas) - GAME_TIME
+
+	return frame_deltas
+
+
+def run(level: Level, positions: list[pygame.Vector2], hitbox_size, frame_deltas: list[float], timestep: FixedTimestep | None) -> list[pygame.Vector2]:
+	movers = create_movers(Movement, level, positions, hitbox_size)
+	directions = [pygame.Vector2(1, 0).rotate(index * 37) for index in range(len(movers))]
+
+	def step(delta: float):
+		for (pos, movement), direction in zip(movers, directions):
+			movement.move_in_direction(pos, direction, delta)
+
+	for delta in frame_deltas:
+		if timestep is None:
+			step(delta)
+		else:
+			for _ in range(timestep.advance(delta)):
+				step(timestep.tick_delta)
+
+	return [pos for pos, _ in movers]
+
+
+def max_distance(positions: list[pygame.Vector2], other_positions: list[pygame.Vector2]) -> float:
+	return max(pos.distance_to(other_pos) for pos, other_pos in zip(positions, other_positions))
+
+
+def benchmark():
+	level = LevelGenerator(10, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+
+	hitbox_size = to_scaled_sequence((11.2, 8))
+	random.seed(0)
+	positions = random.sample(get_free_positions(level, hitbox_size), NUM_MOVERS)
+
+	patterns = ("steady 60 fps", "steady 144 fps", "jittery 40 to 90 fps", "60 fps with hitches")
+
+	# Hitches are within the catch up clamp, so the fixed timestep should not depend on the pattern at all
+	reference = run(level, positions, hitbox_size, get_frame_deltas(patterns[0]), FixedTimestep(60, 20))
+	legacy_reference = run(level, positions, hitbox_size, get_frame_deltas(patterns[0]), None)
+	print(f"Furthest mover from the steady 60 fps run after {GAME_TIME} s")
+	for pattern in patterns[1:]:
+		frame_deltas = get_frame_deltas(pattern)
+		report(f"  {pattern}, per frame", max_distance(legacy_reference, run(level, positions, hitbox_size, frame_deltas, None)), "")
+		report(f"  {pattern}, fixed timestep", max_distance(reference, run(level, positions, hitbox_size, frame_deltas, FixedTimestep(60, 20))), "")
+
+	frame_deltas = get_frame_deltas("steady 144 fps")
+	print(f"{NUM_MOVERS} movers, {GAME_TIME} s at 144 fps")
+	report("  per frame", time_per_call(lambda: run(level, positions, hitbox_size, frame_deltas, None), REPEATS), "ms")
+	for tick_rate in TICK_RATES:
+		report(f"  {tick_rate} ticks per second", time_per_call(lambda: run(level, positions, hitbox_size, frame_deltas, FixedTimestep(tick_rate)), REPEATS), "ms")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
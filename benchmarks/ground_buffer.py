@@ -0,0 +1,113 @@
+"""
+Ground layer drawn from the ring buffer against blitting its baked chunks every frame.
+The camera eases towards points around the dungeon like it follows the player, so most frames it moves a few pixels.
+Also checks the ring buffer draws the same pixels, after panning and after a tile is changed.
+"""
+
+import math
+import random
+import time
+
+import pygame
+import pygbase
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.chunk_cache import ChunkSurfaceCache
+from data.modules.level.level import LevelGenerator, Level
+from data.modules.level.tile_ring_buffer import TileRingBuffer
+
+SEED = 3
+NUM_FRAMES = 600
+SAMPLE_STEP = 4  # Every few pixels are compared
+
+
+def get_camera_path() -> list[pygame.Vector2]:
+	random.seed(0)
+
+	pos = pygame.Vector2(10.5, 10.5) * TILE_SIZE
+	target = pos.copy()
+
+	path = []
+	for frame in range(NUM_FRAMES):
+		if frame % 90 == 0:
+			target = pos + pygame.Vector2(random.uniform(-6, 6), random.uniform(-6, 6)) * TILE_SIZE
+
+		# Same easing as Camera.lerp_to_target at 60 fps
+		pos += (target - pos) * (8 / 60)
+		path.append(pos - pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2))
+
+	return path
+
+
+def draw_chunks(chunk_cache: ChunkSurfaceCache, surface: pygame.Surface, camera: pygbase.Camera):
+	# Layer 0 of Level.draw before the ring buffer
+	top_left = math.floor(camera.pos.x / TILE_SIZE), math.floor(camera.pos.y / TILE_SIZE)
+	bottom_right = math.floor((camera.pos.x + SCREEN_WIDTH) / TILE_SIZE) + 2, math.floor((camera.pos.y + SCREEN_HEIGHT) / TILE_SIZE) + 2
+
+	surface.fill((0, 0, 0))
+	chunk_cache.draw(0, surface, camera, top_left, bottom_right)
+
+
+def count_different_pixels(surface: pygame.Surface, other: pygame.Surface) -> int:
+	return sum(
+		surface.get_at((x, y)) != other.get_at((x, y))
+		for y in range(0, SCREEN_HEIGHT, SAMPLE_STEP)
+		for x in range(0, SCREEN_WIDTH, SAMPLE_STEP)
+	)
+
+
+def benchmark():
+	level: Level = LevelGenerator(10, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+	chunk_cache = ChunkSurfaceCache(level.tiles, level._get_tile_type, (0,))  # NoQA
+	ring_buffer = TileRingBuffer(level.tiles, level._get_tile_type, 0, (SCREEN_WIDTH, SCREEN_HEIGHT))  # NoQA
+
+	path = get_camera_path()
+	camera = pygbase.Camera()
+	surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+	expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+	for name, draw in (("baked chunks", lambda: draw_chunks(chunk_cache, surface, camera)), ("ring buffer", lambda: ring_buffer.draw(surface, camera))):
+		camera.pos.update(path[0])
+		draw()  # Bakes chunks or fills the buffer before timing
+		ring_buffer.num_tiles_drawn = 0
+
+		start = time.perf_counter()
+		for pos in path:
+			camera.pos.update(pos)
+			draw()
+		elapsed = time.perf_counter() - start
+
+		print(name)
+		report("  panning, per frame", elapsed / NUM_FRAMES, "ms")
+		report("  still, per frame", time_per_call(draw, NUM_FRAMES), "ms")
+
+	report("Ring buffer tiles drawn per frame", ring_buffer.num_tiles_drawn / NUM_FRAMES, "")
+	report("Frames where the view crossed a tile edge", sum(
+		math.floor(pos.x / TILE_SIZE) != math.floor(prev_pos.x / TILE_SIZE) or math.floor(pos.y / TILE_SIZE) != math.floor(prev_pos.y / TILE_SIZE)
+		for prev_pos, pos in zip(path, path[1:])
+	), "")
+
+	# Changing a tile in view only redraws around it
+	camera.pos.update(path[-1])
+	tile_pos = math.floor((camera.pos.x + SCREEN_WIDTH / 2) / TILE_SIZE), math.floor((camera.pos.y + SCREEN_HEIGHT / 2) / TILE_SIZE)
+	level.remove_tile(0, tile_pos)
+	chunk_cache.invalidate(0, tile_pos)
+	ring_buffer.invalidate(tile_pos)
+
+	num_different = []
+	for pos in path[::NUM_FRAMES // 10] + [path[-1]]:
+		camera.pos.update(pos)
+
+		ring_buffer.draw(surface, camera)
+		draw_chunks(chunk_cache, expected, camera)
+		num_different.append(count_different_pixels(surface, expected))
+
+	report("Most sampled pixels different from baked chunks", max(num_different), "")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
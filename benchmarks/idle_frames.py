@@ -0,0 +1,89 @@
+"""
+CPU used by the menus and the editor while nobody touches anything, drawn every frame against only drawn when something changed.
+Frames are paced at 60 fps like the app, so the CPU usage is the share of each frame spent working rather than sleeping.
+"""
+
+import time
+
+import pygame
+import pygbase
+
+from benchmarks.common import run_in_game, report
+from data.modules.base import dirty_tracker
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.game_states.editor import Editor
+from data.modules.game_states.editor_room_selection import EditorRoomSelection
+from data.modules.game_states.main_menu import MainMenu
+from data.modules.level.room import EditorRoom
+from data.modules.objects.object_loader import ObjectLoader
+
+FPS = 60
+NUM_FRAMES = 180
+ROOM_NAME = "room1"
+NUM_ANIMATED_OBJECTS = 4
+
+
+def run_frames(state: pygbase.GameState, surface: pygame.Surface, redraw_every_frame: bool) -> float:
+	"""
+	:return: CPU time over wall time
+	"""
+
+	start_cpu = time.process_time()
+	start = time.perf_counter()
+
+	frame_end = start
+	for _ in range(NUM_FRAMES):
+		state.update(1 / FPS)
+
+		if redraw_every_frame:
+			state.dirty.mark_all()
+		state.draw(surface)
+
+		# Same as the clock of the app
+		frame_end += 1 / FPS
+		time.sleep(max(0.0, frame_end - time.perf_counter()))
+
+	return (time.process_time() - start_cpu) / (time.perf_counter() - start)
+
+
+def benchmark():
+	# Short waits, nothing will send an event
+	max_idle_wait = dirty_tracker.MAX_IDLE_WAIT
+	dirty_tracker.MAX_IDLE_WAIT = 0.001
+
+	surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+	entity_manager = EntityManager()
+	editor = Editor(EditorRoom(ROOM_NAME, entity_manager), entity_manager)
+	animated_editor = Editor(EditorRoom(ROOM_NAME, entity_manager), entity_manager)
+	for index in range(NUM_ANIMATED_OBJECTS):
+		animated_editor.room.add_object(*ObjectLoader.create_object("large_cube", (index + 1, 1)))
+
+	states = (
+		("main menu", MainMenu()),
+		("room selection", EditorRoomSelection()),
+		("editor", editor),
+		(f"editor, {NUM_ANIMATED_OBJECTS} animated objects", animated_editor)
+	)
+
+	for name, state in states:
+		print(name)
+		report("  CPU usage, drawn every frame", run_frames(state, surface, True) * 100, "")
+
+		state.dirty.num_full = state.dirty.num_partial = state.dirty.num_skipped = 0
+		report("  CPU usage, dirty tracking", run_frames(state, surface, False) * 100, "")
+		report("  frames skipped", state.dirty.num_skipped, "")
+		report("  frames drawn clipped", state.dirty.num_partial, "")
+
+		state.exit()
+
+	for editor_state in (editor, animated_editor):
+		editor_state.room.remove_objects()
+	entity_manager.clear_entities()
+
+	dirty_tracker.MAX_IDLE_WAIT = max_idle_wait
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,99 @@
+"""
+InteractionController.update with interactables spread over a dungeon, against the previous scan of every interactable.
+The player walks through the middle of them, and the nearest interactable found by both is compared.
+"""
+
+import random
+
+import pygame
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.entities.components.interaction_controller import InteractionController
+from data.modules.entities.entity import Entity
+from data.modules.entities.entity_manager import EntityManager
+
+NUM_INTERACTABLES = (10, 100, 1000, 5000)
+DUNGEON_SIZE = 200  # Tiles across
+NUM_FRAMES = 600
+WALK_SPEED = 0.05  # Tiles per frame
+
+
+class LegacyInteractionController(InteractionController):
+	def update(self, entity_manager: EntityManager):
+		# Previous InteractionController.update, the distance to every interactable
+		interactable_entities = entity_manager.get_entities_of_tag("interactable")
+		if len(interactable_entities) > 0:
+			closest_entity = interactable_entities[0]
+			closest_distance = closest_entity.pos.distance_to(self.parent.pos)
+
+			for interactable_entity in interactable_entities:
+				distance = interactable_entity.pos.distance_to(self.parent.pos)
+
+				if distance < closest_distance:
+					closest_entity = interactable_entity
+					closest_distance = distance
+
+			if closest_distance < self.interaction_distance:
+				self.set_interactable(closest_entity, entity_manager)
+			else:
+				self.set_interactable(None, entity_manager)
+		else:
+			self.set_interactable(None, entity_manager)
+
+
+def get_walk() -> list[pygame.Vector2]:
+	# A path through the middle of the dungeon, turning now and then
+	pos = pygame.Vector2(DUNGEON_SIZE / 2, DUNGEON_SIZE / 2) * TILE_SIZE
+	direction = pygame.Vector2(WALK_SPEED * TILE_SIZE, 0)
+
+	path = []
+	for frame in range(NUM_FRAMES):
+		if frame % 60 == 0:
+			direction.rotate_ip(random.uniform(-90, 90))
+
+		pos += direction
+		path.append(pos.copy())
+
+	return path
+
+
+def benchmark():
+	for num_interactables in NUM_INTERACTABLES:
+		random.seed(0)
+
+		entity_manager = EntityManager()
+		for _ in range(num_interactables):
+			entity_manager.add_entity(Entity(pygame.Vector2(random.uniform(0, DUNGEON_SIZE), random.uniform(0, DUNGEON_SIZE)) * TILE_SIZE), tags=("interactable",))
+
+		# Make the walk pass by a few of them
+		path = get_walk()
+		for pos in path[::100]:
+			entity_manager.add_entity(Entity(pos + (3, 3)), tags=("interactable",))
+
+		entity_manager.apply_changes()
+
+		player = Entity(path[0])
+		print(f"{num_interactables} interactables")
+
+		found = {}
+		for controller_class in (LegacyInteractionController, InteractionController):
+			controller = controller_class(40, player)
+			found[controller_class] = nearest = []
+
+			def walk():
+				nearest.clear()
+				for pos in path:
+					player.pos.update(pos)
+					controller.update(entity_manager)
+					nearest.append(controller.get_interactable())
+
+			report(f"  {controller_class.__name__} update, per frame", time_per_call(walk, 5) / NUM_FRAMES, "us")
+
+		num_mismatches = sum(legacy is not new for legacy, new in zip(found[LegacyInteractionController], found[InteractionController]))
+		num_in_range = sum(entity is not None for entity in found[InteractionController])
+		print(f"  {num_mismatches} / {NUM_FRAMES} frames with a different nearest interactable, {num_in_range} frames with one in range")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
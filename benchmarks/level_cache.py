@@ -0,0 +1,37 @@
+"""
+Generating a seeded level against loading it from the level cache
+"""
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator
+from data.modules.level.level_cache import LevelCache
+
+SEED = 1234
+DEPTHS = (5, 10, 20)
+
+
+def benchmark():
+	for depth in DEPTHS:
+		def generate():
+			level = LevelGenerator(depth, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+			level.cleanup()
+
+		def load_cached():
+			level = LevelGenerator(depth, EntityManager(), 21, 1, seed=SEED).generate_level()
+			level.cleanup()
+
+		# Fill the cache
+		level_generator = LevelGenerator(depth, EntityManager(), 21, 1, seed=SEED)
+		level_generator.generate_level().cleanup()
+
+		cache_key = level_generator.get_cache_key()
+		level_data = LevelCache.load(cache_key)
+
+		report(f"Generate level (depth {depth})", time_per_call(generate, 3), "ms")
+		report(f"Load cached level (depth {depth})", time_per_call(load_cached, 3), "ms")
+		report(f"Cached level size (depth {depth})", len(level_data), "KiB")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,145 @@
+"""
+Movement.move_in_direction against the previous move then check solver.
+Times ordinary walking, then counts hitboxes going into or through walls after knockbacks in slow frames.
+"""
+
+import random
+
+import pygame
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.base.utils import get_1d_tile_pos, to_scaled_sequence
+from data.modules.entities.components.box_collider import BoxCollider
+from data.modules.entities.components.movement import Movement
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator, Level
+
+SEED = 3
+NUM_MOVERS = 200
+NUM_FRAMES = 200
+HITCH_DELTAS = (1 / 60, 1 / 15, 1 / 4)
+KNOCKBACK = 2000
+
+
+class LegacyMovement(Movement):
+	def move_in_direction(self, pos: pygame.Vector2, direction: pygame.Vector2, delta: float):
+		# Previous Movement.move_in_direction, moves a whole axis then checks the span at the leading edge
+		normalized_direction = direction.copy()
+		if normalized_direction.length() != 0:
+			normalized_direction.normalize_ip()
+
+		acceleration = normalized_direction * self.speed
+
+		is_collision = [False, False]
+		collision_grid = self.level.collision_grid
+
+		pos.x += self.velocity.x * delta + 0.5 * acceleration.x * delta ** 2
+		hitbox = self.hitbox.rect
+		if self.velocity.x != 0:
+			top_row = get_1d_tile_pos(hitbox.top, TILE_SIZE)
+			bottom_row = get_1d_tile_pos(hitbox.bottom, TILE_SIZE)
+
+			if 0 < self.velocity.x:
+				if collision_grid.col_span_is_solid(get_1d_tile_pos(hitbox.right, TILE_SIZE), top_row, bottom_row):
+					pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE - hitbox.width / 2 - 1
+					is_collision[0] = True
+			elif collision_grid.col_span_is_solid(get_1d_tile_pos(hitbox.left, TILE_SIZE), top_row, bottom_row):
+				pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE + hitbox.width / 2 + 1
+				is_collision[0] = True
+
+		if is_collision[0]:
+			self.velocity.x = 0
+
+		pos.y += self.velocity.y * delta + 0.5 * acceleration.y * delta ** 2
+		hitbox = self.hitbox.rect
+		if self.velocity.y != 0:
+			left_col = get_1d_tile_pos(hitbox.left, TILE_SIZE)
+			right_col = get_1d_tile_pos(hitbox.right, TILE_SIZE)
+
+			if 0 < self.velocity.y:
+				if collision_grid.row_span_is_solid(get_1d_tile_pos(hitbox.bottom, TILE_SIZE), left_col, right_col):
+					pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE - 1
+					is_collision[1] = True
+			elif collision_grid.row_span_is_solid(get_1d_tile_pos(hitbox.top, TILE_SIZE), left_col, right_col):
+				pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE + hitbox.height + 1
+				is_collision[1] = True
+
+		if is_collision[1]:
+			self.velocity.y = 0
+
+		self.velocity += (acceleration - self.velocity * self.drag) * delta
+
+		return is_collision
+
+
+def get_free_positions(level: Level, hitbox_size: tuple[float, float]) -> list[pygame.Vector2]:
+	# Floor tiles a hitbox fits on without touching a wall
+	positions = []
+	for tile_pos, _ in level.tiles.iter_tiles(0):
+		pos = pygame.Vector2((tile_pos[0] + 0.5) * TILE_SIZE, (tile_pos[1] + 0.9) * TILE_SIZE)
+		if not level.collision_grid.rect_is_solid(BoxCollider(hitbox_size, pos).rect):
+			positions.append(pos)
+
+	return positions
+
+
+def went_through_wall(level: Level, hitbox_size: tuple[float, float], start: pygame.Vector2, end: pygame.Vector2) -> bool:
+	# Checks the hitbox every few pixels of the straight path.
+	# Movement steps one axis at a time, so a diagonal move can also count here by passing beside a wall corner.
+	num_samples = int(start.distance_to(end) // 4) + 1
+	for sample in range(num_samples + 1):
+		if level.collision_grid.rect_is_solid(BoxCollider(hitbox_size, start.lerp(end, sample / num_samples)).rect):
+			return True
+
+	return False
+
+
+def create_movers(movement_class: type, level: Level, positions: list[pygame.Vector2], hitbox_size: tuple[float, float]) -> list:
+	movers = []
+	for pos in positions:
+		pos = pygame.Vector2(pos)
+		movers.append((pos, movement_class(800, 10, level, BoxCollider(hitbox_size).link_pos(pos))))
+
+	return movers
+
+
+def benchmark():
+	level = LevelGenerator(10, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+
+	for name, hitbox_size in (("player hitbox", to_scaled_sequence((11.2, 8))), ("hitbox wider than a tile", (TILE_SIZE * 1.6, TILE_SIZE * 0.5))):
+		random.seed(0)
+		positions = random.sample(get_free_positions(level, hitbox_size), NUM_MOVERS)
+		directions = [pygame.Vector2(1, 0).rotate(random.uniform(0, 360)) for _ in range(NUM_MOVERS)]
+
+		print(name)
+
+		for movement_class in (LegacyMovement, Movement):
+			movers = create_movers(movement_class, level, positions, hitbox_size)
+
+			def walk():
+				for (pos, movement), direction in zip(movers, directions):
+					movement.move_in_direction(pos, direction, 1 / 60)
+
+			report(f"  {movement_class.__name__} walking, per move", time_per_call(walk, NUM_FRAMES) / NUM_MOVERS, "us")
+
+		for delta in HITCH_DELTAS:
+			for movement_class in (LegacyMovement, Movement):
+				movers = create_movers(movement_class, level, positions, hitbox_size)
+
+				num_through_walls = 0
+				for (pos, movement), direction in zip(movers, directions):
+					start = pos.copy()
+
+					movement.add_force(direction, KNOCKBACK)
+					movement.move_in_direction(pos, pygame.Vector2(), delta)
+
+					num_through_walls += went_through_wall(level, hitbox_size, start, pos)
+
+				print(f"  {movement_class.__name__} knockback at delta {delta:.3f}: {num_through_walls} / {NUM_MOVERS} into or through walls")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
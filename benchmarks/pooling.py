@@ -0,0 +1,91 @@
+"""
+Allocations during combat with the attack and spawn pools, against making every attack and spawn new (pools of size 0).
+Sword swings, fireballs with their explosions and enemy spawns are made at a steady rate, like a fight with a few waves.
+"""
+
+import gc
+import random
+import time
+
+import pygame
+
+from benchmarks.common import run_in_game, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.base.pool import POOL_MAX_SIZE
+from data.modules.base.utils import to_scaled
+from data.modules.entities.attacks.explosion import Explosion
+from data.modules.entities.attacks.fireball import Fireball
+from data.modules.entities.attacks.sword_swing import SwordSwing
+from data.modules.entities.entity import Entity
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.entity_spawn import EntitySpawn
+from data.modules.level.level import LevelGenerator, Level
+
+SEED = 3
+SECONDS = 10
+TICK_RATE = 60
+NUM_SWORDS = 20  # Swinging twice a second
+FIREBALLS_PER_SECOND = 3
+SPAWNS_PER_WAVE = 8
+SECONDS_PER_WAVE = 2
+
+POOLS = {"SwordSwing": SwordSwing.pool, "Fireball": Fireball.pool, "Explosion": Explosion.pool, "EntitySpawn": EntitySpawn.pool}
+
+
+def fight(level: Level, pos: pygame.Vector2):
+	entity_manager = EntityManager()
+	sword_positions = [pos + pygame.Vector2(random.uniform(-3, 3), random.uniform(-3, 3)) * TILE_SIZE for _ in range(NUM_SWORDS)]
+
+	for tick in range(SECONDS * TICK_RATE):
+		if tick % (TICK_RATE // 2) == 0:
+			for sword_pos in sword_positions:
+				entity_manager.add_entity(SwordSwing.pool.get(sword_pos, random.uniform(0, 360), to_scaled(23), 5, random.choice((-1, 1))), tags=("from_enemy",))
+
+		if tick % (TICK_RATE // FIREBALLS_PER_SECOND) == 0:
+			entity_manager.add_entity(Fireball.pool.get(pos, random.uniform(0, 360), to_scaled(128), 400, 30, 70, 10, level, entity_manager), tags=("from_player",))
+
+		if tick % (TICK_RATE * SECONDS_PER_WAVE) == 0:
+			for _ in range(SPAWNS_PER_WAVE):
+				entity_manager.add_entity(EntitySpawn.pool.get(pos, entity_manager, 0.7, Entity(pos)))
+
+		entity_manager.update(1 / TICK_RATE)
+
+	entity_manager.clear_entities()
+
+
+def benchmark():
+	level = LevelGenerator(10, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+
+	# Middle of the first room, fireballs fly until their range runs out or they hit a wall
+	pos = pygame.Vector2(10.5 * TILE_SIZE, 10.5 * TILE_SIZE)
+
+	for name, max_size in (("new every time", 0), ("pooled", POOL_MAX_SIZE)):
+		random.seed(0)
+
+		for pool in POOLS.values():
+			pool.clear()
+			pool.max_size = max_size
+			pool.num_created = 0
+			pool.num_reused = 0
+
+		gc.collect()
+		collections = gc.get_stats()[0]["collections"]
+		start = time.perf_counter()
+
+		fight(level, pos)
+
+		elapsed = time.perf_counter() - start
+		collections = gc.get_stats()[0]["collections"] - collections
+
+		print(f"{name}, {SECONDS} s of combat")
+		for pool_name, pool in POOLS.items():
+			report(f"  {pool_name} made per second", pool.num_created / SECONDS, "")
+			report(f"  {pool_name} reused per second", pool.num_reused / SECONDS, "")
+		report("  young generation collections per second", collections / SECONDS, "")
+		report("  time per tick", elapsed / (SECONDS * TICK_RATE), "us")
+
+	level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,65 @@
+"""
+A crowd of goblins drawn part by part with rotated images, against one blit each from the shared pose cache.
+Half of them run, the rest stand idle, facing either way.
+"""
+
+import random
+
+import pygame
+import pygbase
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.modules.entities.models.humanoid_model import HumanoidModel
+from data.modules.entities.models.model_loader import ModelLoader
+
+MODEL_NAME = "goblin"
+NUM_MODELS = (10, 50, 200)
+NUM_FRAMES = 300
+
+
+def benchmark():
+	random.seed(0)
+
+	camera = pygbase.Camera()
+	surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+	for num_models in NUM_MODELS:
+		models: list[HumanoidModel] = []
+		for index in range(num_models):
+			model = ModelLoader.create_model(MODEL_NAME, pygame.Vector2(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT)))
+			model.flipped = random.random() < 0.5
+			model.direction = -1 if model.flipped else 1
+			model.switch_state("run" if index % 2 == 0 else "idle")
+			models.append(model)
+
+		def draw_frame():
+			surface.fill((0, 0, 0))
+			for crowd_model in models:
+				crowd_model.update(1 / 60)
+				crowd_model.draw(surface, camera)
+
+		HumanoidModel.pose_cache.clear()
+		HumanoidModel.pose_cache.reset_stats()
+
+		print(f"{num_models} goblins")
+		for model in models:
+			model.name = None
+		report("  rotated parts, per frame", time_per_call(draw_frame, NUM_FRAMES), "ms")
+
+		for model in models:
+			model.name = MODEL_NAME
+		report("  pose cache while filling, per frame", time_per_call(draw_frame, NUM_FRAMES), "ms")
+		report("  hit rate while filling", HumanoidModel.pose_cache.get_hit_rate(), "")
+
+		HumanoidModel.pose_cache.reset_stats()
+		report("  pose cache, per frame", time_per_call(draw_frame, NUM_FRAMES), "ms")
+
+		stats = HumanoidModel.pose_cache.get_stats()
+		report("  hit rate", HumanoidModel.pose_cache.get_hit_rate(), "")
+		report("  poses cached", stats["cached"], "")
+		report("  pose surfaces", sum(pose.get_width() * pose.get_height() * pose.get_bytesize() for _, pose in HumanoidModel.pose_cache._poses.values()), "KiB")  # NoQA
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
@@ -0,0 +1,67 @@
+"""
+Per-frame draw ordering cost, the previous per-row dict rebuild against the RenderQueue
+"""
+
+import random
+
+from benchmarks.common import run_in_game, time_per_call, report
+from data.modules.base.constants import TILE_SIZE
+from data.modules.base.utils import get_1d_tile_pos
+from data.modules.entities.entity import Entity
+from data.modules.entities.render_queue import RenderQueue
+
+NUM_ENTITIES = (100, 500, 2000)
+NUM_FRAMES = 100
+VISIBLE_ROWS = range(0, 14)
+
+
+def benchmark():
+	random.seed(0)
+
+	for num_entities in NUM_ENTITIES:
+		entities = [Entity((random.uniform(0, 40 * TILE_SIZE), random.uniform(0, 40 * TILE_SIZE))) for _ in range(num_entities)]
+
+		def move():
+			for entity in entities:
+				entity.pos.x += random.uniform(-4, 4)
+				entity.pos.y += random.uniform(-4, 4)
+
+		def rebuild_rows():
+			move()
+
+			# What EntityManager.update and Level.draw used to do
+			sorted_entities = {}
+			for entity in entities:
+				sorted_entities.setdefault(get_1d_tile_pos(entity.pos.y, TILE_SIZE), []).append(entity)
+
+			for row_entities in sorted_entities.values():
+				row_entities.sort(key=lambda e: e.pos.y * 7 + e.pos.x)
+
+			for row in VISIBLE_ROWS:
+				if row in sorted_entities:
+					_ = [entity for entity in sorted_entities[row]]
+
+		render_queue = RenderQueue()
+		for entity in entities:
+			render_queue.add(entity)
+
+		def update_queue():
+			move()
+			render_queue.update()
+
+			queue_entities = render_queue.entities
+			keys = render_queue.keys
+			index = render_queue.get_row_start(VISIBLE_ROWS.start)
+			for row in VISIBLE_ROWS:
+				while index < len(queue_entities) and keys[index][0] == row:
+					index += 1
+
+		move_time = time_per_call(move, NUM_FRAMES)
+
+		print(f"{num_entities} entities")
+		report("  per-row dict rebuild", time_per_call(rebuild_rows, NUM_FRAMES) - move_time, "us")
+		report("  render queue", time_per_call(update_queue, NUM_FRAMES) - move_time, "us")
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
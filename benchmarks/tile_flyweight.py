@@ -0,0 +1,96 @@
+"""
+Memory of Tile objects before and after the flyweight TileType, on a generated dungeon and on EditorRoom loading
+"""
+
+import json
+import tracemalloc
+
+from benchmarks.common import run_in_game, report, LegacyTile
+from data.modules.base.constants import TILE_SIZE
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator, Level
+from data.modules.level.room import EditorRoom
+from data.modules.level.room_templates import RoomTemplates
+from data.modules.level.tile import Tile
+from data.modules.objects.object_loader import ObjectLoader
+
+SEED = 20
+DEPTH = 20
+
+
+class LegacyEditorRoom(EditorRoom):
+	def load(self):
+		# Previous EditorRoom.load, with a LegacyTile per cell
+		with open(self.save_path) as file:
+			room_data: dict = json.load(file)
+
+		self.n_rows = room_data["rows"]
+		self.n_cols = room_data["cols"]
+
+		for level, tiles in enumerate(room_data["tiles"]):
+			for tile in tiles:
+				row = tile["pos"][0]
+				col = tile["pos"][1]
+				self.tiles.setdefault(level, {})[(col, row)] = LegacyTile(tile["image_info"][0], tile["image_info"][1], (col * TILE_SIZE, (row + 1) * TILE_SIZE))
+
+		for game_object in room_data["objects"]:
+			game_object, tags = ObjectLoader.create_object(game_object["name"], game_object["pos"])
+			self.add_object(game_object, tags)
+
+
+def build_tiles(level: Level, tile_class: type) -> dict:
+	tiles = {}
+	for layer in level.tiles.layers:
+		for tile_pos, palette_id in level.tiles.iter_tiles(layer):
+			sprite_sheet_name, image_index = level.tiles.palette[palette_id]
+			tiles.setdefault(layer, {})[tile_pos] = tile_class(sprite_sheet_name, image_index, (tile_pos[0] * TILE_SIZE, (tile_pos[1] + 1) * TILE_SIZE))
+
+	return tiles
+
+
+def measure_memory(build):
+	tracemalloc.start()
+	result = build()
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	return result, size
+
+
+def benchmark():
+	level = LevelGenerator(DEPTH, EntityManager(), 21, 1, seed=SEED, use_cache=False).generate_level()
+	num_tiles = level.tiles.get_num_tiles()
+
+	build_tiles(level, Tile)  # Intern the tile types first, they are shared for the whole game
+
+	_, legacy_size = measure_memory(lambda: build_tiles(level, LegacyTile))
+	_, flyweight_size = measure_memory(lambda: build_tiles(level, Tile))
+
+	print(f"Dungeon (depth {DEPTH}): {len(level.rooms)} rooms, {num_tiles} tiles")
+	report("  Tile per cell (before)", legacy_size, "KiB")
+	report("  Tile per cell (flyweight)", flyweight_size, "KiB")
+	report("  Tile per cell bytes / tile (before)", legacy_size / num_tiles, "")
+	report("  Tile per cell bytes / tile (flyweight)", flyweight_size / num_tiles, "")
+	report("  Level TileStorage bytes / tile", sum(len(chunk.ids) * chunk.ids.itemsize for chunks in level.tiles.layers.values() for chunk in chunks.values()) / num_tiles, "")
+
+	level.cleanup()
+
+	entity_manager = EntityManager()
+	for room_name in RoomTemplates.get_names():
+		RoomTemplates.get(room_name)
+
+		legacy_room, legacy_size = measure_memory(lambda: LegacyEditorRoom(room_name, entity_manager))
+		legacy_room.remove_objects()
+
+		room, flyweight_size = measure_memory(lambda: EditorRoom(room_name, entity_manager))
+		room.remove_objects()
+
+		print(f"EditorRoom \"{room_name}\": {sum(len(tiles) for tiles in room.tiles.values())} tiles")
+		report("  load (before)", legacy_size, "KiB")
+		report("  load (flyweight)", flyweight_size, "KiB")
+
+	entity_manager.clear_entities()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
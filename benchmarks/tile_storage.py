@@ -0,0 +1,85 @@
+"""
+Compares the chunked TileStorage against the previous dict[layer][(col, row)] -> Tile layout
+"""
+
+import random
+import tracemalloc
+
+from benchmarks.common import run_in_game, time_per_call, report, LegacyTile
+from data.modules.base.constants import TILE_SIZE
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator, Level
+from data.modules.level.tile_storage import TileStorage
+
+DEPTHS = (5, 10, 20)
+NUM_LOOKUPS = 100_000
+
+
+def build_dict_layout(level: Level) -> dict[int, dict[tuple[int, int], LegacyTile]]:
+	tiles = {}
+	for layer in level.tiles.layers:
+		for tile_pos, palette_id in level.tiles.iter_tiles(layer):
+			sprite_sheet_name, image_index = level.tiles.palette[palette_id]
+			tiles.setdefault(layer, {})[tile_pos] = LegacyTile(sprite_sheet_name, image_index, (tile_pos[0] * TILE_SIZE, (tile_pos[1] + 1) * TILE_SIZE))
+
+	return tiles
+
+
+def build_storage(level: Level) -> TileStorage:
+	storage = TileStorage()
+	for layer in level.tiles.layers:
+		for tile_pos, palette_id in level.tiles.iter_tiles(layer):
+			storage.set(layer, tile_pos, *level.tiles.palette[palette_id])
+
+	return storage
+
+
+def measure_memory(build, level: Level):
+	tracemalloc.start()
+	result = build(level)
+	size = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+
+	return result, size
+
+
+def benchmark():
+	for depth in DEPTHS:
+		random.seed(depth)
+		level = LevelGenerator(depth, EntityManager(), 21, 1).generate_level()
+
+		dict_tiles, dict_size = measure_memory(build_dict_layout, level)
+		storage, storage_size = measure_memory(build_storage, level)
+
+		num_tiles = storage.get_num_tiles()
+		print(f"Depth {depth}: {len(level.rooms)} rooms, {num_tiles} tiles, {storage.get_num_chunks()} chunks")
+		report("  dict layout memory", dict_size, "KiB")
+		report("  chunked storage memory", storage_size, "KiB")
+		report("  dict layout bytes / tile", dict_size / num_tiles, "")
+		report("  chunked storage bytes / tile", storage_size / num_tiles, "")
+
+		# Mix of tile and empty positions, in the level bounds
+		positions = [tile_pos for tile_pos, _ in storage.iter_tiles(1)]
+		min_col, max_col = min(pos[0] for pos in positions), max(pos[0] for pos in positions)
+		min_row, max_row = min(pos[1] for pos in positions), max(pos[1] for pos in positions)
+		lookups = [
+			(random.randrange(0, 3), random.choice(positions) if random.random() < 0.5 else (random.randint(min_col, max_col), random.randint(min_row, max_row)))
+			for _ in range(NUM_LOOKUPS)
+		]
+
+		def dict_lookups():
+			for layer, pos in lookups:
+				_ = layer in dict_tiles and pos in dict_tiles[layer]
+
+		def storage_lookups():
+			for layer, pos in lookups:
+				storage.has(layer, pos)
+
+		report("  dict layout check_is_tile", time_per_call(dict_lookups, 3) / NUM_LOOKUPS, "ns")
+		report("  chunked storage check_is_tile", time_per_call(storage_lookups, 3) / NUM_LOOKUPS, "ns")
+
+		level.cleanup()
+
+
+if __name__ == '__main__':
+	run_in_game(benchmark)
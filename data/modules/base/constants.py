@@ -4,3 +4,15 @@ SCREEN_HEIGHT = 1000
 # TILE_SIZE: float = SCREEN_WIDTH / 8
 TILE_SIZE: float = SCREEN_WIDTH / 12
 PIXEL_SCALE: float = (TILE_SIZE / 16) * 1.01  # Kinda hacky to avoid weird gaps
+
+# Level generation
+LEVEL_DEPTH = 20
+ROOM_SEPARATION = 21
+WALL_GAP_RADIUS = 1
+LEVEL_SEED: int | None = None  # Set to play (and cache) the same level every run
+GENERATION_TIME_BUDGET: float = 1 / 120  # Seconds of generation per frame while loading
+AWAKE_ROOM_RADIUS = 1  # Rooms within this many rooms of the player keep their objects awake
+
+# Simulation
+SIMULATION_TICK_RATE: float = 60  # Game state updates per second, drawing interpolates between them
+MAX_SIMULATION_TICKS = 5  # Most updates run in one frame, a slow frame past this is dropped instead of caught up
@@ -0,0 +1,109 @@
+import pygame
+import pygbase
+
+# Anything that can change what a menu or the editor shows
+REDRAW_EVENTS = (
+	pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+	pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+	pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED, pygame.WINDOWRESTORED, pygame.WINDOWENTER, pygame.WINDOWLEAVE, pygame.WINDOWFOCUSGAINED
+)
+
+MAX_IDLE_WAIT = 0.5  # Seconds, in case something changes without an event
+IDLE_WAIT_STEP = 10  # Milliseconds between checks for events while waiting
+
+
+class DirtyTracker:
+	"""
+	Parts of the screen that changed since the last draw, for states that mostly sit still.
+	Frames where nothing changed are not drawn, the display keeps the last frame and the app waits for the next event instead.
+	Frames where only a few things changed are drawn clipped to them.
+	"""
+
+	def __init__(self, screen_size: tuple[int, int], max_rects: int = 16):
+		self.screen_rect = pygame.Rect((0, 0), screen_size)
+		self.max_rects = max_rects
+
+		self.rects: list[pygame.Rect] = []
+		self.full = True  # Nothing has been drawn yet
+
+		# Off when something changes between events, like an animation
+		self.wait_when_idle = True
+
+		self._camera_pos: pygame.Vector2 | None = None
+
+		self.num_full = 0
+		self.num_partial = 0
+		self.num_skipped = 0
+
+	def add_handlers(self, state_name: str):
+		for event_type in REDRAW_EVENTS:
+			pygbase.Events.add_handler(state_name, event_type, self._on_event)
+
+	def remove_handlers(self, state_name: str):
+		for event_type in REDRAW_EVENTS:
+			pygbase.Events.remove_handler(self._on_event, state_name, event_type)
+
+	def _on_event(self, event: pygame.Event):
+		self.mark_all()
+
+	def mark_all(self):
+		self.full = True
+		self.rects.clear()
+
+	def mark(self, rect: pygame.typing.RectLike):
+		if self.full:
+			return
+
+		rect = self.screen_rect.clip(rect)
+		if rect.width == 0 or rect.height == 0:
+			return
+
+		self.rects.append(rect)
+		if len(self.rects) > self.max_rects:
+			self.mark_all()
+
+	def track_held_input(self):
+		"""
+		Held keys and buttons don't send events, but can keep changing things (like moving the camera)
+		"""
+
+		if any(pygame.mouse.get_pressed()) or any(pygame.key.get_pressed()):
+			self.mark_all()
+
+	def track_camera(self, camera: pygbase.Camera):
+		if camera.pos != self._camera_pos:
+			self._camera_pos = camera.pos.copy()
+			self.mark_all()
+
+	def begin_draw(self, surface: pygame.Surface) -> bool:
+		"""
+		:return: False if nothing changed, then the surface is left as it is and end_draw must not be called
+		"""
+
+		if self.full:
+			self.num_full += 1
+			return True
+
+		if len(self.rects) > 0:
+			surface.set_clip(self.rects[0].unionall(self.rects[1:]))
+			self.num_partial += 1
+			return True
+
+		self.num_skipped += 1
+		if self.wait_when_idle:
+			self._wait_for_event()
+
+		return False
+
+	def end_draw(self, surface: pygame.Surface):
+		surface.set_clip(None)
+
+		self.full = False
+		self.rects.clear()
+
+	@staticmethod
+	def _wait_for_event():
+		# Events are left on the queue, taking and posting them back would reorder them (like a key up before its key down)
+		wait_until = pygame.time.get_ticks() + int(MAX_IDLE_WAIT * 1000)
+		while not pygame.event.peek() and pygame.time.get_ticks() < wait_until:
+			pygame.time.wait(IDLE_WAIT_STEP)
@@ -0,0 +1,50 @@
+from typing import Callable
+
+import pygame
+
+
+class DrawBatch:
+	"""
+	Blits collected in draw order and submitted together with Surface.fblits, instead of one blit call each.
+	Anything drawn straight to the surface has to flush the batch first, so it stays in order.
+	"""
+
+	def __init__(self):
+		self.blits: list[tuple[pygame.Surface, pygame.typing.Point]] = []
+		self.deferred: list[tuple[Callable[..., None], tuple]] = []  # Drawn over the blits when they are submitted, like debug overlays
+
+		# Since reset_stats, usually once a frame
+		self.num_batched = 0  # Blits submitted through the batch
+		self.num_submits = 0  # fblits calls
+		self.num_direct = 0  # Draws that could not be batched
+
+	def get_stats(self) -> dict[str, int]:
+		return {
+			"batched": self.num_batched,
+			"submits": self.num_submits,
+			"direct": self.num_direct,
+			"draw_calls": self.num_submits + self.num_direct
+		}
+
+	def reset_stats(self):
+		self.num_batched = 0
+		self.num_submits = 0
+		self.num_direct = 0
+
+	def add(self, image: pygame.Surface, dest: pygame.typing.Point):
+		self.blits.append((image, dest))
+
+	def defer(self, function: Callable[..., None], *args):
+		self.deferred.append((function, args))
+
+	def flush(self, surface: pygame.Surface):
+		if len(self.blits) > 0:
+			surface.fblits(self.blits)
+
+			self.num_batched += len(self.blits)
+			self.num_submits += 1
+			self.blits.clear()
+
+		for function, args in self.deferred:
+			function(*args)
+		self.deferred.clear()
@@ -0,0 +1,83 @@
+import time
+from typing import Callable
+
+
+class EventStats:
+	__slots__ = ("num_published", "num_calls", "total_time", "max_time")
+
+	def __init__(self):
+		self.num_published = 0
+		self.num_calls = 0  # Subscribers called, summed over every publish
+		self.total_time = 0.0  # Seconds spent in publish
+		self.max_time = 0.0
+
+	def get_time_per_event(self) -> float:
+		return self.total_time / self.num_published if self.num_published > 0 else 0.0
+
+
+class EventBus:
+	def __init__(self, track_stats: bool = False):
+		"""
+		Sends events to the callbacks subscribed to their type, so systems react when something happens instead of checking every frame.
+		Events are plain objects, the subscribers of an event are found by its exact type.
+
+		:param track_stats: Time every publish, per event type
+		"""
+
+		self.subscribers: dict[type, list[Callable]] = {}
+
+		self.track_stats = track_stats
+		self.stats: dict[type, EventStats] = {}
+
+	def subscribe[E](self, event_type: type[E], callback: Callable[[E], None]):
+		self.subscribers.setdefault(event_type, []).append(callback)
+
+	def unsubscribe[E](self, event_type: type[E], callback: Callable[[E], None]):
+		callbacks = self.subscribers.get(event_type)
+		if callbacks is None or callback not in callbacks:
+			return
+
+		# Replaced instead of changed in place, a publish looping over the old list is not affected
+		callbacks = [subscriber for subscriber in callbacks if subscriber != callback]
+		if len(callbacks) > 0:
+			self.subscribers[event_type] = callbacks
+		else:
+			del self.subscribers[event_type]
+
+	def has_subscribers(self, event_type: type) -> bool:
+		"""
+		Lets publishers skip making events nobody listens to
+		"""
+
+		return event_type in self.subscribers
+
+	def publish(self, event):
+		callbacks = self.subscribers.get(type(event))
+
+		if not self.track_stats:
+			if callbacks is not None:
+				for callback in callbacks:
+					callback(event)
+			return
+
+		start = time.perf_counter()
+		if callbacks is not None:
+			for callback in callbacks:
+				callback(event)
+		elapsed = time.perf_counter() - start
+
+		stats = self.stats.get(type(event))
+		if stats is None:
+			stats = self.stats[type(event)] = EventStats()
+
+		stats.num_published += 1
+		stats.num_calls += 0 if callbacks is None else len(callbacks)
+		stats.total_time += elapsed
+		stats.max_time = max(stats.max_time, elapsed)
+
+	def reset_stats(self):
+		self.stats.clear()
+
+	def clear(self):
+		self.subscribers.clear()
+		self.stats.clear()
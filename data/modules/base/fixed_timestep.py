@@ -0,0 +1,49 @@
+from data.modules.base.constants import SIMULATION_TICK_RATE, MAX_SIMULATION_TICKS
+
+
+class FixedTimestep:
+	def __init__(self, tick_rate: float = SIMULATION_TICK_RATE, max_ticks: int = MAX_SIMULATION_TICKS):
+		"""
+		Splits variable frame times into ticks of the same length, so the simulation does not depend on the frame rate
+
+		:param tick_rate: Ticks per second
+		:param max_ticks: Most ticks per frame, time past that is dropped so one slow frame does not snowball
+		"""
+
+		self.tick_delta = 1 / tick_rate
+		self.max_ticks = max_ticks
+
+		self.accumulator = 0.0  # Frame time not yet simulated
+
+	def set_tick_rate(self, tick_rate: float):
+		self.tick_delta = 1 / tick_rate
+		self.accumulator = min(self.accumulator, self.tick_delta)
+
+	def reset(self):
+		self.accumulator = 0.0
+
+	def advance(self, delta: float) -> int:
+		"""
+		:param delta: Frame time in seconds
+		:return: Number of ticks of tick_delta to simulate this frame
+		"""
+
+		self.accumulator += delta
+
+		# Rounding error would otherwise turn a frame of exactly one tick into zero ticks, then two the next frame
+		num_ticks = int(self.accumulator / self.tick_delta + 1e-6)
+		if num_ticks > self.max_ticks:
+			num_ticks = self.max_ticks
+			self.accumulator = num_ticks * self.tick_delta
+
+		self.accumulator -= num_ticks * self.tick_delta
+
+		return num_ticks
+
+	@property
+	def alpha(self) -> float:
+		"""
+		:return: How far between the last two ticks the frame is, 0 to 1
+		"""
+
+		return max(0.0, min(self.accumulator / self.tick_delta, 1.0))
@@ -16,3 +16,6 @@ MODEL_DIR = GAME_DATA_DIR / "models"
 ENEMY_DIR = GAME_DATA_DIR / "enemies"
 
 BATTLE_DIR = GAME_DATA_DIR / "battles"
+
+CACHE_DIR = CURRENT_DIR / "cache"
+LEVEL_CACHE_DIR = CACHE_DIR / "levels"
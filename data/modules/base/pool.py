@@ -0,0 +1,46 @@
+from typing import Callable
+
+POOL_MAX_SIZE = 256
+
+
+class Pool[T]:
+	"""
+	Released objects kept to be reused, instead of making a new object each time.
+	A reused object is given the arguments of get through its reset method, which should leave it as if it was just made with them.
+	"""
+
+	def __init__(self, create: Callable[..., T], max_size: int = POOL_MAX_SIZE):
+		"""
+		:param create: Makes a new object from the arguments of get, usually the class
+		:param max_size: Most released objects kept, any past that are left to the garbage collector
+		"""
+
+		self.create = create
+		self.max_size = max_size
+
+		self.free: list[T] = []
+
+		self.num_created = 0
+		self.num_reused = 0
+
+	def get(self, *args, **kwargs) -> T:
+		if len(self.free) > 0:
+			item = self.free.pop()
+			item.reset(*args, **kwargs)  # NoQA
+
+			self.num_reused += 1
+			return item
+
+		self.num_created += 1
+		return self.create(*args, **kwargs)
+
+	def release(self, item: T):
+		"""
+		The item must not be used after, it is handed out again by get
+		"""
+
+		if len(self.free) < self.max_size:
+			self.free.append(item)
+
+	def clear(self):
+		self.free.clear()
@@ -1,28 +1,56 @@
 import pygbase
 
+from data.modules.base.pool import Pool
 from data.modules.entities.components.circle_collider import CircleCollider
 from data.modules.entities.entity import Entity
 
 
 class Explosion(Entity, tags=("damage",)):
+	pool: "Pool[Explosion]"  # Use Explosion.pool.get instead of making new explosions
+
 	def __init__(self, pos, radius: float, damage: float):
 		super().__init__(pos)
-		self.alive = True
 
-		self.collider = CircleCollider(self.pos, radius)
-		self.damage = damage
+		self.collider = CircleCollider(self.pos, radius).link_pos(self.pos)
+		self.radius: float | None = None  # Radius the spawner and lights were made for
 
 		self.particle_manager: pygbase.ParticleManager = pygbase.Common.get_value("particle_manager")
-		self.explosion_particles = self.particle_manager.add_spawner(pygbase.CircleSpawner(self.pos, 0.05, 150, radius, True, "fire", self.particle_manager, radial_velocity_range=(20, 400)))
-
 		self.lighting_manager: pygbase.LightingManager = pygbase.Common.get_value("lighting_manager")
-		self.light = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.8, radius, radius / 8, 30, tint=(255, 0, 0)).link_pos(self.pos))
-		self.light2 = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.8, radius * 1.4, radius / 7, 30, tint=(255, 0, 0)).link_pos(self.pos))
-		self.light3 = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.2, radius * 1.7, radius / 6, 30, tint=(255, 0, 0)).link_pos(self.pos))
 
 		self.emit_timer = pygbase.Timer(0.1, False, False)
 		self.death_timer = pygbase.Timer(0.3, False, False)
 
+		self._start(radius, damage)
+
+	def reset(self, pos, radius: float, damage: float):
+		super().reset(pos)
+
+		self.emit_timer.start()
+		self.death_timer.start()
+
+		self._start(radius, damage)
+
+	def _start(self, radius: float, damage: float):
+		self.alive = True
+
+		self.collider.radius = radius
+		self.damage = damage
+
+		if radius != self.radius:
+			self.radius = radius
+
+			self.explosion_particles = pygbase.CircleSpawner(self.pos, 0.05, 150, radius, True, "fire", self.particle_manager, radial_velocity_range=(20, 400)).link_pos(self.pos)
+
+			self.light = pygbase.Light(self.pos, 0.8, radius, radius / 8, 30, tint=(255, 0, 0)).link_pos(self.pos)
+			self.light2 = pygbase.Light(self.pos, 0.8, radius * 1.4, radius / 7, 30, tint=(255, 0, 0)).link_pos(self.pos)
+			self.light3 = pygbase.Light(self.pos, 0.2, radius * 1.7, radius / 6, 30, tint=(255, 0, 0)).link_pos(self.pos)
+
+		self.particle_manager.add_spawner(self.explosion_particles)
+
+		self.lighting_manager.add_light(self.light)
+		self.lighting_manager.add_light(self.light2)
+		self.lighting_manager.add_light(self.light3)
+
 	def is_alive(self):
 		return self.alive
 
@@ -33,6 +61,8 @@ class Explosion(Entity, tags=("damage",)):
 		self.lighting_manager.remove_light(self.light2)
 		self.lighting_manager.remove_light(self.light3)
 
+		Explosion.pool.release(self)
+
 	def update(self, delta: float):
 		self.emit_timer.tick(delta)
 		self.death_timer.tick(delta)
@@ -46,3 +76,6 @@ class Explosion(Entity, tags=("damage",)):
 			self.lighting_manager.remove_light(self.light)
 			self.lighting_manager.remove_light(self.light2)
 			self.lighting_manager.remove_light(self.light3)
+
+
+Explosion.pool = Pool(Explosion)
@@ -1,6 +1,7 @@
 import pygame
 import pygbase
 
+from data.modules.base.pool import Pool
 from data.modules.entities.attacks.explosion import Explosion
 from data.modules.entities.entity import Entity
 from data.modules.entities.entity_manager import EntityManager
@@ -8,12 +9,29 @@ from data.modules.level.level import Level
 
 
 class Fireball(Entity):
+	pool: "Pool[Fireball]"  # Use Fireball.pool.get instead of making new fireballs
+
 	def __init__(self, pos, direction: float, speed: float, projectile_range: float, radius: float, explosion_radius: float, damage: float, level: Level, entity_manager: EntityManager):
 		super().__init__(pos)
+
+		self.movement = pygame.Vector2()
+		self.radius: float | None = None  # Radius the lights were made for
+
+		self.particle_manager = pygbase.Common.get_value("particle_manager")
+		self.lighting_manager = pygbase.Common.get_value("lighting_manager")
+
+		self._start(direction, speed, projectile_range, radius, explosion_radius, damage, level, entity_manager)
+
+	def reset(self, pos, direction: float, speed: float, projectile_range: float, radius: float, explosion_radius: float, damage: float, level: Level, entity_manager: EntityManager):
+		super().reset(pos)
+
+		self._start(direction, speed, projectile_range, radius, explosion_radius, damage, level, entity_manager)
+
+	def _start(self, direction: float, speed: float, projectile_range: float, radius: float, explosion_radius: float, damage: float, level: Level, entity_manager: EntityManager):
 		self.alive = True
 
-		self.movement = pygame.Vector2(speed, 0).rotate(-direction)
-		self.radius = radius
+		self.movement.update(speed, 0)
+		self.movement.rotate_ip(-direction)
 
 		self.distance = 0
 		self.projectile_range = projectile_range
@@ -23,13 +41,20 @@ class Fireball(Entity):
 
 		self.level = level
 		self.entity_manager = entity_manager
-		self.particle_manager = pygbase.Common.get_value("particle_manager")
-		self.fire_particles = self.particle_manager.add_spawner(pygbase.CircleSpawner(self.pos, 0.05, 50, self.radius, True, "fire", self.particle_manager, linear_velocity_range=((0, self.movement.x / 4), (0, self.movement.y / 4))).link_pos(self.pos))
 
-		self.lighting_manager = pygbase.Common.get_value("lighting_manager")
-		self.light = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.8, self.radius, self.radius / 8, 2, tint=(255, 0, 0)).link_pos(self.pos))
-		self.light2 = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.8, self.radius * 2, self.radius / 7, 2, tint=(255, 0, 0)).link_pos(self.pos))
-		self.light3 = self.lighting_manager.add_light(pygbase.Light(self.pos, 0.2, self.radius * 3, self.radius / 6, 2, tint=(255, 0, 0)).link_pos(self.pos))
+		# Particles fly along the movement, so the spawner is made for each fireball
+		self.fire_particles = self.particle_manager.add_spawner(pygbase.CircleSpawner(self.pos, 0.05, 50, radius, True, "fire", self.particle_manager, linear_velocity_range=((0, self.movement.x / 4), (0, self.movement.y / 4))).link_pos(self.pos))
+
+		if radius != self.radius:
+			self.radius = radius
+
+			self.light = pygbase.Light(self.pos, 0.8, self.radius, self.radius / 8, 2, tint=(255, 0, 0)).link_pos(self.pos)
+			self.light2 = pygbase.Light(self.pos, 0.8, self.radius * 2, self.radius / 7, 2, tint=(255, 0, 0)).link_pos(self.pos)
+			self.light3 = pygbase.Light(self.pos, 0.2, self.radius * 3, self.radius / 6, 2, tint=(255, 0, 0)).link_pos(self.pos)
+
+		self.lighting_manager.add_light(self.light)
+		self.lighting_manager.add_light(self.light2)
+		self.lighting_manager.add_light(self.light3)
 
 	def is_alive(self):
 		return self.alive
@@ -40,13 +65,19 @@ class Fireball(Entity):
 		self.lighting_manager.remove_light(self.light2)
 		self.lighting_manager.remove_light(self.light3)
 
+		# Not kept alive by the pool
+		self.level = None
+		self.entity_manager = None
+
+		Fireball.pool.release(self)
+
 	def update(self, delta: float):
 		next_move = self.movement * delta
 
 		self.pos += next_move
 		self.distance += next_move.length()
 
-		if self.alive and (self.distance > self.projectile_range or self.level.get_tile(self.pos) is not None):
+		if self.alive and (self.distance > self.projectile_range or self.level.collision_grid.is_solid(self.pos)):
 			self.alive = False
 
 			self.particle_manager.remove_spawner(self.fire_particles)
@@ -54,4 +85,7 @@ class Fireball(Entity):
 			self.lighting_manager.remove_light(self.light2)
 			self.lighting_manager.remove_light(self.light3)
 
-			self.entity_manager.add_entity(Explosion(self.pos, self.explosion_radius, self.damage), tags=self.entity_tags)
+			self.entity_manager.add_entity(Explosion.pool.get(self.pos, self.explosion_radius, self.damage), tags=self.entity_tags)
+
+
+Fireball.pool = Pool(Fireball)
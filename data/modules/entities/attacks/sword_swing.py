@@ -1,13 +1,30 @@
 import pygame
 import pygbase
 
+from data.modules.base.pool import Pool
 from data.modules.entities.components.line_collider import LineCollider
 from data.modules.entities.entity import Entity
 
 
 class SwordSwing(Entity, tags=("damage",)):
+	pool: "Pool[SwordSwing]"  # Use SwordSwing.pool.get instead of making new swings
+
 	def __init__(self, pos: pygame.Vector2, angle: float, length: float, damage: int, flip: int):
 		super().__init__(pos)
+
+		self.max_angle = 90
+		self.swing_speed = 600
+
+		self.collider = LineCollider(pos, angle, length, start_offset=50)
+
+		self._start(pos, angle, length, damage, flip)
+
+	def reset(self, pos: pygame.Vector2, angle: float, length: float, damage: int, flip: int):
+		super().reset(pos)
+
+		self._start(pos, angle, length, damage, flip)
+
+	def _start(self, pos: pygame.Vector2, angle: float, length: float, damage: int, flip: int):
 		self.parent_pos = pos
 
 		self.alive = True
@@ -15,14 +32,21 @@ class SwordSwing(Entity, tags=("damage",)):
 		self.damage = damage
 
 		self.starting_angle = angle - 20 * flip
-		self.max_angle = 90
-		self.swing_speed = 600
 
-		self.collider = LineCollider(self.pos, self.starting_angle, length, start_offset=50).link_pos(pos)
+		self.collider.link_pos(pos)
+		self.collider.length = length
+		self.collider.set_angle(self.starting_angle)
 
 		self.flip = flip
+
+		# Made for each swing, so nothing of the last swing's animation is kept
 		self.animation = pygbase.Animation("sprite_sheets", "sword_swing_1", 0, 9, False)
 
+	def removed(self):
+		self.parent_pos = None  # Not kept alive by the pool
+
+		SwordSwing.pool.release(self)
+
 	def is_alive(self):
 		return self.alive
 
@@ -44,3 +68,6 @@ class SwordSwing(Entity, tags=("damage",)):
 			angle += 90 + 180
 
 		self.animation.draw_at_pos(surface, self.parent_pos + pygame.Vector2(0, -70) * self.flip, camera, angle, (-0, 70 * self.flip), flip=(False, self.flip == -1), draw_pos="midbottom")
+
+
+SwordSwing.pool = Pool(SwordSwing)
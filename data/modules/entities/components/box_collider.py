@@ -1,26 +1,88 @@
+import math
 from typing import TYPE_CHECKING
 
 import pygame
 
 if TYPE_CHECKING:
+	from data.modules.entities.components.circle_collider import CircleCollider
 	from data.modules.entities.components.line_collider import LineCollider
 
 
 class BoxCollider:
+	__slots__ = ("pos", "_hitbox", "version", "_cached_x", "_cached_y", "_bounds", "_edges")
+
 	def __init__(self, hitbox_size: tuple[float, float], pos: tuple = (0, 0)):
 		# Midbottom
 		self.pos = pygame.Vector2(pos)
 		self._hitbox = pygame.FRect(self.pos, hitbox_size)
 
+		# Geometry below is only recomputed when pos has moved since, version changes each time it is
+		self.version = 0
+		self._cached_x: float | None = None
+		self._cached_y: float | None = None
+
+		self._bounds: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+		self._edges: tuple[tuple[float, float, float, float], ...] = ()
+
 	def link_pos(self, pos: pygame.Vector2) -> "BoxCollider":
 		self.pos = pos
+		self._cached_x = None
 		return self
 
+	def _update_geometry(self):
+		x = self.pos.x
+		y = self.pos.y
+		if x == self._cached_x and y == self._cached_y:
+			return
+
+		self._cached_x = x
+		self._cached_y = y
+		self.version += 1
+
+		# Set absolutely, setting midbottom moves the rect relative to where it was, so it flickers by a rounding error
+		hitbox = self._hitbox
+		hitbox.x = x - hitbox.width / 2
+		hitbox.y = y - hitbox.height
+
+		left = hitbox.x
+		top = hitbox.y
+		width = hitbox.width
+		height = hitbox.height
+
+		# Not always the same as right and bottom, bottomright is rounded to single precision
+		right, bottom = hitbox.bottomright
+
+		self._bounds = left, top, hitbox.right, hitbox.bottom
+
+		# Start and end of each line of get_edge_lines
+		self._edges = (
+			(left, top, left + width, top),
+			(left, top, left, top + height),
+			(right, bottom, right, bottom - height),
+			(right, bottom, right - width, bottom)
+		)
+
 	@property
-	def rect(self):
-		self._hitbox.midbottom = self.pos
+	def rect(self) -> pygame.FRect:
+		self._update_geometry()
 		return self._hitbox
 
+	def get_bounds(self) -> tuple[float, float, float, float]:
+		"""
+		:return: Left, top, right, bottom
+		"""
+
+		self._update_geometry()
+		return self._bounds
+
+	def get_edges(self) -> tuple[tuple[float, float, float, float], ...]:
+		"""
+		:return: Start x, start y, end x, end y of the same lines as get_edge_lines
+		"""
+
+		self._update_geometry()
+		return self._edges
+
 	def get_edge_lines(self) -> tuple["LineCollider", "LineCollider", "LineCollider", "LineCollider"]:
 		from data.modules.entities.components.line_collider import LineCollider
 		return (
@@ -31,17 +93,20 @@ class BoxCollider:
 		)
 
 	def collides_with(self, collider) -> bool:
-		from data.modules.entities.components.line_collider import LineCollider
-		from data.modules.entities.components.circle_collider import CircleCollider
-
-		if isinstance(collider, BoxCollider):
-			return self.rect.colliderect(collider.rect)
-		elif isinstance(collider, LineCollider):
-			return collider.collides_with(self)
-		elif isinstance(collider, CircleCollider):
-			closest_point = pygame.Vector2(
-				max(self.rect.left, min(collider.pos.x, self.rect.right)),
-				max(self.rect.top, min(collider.pos.y, self.rect.bottom))
-			)
-
-			return closest_point.distance_to(collider.pos) < collider.radius
+		return collider.collides_with_box(self)
+
+	def collides_with_box(self, box: "BoxCollider") -> bool:
+		return self.rect.colliderect(box.rect)
+
+	def collides_with_circle(self, circle: "CircleCollider") -> bool:
+		left, top, right, bottom = self.get_bounds()
+		circle_x = circle.pos.x
+		circle_y = circle.pos.y
+
+		dx = max(left, min(circle_x, right)) - circle_x
+		dy = max(top, min(circle_y, bottom)) - circle_y
+
+		return math.sqrt(dx * dx + dy * dy) < circle.radius
+
+	def collides_with_line(self, line: "LineCollider") -> bool:
+		return line.collides_with_box(self)
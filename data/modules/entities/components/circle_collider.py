@@ -1,7 +1,16 @@
+import math
+from typing import TYPE_CHECKING
+
 import pygame
 
+if TYPE_CHECKING:
+	from data.modules.entities.components.box_collider import BoxCollider
+	from data.modules.entities.components.line_collider import LineCollider
+
 
 class CircleCollider:
+	__slots__ = ("pos", "radius")
+
 	def __init__(self, pos, radius: float):
 		self.pos = pygame.Vector2(pos)
 
@@ -11,35 +20,24 @@ class CircleCollider:
 		self.pos = pos
 		return self
 
-	def collides_with(self, collider) -> bool:
-		from data.modules.entities.components.box_collider import BoxCollider
-		from data.modules.entities.components.line_collider import LineCollider
+	def get_bounds(self) -> tuple[float, float, float, float]:
+		"""
+		:return: Left, top, right, bottom
+		"""
 
-		if isinstance(collider, BoxCollider):
-			closest_point = pygame.Vector2(
-				max(collider.rect.left, min(self.pos.x, collider.rect.right)),
-				max(collider.rect.top, min(self.pos.y, collider.rect.bottom))
-			)
+		return self.pos.x - self.radius, self.pos.y - self.radius, self.pos.x + self.radius, self.pos.y + self.radius
 
-			return closest_point.distance_to(self.pos) < self.radius
-
-		elif isinstance(collider, LineCollider):
-			if collider.start_pos.distance_to(self.pos) < self.radius:
-				return True
-			if collider.end_pos.distance_to(self.pos) < self.radius:
-				return True
-
-			dot = ((self.pos.x - collider.start_pos.x) * (collider.end_pos.x - collider.start_pos.x) + (self.pos.y - collider.start_pos.y) * (collider.end_pos.y - collider.start_pos.y)) / collider.length ** 2
+	def collides_with(self, collider) -> bool:
+		return collider.collides_with_circle(self)
 
-			closest_point = pygame.Vector2(
-				collider.start_pos.x + dot * (collider.end_pos.x - collider.start_pos.x),
-				collider.start_pos.y + dot * (collider.end_pos.y - collider.start_pos.y)
-			)
+	def collides_with_box(self, box: "BoxCollider") -> bool:
+		return box.collides_with_circle(self)
 
-			if not collider.point_within_line_segment(closest_point):
-				return False
+	def collides_with_circle(self, circle: "CircleCollider") -> bool:
+		dx = circle.pos.x - self.pos.x
+		dy = circle.pos.y - self.pos.y
 
-			return closest_point.distance_to(self.pos) < self.radius
+		return math.sqrt(dx * dx + dy * dy) < circle.radius + self.radius
 
-		elif isinstance(collider, CircleCollider):
-			return collider.pos.distance_to(self.pos) < collider.radius + self.radius
+	def collides_with_line(self, line: "LineCollider") -> bool:
+		return line.collides_with_circle(self)
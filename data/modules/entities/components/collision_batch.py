@@ -0,0 +1,222 @@
+import numpy as np
+
+from data.modules.entities.components.box_collider import BoxCollider
+from data.modules.entities.components.circle_collider import CircleCollider
+from data.modules.entities.components.line_collider import LineCollider
+
+type Collider = BoxCollider | CircleCollider | LineCollider
+
+# Below this many pairs of the same kind, calling collides_with per pair is faster (see benchmarks/collision_batch.py)
+BATCH_MIN_PAIRS = 32
+
+
+class CollisionBatch:
+	"""
+	Collider pairs checked all at once, grouped by the kind of colliders, each group with one NumPy kernel.
+	Gives the same result as collider.collides_with(other) for every pair.
+	"""
+
+	def __init__(self, min_batch_pairs: int = BATCH_MIN_PAIRS):
+		"""
+		:param min_batch_pairs: Groups smaller than this are checked pair by pair
+		"""
+
+		self.min_batch_pairs = min_batch_pairs
+		self.pairs: list[tuple[Collider, Collider]] = []
+
+	def __len__(self):
+		return len(self.pairs)
+
+	def add(self, collider: Collider, other: Collider) -> int:
+		"""
+		:return: Index of the pair in the result of resolve
+		"""
+
+		self.pairs.append((collider, other))
+		return len(self.pairs) - 1
+
+	def clear(self):
+		self.pairs.clear()
+
+	def resolve(self) -> list[bool]:
+		"""
+		:return: collider.collides_with(other) of every pair, in the order they were added
+		"""
+
+		hits = [False] * len(self.pairs)
+
+		# {kernel: ([pair index, ...], [collider, ...], [other, ...])}, the colliders ordered as the kernel takes them
+		groups: dict = {}
+		for index, (collider, other) in enumerate(self.pairs):
+			kernel, swap = _KERNELS.get((type(collider), type(other)), (None, False))
+			if kernel is None:
+				hits[index] = bool(collider.collides_with(other))
+				continue
+
+			group = groups.get(kernel)
+			if group is None:
+				group = groups[kernel] = ([], [], [])
+
+			group[0].append(index)
+			if swap:
+				group[1].append(other)
+				group[2].append(collider)
+			else:
+				group[1].append(collider)
+				group[2].append(other)
+
+		for kernel, (indices, colliders, others) in groups.items():
+			if len(indices) < self.min_batch_pairs:
+				for index in indices:
+					collider, other = self.pairs[index]
+					hits[index] = bool(collider.collides_with(other))
+				continue
+
+			for index, hit in zip(indices, kernel(colliders, others).tolist()):
+				hits[index] = hit
+
+		return hits
+
+
+def _pack_boxes(colliders: list[BoxCollider]) -> np.ndarray:
+	# FRect.right and bottom are not always the same as bottomright, which is rounded to single precision
+	rects = [collider.rect for collider in colliders]
+	return np.array([(rect.x, rect.y, rect.w, rect.h, rect.right, rect.bottom, *rect.bottomright) for rect in rects], dtype=np.float64).T
+
+
+def _pack_circles(colliders: list[CircleCollider]) -> np.ndarray:
+	return np.array([(collider.pos.x, collider.pos.y, collider.radius) for collider in colliders], dtype=np.float64).T
+
+
+def _pack_lines(colliders: list[LineCollider]) -> np.ndarray:
+	return np.array([
+		(collider.start_pos.x, collider.start_pos.y, collider.line.x, collider.line.y, collider.length, collider.offset)
+		for collider in colliders
+	], dtype=np.float64).T
+
+
+def _distance(x_1, y_1, x_2, y_2):
+	# Same operations as Vector2.distance_to
+	dx = x_1 - x_2
+	dy = y_1 - y_2
+	return np.sqrt(dx * dx + dy * dy)
+
+
+def _rect_collide_point(boxes, x, y):
+	# FRect.collidepoint, in single precision like FRect
+	rect_x, rect_y, width, height = (value.astype(np.float32) for value in boxes[:4])
+	x = x.astype(np.float32)
+	y = y.astype(np.float32)
+	return (rect_x <= x) & (x < rect_x + width) & (rect_y <= y) & (y < rect_y + height)
+
+
+def _line_collide(start_x, start_y, end_x, end_y, other_start_x, other_start_y, other_end_x, other_end_y):
+	# LineCollider.line_collide, with the offset already applied to start
+	dir_1 = (other_end_x - other_start_x) * (start_y - other_start_y) - (other_end_y - other_start_y) * (start_x - other_start_x)
+	dir_2 = (other_end_x - other_start_x) * (end_y - other_start_y) - (other_end_y - other_start_y) * (end_x - other_start_x)
+	dir_3 = (end_x - start_x) * (other_start_y - start_y) - (end_y - start_y) * (other_start_x - start_x)
+	dir_4 = (end_x - start_x) * (other_end_y - start_y) - (end_y - start_y) * (other_end_x - start_x)
+
+	return (((dir_1 > 0) & (0 > dir_2)) | ((dir_1 < 0) & (0 < dir_2))) & (((dir_3 > 0) & (0 > dir_4)) | ((dir_3 < 0) & (0 < dir_4)))
+
+
+def _get_line_ends(lines):
+	start_x, start_y, line_x, line_y, _, offset = lines
+
+	# start_pos + line.normalize() * offset, and end_pos
+	line_length = np.sqrt(line_x * line_x + line_y * line_y)
+	offset_start_x = start_x + line_x / line_length * offset
+	offset_start_y = start_y + line_y / line_length * offset
+
+	return offset_start_x, offset_start_y, start_x + line_x, start_y + line_y
+
+
+def _boxes_collide_circles(colliders: list[BoxCollider], others: list[CircleCollider]) -> np.ndarray:
+	left, top, _, _, right, bottom, _, _ = _pack_boxes(colliders)
+	circle_x, circle_y, radius = _pack_circles(others)
+
+	closest_x = np.maximum(left, np.minimum(circle_x, right))
+	closest_y = np.maximum(top, np.minimum(circle_y, bottom))
+
+	return _distance(closest_x, closest_y, circle_x, circle_y) < radius
+
+
+def _circles_collide_circles(colliders: list[CircleCollider], others: list[CircleCollider]) -> np.ndarray:
+	x, y, radius = _pack_circles(colliders)
+	other_x, other_y, other_radius = _pack_circles(others)
+
+	return _distance(other_x, other_y, x, y) < other_radius + radius
+
+
+def _lines_collide_boxes(colliders: list[LineCollider], others: list[BoxCollider]) -> np.ndarray:
+	lines = _pack_lines(colliders)
+	boxes = _pack_boxes(others)
+
+	start_x, start_y = lines[0], lines[1]
+	offset_start_x, offset_start_y, end_x, end_y = _get_line_ends(lines)
+
+	hits = _rect_collide_point(boxes, start_x, start_y) | _rect_collide_point(boxes, end_x, end_y)
+
+	# The lines of BoxCollider.get_edge_lines
+	left, top, width, height, _, _, right, bottom = boxes
+	for edge_start_x, edge_start_y, edge_x, edge_y in (
+		(left, top, width, 0.0),
+		(left, top, -0.0, height),
+		(right, bottom, 0.0, -height),
+		(right, bottom, -width, -0.0)
+	):
+		hits |= _line_collide(
+			offset_start_x, offset_start_y, end_x, end_y,
+			edge_start_x, edge_start_y, edge_start_x + edge_x, edge_start_y + edge_y
+		)
+
+	return hits
+
+
+def _lines_collide_circles(colliders: list[LineCollider], others: list[CircleCollider]) -> np.ndarray:
+	start_x, start_y, line_x, line_y, length, _ = _pack_lines(colliders)
+	circle_x, circle_y, radius = _pack_circles(others)
+
+	end_x = start_x + line_x
+	end_y = start_y + line_y
+
+	dot = ((circle_x - start_x) * (end_x - start_x) + (circle_y - start_y) * (end_y - start_y)) / length ** 2
+
+	closest_x = start_x + dot * (end_x - start_x)
+	closest_y = start_y + dot * (end_y - start_y)
+
+	# LineCollider.point_within_line_segment
+	distance_sum = _distance(start_x, start_y, closest_x, closest_y) + _distance(end_x, end_y, closest_x, closest_y)
+	within_segment = (length - 0.05 < distance_sum) & (distance_sum < length + 0.05)
+
+	return (
+		(_distance(start_x, start_y, circle_x, circle_y) < radius)
+		| (_distance(end_x, end_y, circle_x, circle_y) < radius)
+		| (within_segment & (_distance(closest_x, closest_y, circle_x, circle_y) < radius))
+	)
+
+
+def _lines_collide_lines(colliders: list[LineCollider], others: list[LineCollider]) -> np.ndarray:
+	offset_start_x, offset_start_y, end_x, end_y = _get_line_ends(_pack_lines(colliders))
+
+	other_start_x, other_start_y, other_line_x, other_line_y, _, _ = _pack_lines(others)
+
+	return _line_collide(
+		offset_start_x, offset_start_y, end_x, end_y,
+		other_start_x, other_start_y, other_start_x + other_line_x, other_start_y + other_line_y
+	)
+
+
+# {(collider type, other type): (kernel, whether the pair is passed to the kernel swapped)}
+# Box and circle checks are symmetric, and a box or circle against a line is always the line checking itself.
+# Two boxes are left to FRect.colliderect, which is a single call already.
+_KERNELS = {
+	(BoxCollider, CircleCollider): (_boxes_collide_circles, False),
+	(CircleCollider, BoxCollider): (_boxes_collide_circles, True),
+	(CircleCollider, CircleCollider): (_circles_collide_circles, False),
+	(LineCollider, BoxCollider): (_lines_collide_boxes, False),
+	(BoxCollider, LineCollider): (_lines_collide_boxes, True),
+	(LineCollider, CircleCollider): (_lines_collide_circles, False),
+	(CircleCollider, LineCollider): (_lines_collide_circles, True),
+	(LineCollider, LineCollider): (_lines_collide_lines, False),
+}
@@ -1,9 +1,11 @@
 import pygame
 import pygbase
-from data.modules.base.utils import to_scaled
+from data.modules.base.constants import TILE_SIZE
+from data.modules.base.utils import to_scaled, get_tile_pos
 
 from data.modules.entities.entity import Entity
 from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.events import InteractableInRange
 
 
 class InteractionController:
@@ -13,33 +15,58 @@ class InteractionController:
 
 		self.interactable_entity: Entity | None = None
 
+		# Interactables that can be in range from anywhere in the tile of the parent, kept while it stays in the tile
+		self._candidates: list[Entity] = []
+		self._candidates_tile: tuple[int, int] | None = None
+		self._candidates_version = -1
+
 	def has_interactable(self) -> bool:
 		return self.interactable_entity is not None
 
 	def get_interactable(self) -> Entity | None:
 		return self.interactable_entity
 
-	def update(self, entity_manager: EntityManager):
-		interactable_entities = entity_manager.get_entities_of_tag("interactable")
-		if len(interactable_entities) > 0:
-			closest_entity = interactable_entities[0]
-			closest_distance = closest_entity.pos.distance_to(self.parent.pos)
+	def set_interactable(self, interactable_entity: Entity | None, entity_manager: EntityManager):
+		if interactable_entity is self.interactable_entity:
+			return
+
+		self.interactable_entity = interactable_entity
+		entity_manager.events.publish(InteractableInRange(self.parent, interactable_entity))
+
+	def _get_candidates(self, entity_manager: EntityManager) -> list[Entity]:
+		tile_pos = get_tile_pos(self.parent.pos, (TILE_SIZE, TILE_SIZE))
+		if tile_pos != self._candidates_tile or entity_manager.interactables_version != self._candidates_version:
+			self._candidates_tile = tile_pos
+			self._candidates_version = entity_manager.interactables_version
+
+			# The tile grown by the interaction distance on every side
+			self._candidates = entity_manager.query_interactables(pygame.FRect(
+				tile_pos[0] * TILE_SIZE - self.interaction_distance,
+				tile_pos[1] * TILE_SIZE - self.interaction_distance,
+				TILE_SIZE + self.interaction_distance * 2,
+				TILE_SIZE + self.interaction_distance * 2
+			))
+
+		return self._candidates
+
+	def update(self, entity_manager: EntityManager, interact: bool):
+		"""
+		:param interact: Interact with the closest interactable, if there is one in range
+		"""
 
-			for interactable_entity in interactable_entities:
-				distance = interactable_entity.pos.distance_to(self.parent.pos)
+		closest_entity = None
+		closest_distance = self.interaction_distance
+		for interactable_entity in self._get_candidates(entity_manager):
+			distance = interactable_entity.pos.distance_to(self.parent.pos)
 
-				if distance < closest_distance:
-					closest_entity = interactable_entity
-					closest_distance = distance
+			if distance < closest_distance:
+				closest_entity = interactable_entity
+				closest_distance = distance
 
-			if closest_distance < self.interaction_distance:
-				self.interactable_entity = closest_entity
-			else:
-				self.interactable_entity = None
+		self.set_interactable(closest_entity, entity_manager)
 
-		if self.has_interactable():
-			if pygbase.Input.pressed("interact"):
-				self.get_interactable().interact(self.parent)
+		if interact and self.has_interactable():
+			self.get_interactable().interact(self.parent)
 
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		# TODO: Draw indicator when an entity is interactable
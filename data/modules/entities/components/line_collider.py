@@ -1,16 +1,54 @@
 import math
+from typing import TYPE_CHECKING
 
 import pygame
 import pygbase
 
+if TYPE_CHECKING:
+	from data.modules.entities.components.box_collider import BoxCollider
+	from data.modules.entities.components.circle_collider import CircleCollider
+
+
+def segments_cross(
+		start_x: float, start_y: float, end_x: float, end_y: float,
+		other_start_x: float, other_start_y: float, other_end_x: float, other_end_y: float
+) -> bool:
+	"""
+	:return: If the segments cross, touching does not count
+	"""
+
+	# Cross Product Method (ChatGPT, make more clear in future)
+	dir_1 = (other_end_x - other_start_x) * (start_y - other_start_y) - (other_end_y - other_start_y) * (start_x - other_start_x)
+	dir_2 = (other_end_x - other_start_x) * (end_y - other_start_y) - (other_end_y - other_start_y) * (end_x - other_start_x)
+	dir_3 = (end_x - start_x) * (other_start_y - start_y) - (end_y - start_y) * (other_start_x - start_x)
+	dir_4 = (end_x - start_x) * (other_end_y - start_y) - (end_y - start_y) * (other_end_x - start_x)
+
+	return (dir_1 > 0 > dir_2 or dir_1 < 0 < dir_2) and (dir_3 > 0 > dir_4 or dir_3 < 0 < dir_4)
+
+
 class LineCollider:
+	__slots__ = ("start_pos", "angle", "length", "offset", "line", "version", "_offset_x", "_offset_y")
+
 	def __init__(self, start_pos: pygame.Vector2 | tuple[float, float], angle: float, length: float, start_offset: float = 0):
 		self.start_pos: pygame.Vector2 = pygame.Vector2(start_pos)
 		self.angle: float = angle
 		self.length: float = length
 		self.offset = start_offset
 
+		self.version = 0  # Changes whenever the line changes
+		self._set_line()
+
+	def _set_line(self):
 		self.line = pygame.Vector2(0, -self.length).rotate(-self.angle)
+		self.version += 1
+
+		# line.normalize() * offset, from start_pos to where the line starts colliding
+		line_length = math.sqrt(self.line.x * self.line.x + self.line.y * self.line.y)
+		if line_length != 0:
+			self._offset_x = self.line.x / line_length * self.offset
+			self._offset_y = self.line.y / line_length * self.offset
+		else:
+			self._offset_x = self._offset_y = 0.0
 
 	def link_pos(self, pos: pygame.Vector2) -> "LineCollider":
 		self.start_pos = pos
@@ -18,16 +56,35 @@ class LineCollider:
 
 	def set_angle(self, new_angle: float):
 		self.angle = new_angle
-		self.line = pygame.Vector2(0, -self.length).rotate(-self.angle)
+		self._set_line()
 
 	def change_angle(self, amount: float):
 		self.angle -= amount
-		self.line = pygame.Vector2(0, -self.length).rotate(-self.angle)
+		self._set_line()
 
 	@property
 	def end_pos(self):
 		return self.start_pos + self.line
 
+	def get_bounds(self) -> tuple[float, float, float, float]:
+		"""
+		:return: Left, top, right, bottom
+		"""
+
+		start_x = self.start_pos.x
+		start_y = self.start_pos.y
+		end_x = start_x + self.line.x
+		end_y = start_y + self.line.y
+
+		# The offset start is past the end when the offset is longer than the line
+		offset_x = start_x + self._offset_x
+		offset_y = start_y + self._offset_y
+
+		return (
+			min(start_x, end_x, offset_x), min(start_y, end_y, offset_y),
+			max(start_x, end_x, offset_x), max(start_y, end_y, offset_y)
+		)
+
 	def get_range(self) -> tuple[tuple[float, float], tuple[float, float]]:
 		quadrant = math.floor((self.angle % 360) / 90) + 1
 
@@ -86,59 +143,88 @@ class LineCollider:
 		Detects if a point **already on** the line is within the line segment
 		"""
 
-		dist_1 = self.start_pos.distance_to(point)
-		dist_2 = self.end_pos.distance_to(point)
+		return self._point_within_line_segment(point.x, point.y)
 
-		return self.length - 0.05 < dist_1 + dist_2 < self.length + 0.05
+	def _point_within_line_segment(self, x: float, y: float) -> bool:
+		start_x = self.start_pos.x
+		start_y = self.start_pos.y
 
-	def line_collide(self, line) -> bool:
-		my_start = self.start_pos + self.line.normalize() * self.offset
-		my_end = self.end_pos
+		dx_1 = start_x - x
+		dy_1 = start_y - y
+		dx_2 = start_x + self.line.x - x
+		dy_2 = start_y + self.line.y - y
+		distance_sum = math.sqrt(dx_1 * dx_1 + dy_1 * dy_1) + math.sqrt(dx_2 * dx_2 + dy_2 * dy_2)
 
-		other_start = line.start_pos
-		other_end = line.end_pos
+		return self.length - 0.05 < distance_sum < self.length + 0.05
 
-		# Cross Product Method (ChatGPT, make more clear in future)
-		dir_1 = (other_end.x - other_start.x) * (my_start.y - other_start.y) - (other_end.y - other_start.y) * (my_start.x - other_start.x)
-		dir_2 = (other_end.x - other_start.x) * (my_end.y - other_start.y) - (other_end.y - other_start.y) * (my_end.x - other_start.x)
-		dir_3 = (my_end.x - my_start.x) * (other_start.y - my_start.y) - (my_end.y - my_start.y) * (other_start.x - my_start.x)
-		dir_4 = (my_end.x - my_start.x) * (other_end.y - my_start.y) - (my_end.y - my_start.y) * (other_end.x - my_start.x)
+	def line_collide(self, line: "LineCollider") -> bool:
+		start_x = self.start_pos.x
+		start_y = self.start_pos.y
 
-		return (dir_1 > 0 > dir_2 or dir_1 < 0 < dir_2) and (dir_3 > 0 > dir_4 or dir_3 < 0 < dir_4)
+		other_start_x = line.start_pos.x
+		other_start_y = line.start_pos.y
 
-	def collides_with(self, collider) -> bool:
-		from data.modules.entities.components.box_collider import BoxCollider
-		from data.modules.entities.components.circle_collider import CircleCollider
+		return segments_cross(
+			start_x + self._offset_x, start_y + self._offset_y, start_x + self.line.x, start_y + self.line.y,
+			other_start_x, other_start_y, other_start_x + line.line.x, other_start_y + line.line.y
+		)
 
-		if isinstance(collider, BoxCollider):
-			if collider.rect.collidepoint(*self.start_pos):
-				return True
-			if collider.rect.collidepoint(*self.end_pos):
+	def collides_with(self, collider) -> bool:
+		return collider.collides_with_line(self)
+
+	def collides_with_box(self, box: "BoxCollider") -> bool:
+		start_x = self.start_pos.x
+		start_y = self.start_pos.y
+		end_x = start_x + self.line.x
+		end_y = start_y + self.line.y
+
+		rect = box.rect
+		if rect.collidepoint(start_x, start_y):
+			return True
+		if rect.collidepoint(end_x, end_y):
+			return True
+
+		offset_start_x = start_x + self._offset_x
+		offset_start_y = start_y + self._offset_y
+		for edge_start_x, edge_start_y, edge_end_x, edge_end_y in box.get_edges():
+			if segments_cross(offset_start_x, offset_start_y, end_x, end_y, edge_start_x, edge_start_y, edge_end_x, edge_end_y):
 				return True
+		return False
 
-			for line in collider.get_edge_lines():
-				if self.line_collide(line):
-					return True
-			return False
-		elif isinstance(collider, LineCollider):
-			return self.line_collide(collider)
-		elif isinstance(collider, CircleCollider):
-			if self.start_pos.distance_to(collider.pos) < collider.radius:
-				return True
-			if self.end_pos.distance_to(collider.pos) < collider.radius:
-				return True
+	def collides_with_circle(self, circle: "CircleCollider") -> bool:
+		start_x = self.start_pos.x
+		start_y = self.start_pos.y
+		end_x = start_x + self.line.x
+		end_y = start_y + self.line.y
+
+		circle_x = circle.pos.x
+		circle_y = circle.pos.y
+		radius = circle.radius
+
+		dx = start_x - circle_x
+		dy = start_y - circle_y
+		if math.sqrt(dx * dx + dy * dy) < radius:
+			return True
 
-			dot = ((collider.pos.x - self.start_pos.x) * (self.end_pos.x - self.start_pos.x) + (collider.pos.y - self.start_pos.y) * (self.end_pos.y - self.start_pos.y)) / self.length ** 2
+		dx = end_x - circle_x
+		dy = end_y - circle_y
+		if math.sqrt(dx * dx + dy * dy) < radius:
+			return True
 
-			closest_point = pygame.Vector2(
-				self.start_pos.x + dot * (self.end_pos.x - self.start_pos.x),
-				self.start_pos.y + dot * (self.end_pos.y - self.start_pos.y)
-			)
+		dot = ((circle_x - start_x) * (end_x - start_x) + (circle_y - start_y) * (end_y - start_y)) / self.length ** 2
+
+		closest_x = start_x + dot * (end_x - start_x)
+		closest_y = start_y + dot * (end_y - start_y)
+
+		if not self._point_within_line_segment(closest_x, closest_y):
+			return False
 
-			if not self.point_within_line_segment(closest_point):
-				return False
+		dx = closest_x - circle_x
+		dy = closest_y - circle_y
+		return math.sqrt(dx * dx + dy * dy) < radius
 
-			return closest_point.distance_to(collider.pos) < collider.radius
+	def collides_with_line(self, line: "LineCollider") -> bool:
+		return line.line_collide(self)
 
 	def draw_debug(self, camera: pygbase.Camera):
 		pygbase.Debug.draw_line(camera.world_to_screen(self.start_pos + self.line.normalize() * self.offset), camera.world_to_screen(self.start_pos + self.line), "yellow", width=4)
@@ -1,3 +1,4 @@
+import math
 from typing import TYPE_CHECKING
 
 import pygame
@@ -27,57 +28,23 @@ class Movement:
 
 		acceleration = normalized_direction * self.speed
 
-		is_collision = [False, False]
+		distance_x = self.velocity.x * delta + 0.5 * acceleration.x * delta ** 2
+		distance_y = self.velocity.y * delta + 0.5 * acceleration.y * delta ** 2
 
-		pos.x += self.velocity.x * delta + 0.5 * acceleration.x * delta ** 2
-		hitbox = self.hitbox.rect
-		if 0 < self.velocity.x:
-			top_right_tile = self.level.get_tile(hitbox.topright)
-			if top_right_tile:
-				pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE - hitbox.width / 2 - 1
-				is_collision[0] = True
-
-			bottom_right_tile = self.level.get_tile(hitbox.bottomright)
-			if bottom_right_tile:
-				pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE - hitbox.width / 2 - 1
-				is_collision[0] = True
-		elif self.velocity.x < 0:
-			top_left_tile = self.level.get_tile(hitbox.topleft)
-			if top_left_tile:
-				pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE + hitbox.width / 2 + 1
-				is_collision[0] = True
-
-			bottom_left_tile = self.level.get_tile(hitbox.bottomleft)
-			if bottom_left_tile:
-				pos.x = (get_1d_tile_pos(hitbox.x, TILE_SIZE) + 1) * TILE_SIZE + hitbox.width / 2 + 1
-				is_collision[0] = True
+		# Sub-steps of at most a tile, so a long move (frame hitch, knockback) follows its path around corners
+		num_steps = max(1, math.ceil(max(abs(distance_x), abs(distance_y)) / TILE_SIZE))
+		step_x = distance_x / num_steps
+		step_y = distance_y / num_steps
+
+		is_collision = [False, False]
+		for _ in range(num_steps):
+			if not is_collision[0]:
+				is_collision[0] = self._sweep_x(pos, step_x)
+			if not is_collision[1]:
+				is_collision[1] = self._sweep_y(pos, step_y)
 
 		if is_collision[0]:
 			self.velocity.x = 0
-
-		pos.y += self.velocity.y * delta + 0.5 * acceleration.y * delta ** 2
-		hitbox = self.hitbox.rect
-		if 0 < self.velocity.y:
-			bottom_left_tile = self.level.get_tile(hitbox.bottomleft)
-			if bottom_left_tile:
-				pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE - 1
-				is_collision[1] = True
-
-			bottom_right_tile = self.level.get_tile(hitbox.bottomright)
-			if bottom_right_tile:
-				pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE - 1
-				is_collision[1] = True
-		elif self.velocity.y < 0:
-			top_left_tile = self.level.get_tile(hitbox.topleft)
-			if top_left_tile:
-				pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE + hitbox.height + 1
-				is_collision[1] = True
-
-			top_right_tile = self.level.get_tile(hitbox.topright)
-			if top_right_tile:
-				pos.y = (get_1d_tile_pos(hitbox.y, TILE_SIZE) + 1) * TILE_SIZE + hitbox.height + 1
-				is_collision[1] = True
-
 		if is_collision[1]:
 			self.velocity.y = 0
 
@@ -85,6 +52,72 @@ class Movement:
 
 		return is_collision
 
+	def _sweep_x(self, pos: pygame.Vector2, distance: float) -> bool:
+		"""
+		Moves pos along x, stopping before the first solid column the hitbox would enter
+
+		:return: True if the hitbox was stopped by a wall
+		"""
+
+		if distance == 0:
+			return False
+
+		hitbox = self.hitbox.rect
+
+		# Columns of the leading edge, from the one it is in (a wall can appear on it, or it can be placed in one) to the one it enters
+		if 0 < distance:
+			cols = range(get_1d_tile_pos(hitbox.right, TILE_SIZE), get_1d_tile_pos(hitbox.right + distance, TILE_SIZE) + 1)
+		else:
+			cols = range(get_1d_tile_pos(hitbox.left, TILE_SIZE), get_1d_tile_pos(hitbox.left + distance, TILE_SIZE) - 1, -1)
+
+		collision_grid = self.level.collision_grid
+		top_row = get_1d_tile_pos(hitbox.top, TILE_SIZE)
+		bottom_row = get_1d_tile_pos(hitbox.bottom, TILE_SIZE)
+
+		for col in cols:
+			if collision_grid.col_span_is_solid(col, top_row, bottom_row):
+				if 0 < distance:
+					pos.x = col * TILE_SIZE - hitbox.width / 2 - 1
+				else:
+					pos.x = (col + 1) * TILE_SIZE + hitbox.width / 2 + 1
+				return True
+
+		pos.x += distance
+		return False
+
+	def _sweep_y(self, pos: pygame.Vector2, distance: float) -> bool:
+		"""
+		Moves pos along y, stopping before the first solid row the hitbox would enter
+
+		:return: True if the hitbox was stopped by a wall
+		"""
+
+		if distance == 0:
+			return False
+
+		hitbox = self.hitbox.rect
+
+		# Rows of the leading edge, from the one it is in to the one it enters
+		if 0 < distance:
+			rows = range(get_1d_tile_pos(hitbox.bottom, TILE_SIZE), get_1d_tile_pos(hitbox.bottom + distance, TILE_SIZE) + 1)
+		else:
+			rows = range(get_1d_tile_pos(hitbox.top, TILE_SIZE), get_1d_tile_pos(hitbox.top + distance, TILE_SIZE) - 1, -1)
+
+		collision_grid = self.level.collision_grid
+		left_col = get_1d_tile_pos(hitbox.left, TILE_SIZE)
+		right_col = get_1d_tile_pos(hitbox.right, TILE_SIZE)
+
+		for row in rows:
+			if collision_grid.row_span_is_solid(row, left_col, right_col):
+				if 0 < distance:
+					pos.y = row * TILE_SIZE - 1
+				else:
+					pos.y = (row + 1) * TILE_SIZE + hitbox.height + 1
+				return True
+
+		pos.y += distance
+		return False
+
 	def add_force(self, direction: pygame.Vector2, force: float):
 		normalized_direction = direction.copy()
 		if normalized_direction.length() != 0:
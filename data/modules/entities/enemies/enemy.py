@@ -12,7 +12,9 @@ from data.modules.entities.entity_manager import EntityManager
 from data.modules.level.level import Level
 
 
-class Enemy(Entity, tags=("enemy",)):
+class Enemy(Entity, tags=("enemy", "damageable")):
+	immune_tag = "from_enemy"  # Enemies are not damaged by attacks of enemies
+
 	def __init__(
 			self,
 			pos: pygame.typing.Point,
@@ -36,29 +38,28 @@ class Enemy(Entity, tags=("enemy",)):
 	def damaged(self):
 		pass
 
-	def update(self, delta: float):
-		self.damage_timer.tick(delta)
+	def can_be_damaged(self) -> bool:
+		return self.damage_timer.done()
 
-		if self.damage_timer.done():
-			damage_entities = self.entity_manager.get_entities_of_tag("damage")
-			for entity in damage_entities:
-				if "from_enemy" in entity.entity_tags:
-					continue
+	def take_damage(self, entity: Entity):
+		"""
+		Called by the entity manager when a damage entity hits the enemy
+		"""
 
-				if self.collider.collides_with(entity.collider):  # NoQA
-					# print(entity)
-					self.health.damage(entity.damage)  # NoQA
+		self.health.damage(entity.damage)  # NoQA
 
-					dir_vec = entity.pos - self.pos
-					if dir_vec.length() != 0:
-						dir_vec.normalize_ip()
+		dir_vec = entity.pos - self.pos
+		if dir_vec.length() != 0:
+			dir_vec.normalize_ip()
 
-					self.movement.velocity -= dir_vec * to_scaled(320)
+		self.movement.velocity -= dir_vec * to_scaled(320)
 
-					self.damage_timer.start()
+		self.damage_timer.start()
 
-					self.damaged()
-					break
+		self.damaged()
+
+	def update(self, delta: float):
+		self.damage_timer.tick(delta)
 
 		# Flashing hit effect
 		self.visible = self.damage_timer.done() or not math.sin(pygame.time.get_ticks() / 25) > 0
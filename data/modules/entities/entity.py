@@ -1,6 +1,11 @@
+from typing import TYPE_CHECKING
+
 import pygame
 import pygbase
 
+if TYPE_CHECKING:
+	from data.modules.base.draw_batch import DrawBatch
+
 
 class Entity:
 	tags: tuple[str, ...] = ()
@@ -17,6 +22,20 @@ class Entity:
 		self.pos = pygame.Vector2(pos)
 		self.active = True
 		self.visible = True
+		self.asleep = False  # Set by the entity manager while its zone sleeps
+
+		self.entity_tags = self.tags
+
+	def reset(self, pos: pygame.typing.Point):
+		"""
+		Puts a pooled entity back in the state __init__ leaves it in.
+		pos is updated in place, so anything linked to it stays linked.
+		"""
+
+		self.pos.update(pos)
+		self.active = True
+		self.visible = True
+		self.asleep = False
 
 		self.entity_tags = self.tags
 
@@ -26,6 +45,20 @@ class Entity:
 	def removed(self):
 		pass
 
+	def sleep(self):
+		"""
+		Called when the zone of the entity is put to sleep
+		"""
+
+		pass
+
+	def wake(self):
+		"""
+		Called when the zone of the entity wakes up again
+		"""
+
+		pass
+
 	def interact(self, other: "Entity"):
 		pass
 
@@ -41,5 +74,14 @@ class Entity:
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		pass
 
+	def draw_batched(self, batch: "DrawBatch", camera: pygbase.Camera) -> bool:
+		"""
+		Adds the blits of the entity to the batch instead of drawing it, for entities drawn with plain blits
+
+		:return: False if it has to be drawn with draw instead
+		"""
+
+		return False
+
 	def is_alive(self):
 		return True
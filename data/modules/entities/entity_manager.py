@@ -1,80 +1,415 @@
+from collections import deque
+from typing import Hashable
+
+import pygame
+
 from data.modules.base.constants import TILE_SIZE
-from data.modules.base.utils import get_1d_tile_pos
+from data.modules.base.event_bus import EventBus
+from data.modules.entities.components.collision_batch import CollisionBatch
 from data.modules.entities.entity import Entity
+from data.modules.entities.events import EntityDied, EntityHit
+from data.modules.entities.indexed_list import IndexedList
+from data.modules.entities.render_queue import RenderQueue
+from data.modules.entities.spatial_hash import SpatialHash
 
 
 class EntityManager:
-	def __init__(self):
-		self.entities: list[Entity] = []
-		self.sorted_entities: dict[int, list[Entity]] = {}
-		self.tagged_entities: dict[str, list[Entity]] = {}
+	def __init__(self, sleep_tick_interval: float | None = None):
+		"""
+		:param sleep_tick_interval: Seconds between coarse updates of sleeping zones, or None to never update them
+		"""
 
-		self.entities_to_remove = set()
+		self.entities: IndexedList[Entity] = IndexedList()
+		self.awake_entities: list[Entity] = []  # Updated and drawn every frame, in the order they were added
+		self.render_queue = RenderQueue()  # Entities in draw order
+		self.tagged_entities: dict[str, IndexedList[Entity]] = {}
+		self.spatial_hash: SpatialHash[Entity] = SpatialHash(TILE_SIZE)  # Collider bounds of awake entities
+		self.interactable_hash: SpatialHash[Entity] = SpatialHash(TILE_SIZE)  # Positions of interactable entities, which do not move
+		self.interactables_version = 0  # Changes when an interactable is added or removed
+		self.collision_batch = CollisionBatch()
+		self.events = EventBus()  # Entity lifecycle events, see entities/events.py
+
+		# Positions of awake entities at the start of the last update, drawing interpolates from them
+		self.prev_positions: dict[Entity, tuple[float, float]] = {}
+		self._drawn_positions: list[tuple[pygame.Vector2, float, float]] = []  # (pos, x, y) to restore after drawing
+
+		# Adds and removes are buffered and applied together at sync points in update, never while entities are iterated
+		self.entities_to_add: list[tuple[Entity, Hashable | None]] = []
+		self.entities_to_remove: set[Entity] = set()
+
+		# Zones group entities owned by a room, so far away rooms can sleep
+		self.zone_entities: dict[Hashable, IndexedList[Entity]] = {}
+		self.entity_zones: dict[Entity, Hashable] = {}
+		self.awake_zones: set[Hashable] | None = None  # None when every zone is awake
+
+		self.sleep_tick_interval = sleep_tick_interval
+		self._time = 0.0
+		self._zone_tick_times: dict[Hashable, float] = {}  # {sleeping zone: time of last update}
+		self._zone_tick_queue: deque[Hashable] = deque()  # Sleeping zones, one is checked per frame
 
 	def clear_entities(self):
-		for entity in self.entities:
-			self.entities_to_remove.add(entity)
+		self.entities_to_add.clear()
+		self.entities_to_remove.update(self.entities)
+
+		self.apply_changes()
+		self.prev_positions.clear()
+
+		self.awake_zones = None
+		self._zone_tick_times.clear()
+		self._zone_tick_queue.clear()
 
-		self._remove_entities()
+	def is_zone_awake(self, zone: Hashable | None) -> bool:
+		return zone is None or self.awake_zones is None or zone in self.awake_zones
 
-	def add_entity(self, entity: "Entity", tags: tuple[str, ...] | None = None):
-		self.entities.append(entity)
-		entity.added()
+	def add_entity(self, entity: "Entity", tags: tuple[str, ...] | None = None, zone: Hashable | None = None):
+		"""
+		The entity is added at the next sync point of update
 
+		:param zone: Zone the entity belongs to, None for entities that are always awake
+		"""
+
+		# Tags are set straight away, things the entity creates before it is added may copy them
 		if tags is not None:
 			entity.entity_tags += tags
 
-		for tag in entity.entity_tags:
-			self.tagged_entities.setdefault(tag, []).append(entity)
+		# Removed then added again before the sync point, it just stays
+		self.entities_to_remove.discard(entity)
+		self.entities_to_add.append((entity, zone))
 
 	def add_entity_to_remove(self, entity):
+		"""
+		The entity is removed at the next sync point of update
+		"""
+
 		self.entities_to_remove.add(entity)
 
 	def get_entities_of_tag(self, tag: str) -> list[Entity]:
 		if tag in self.tagged_entities:
-			return self.tagged_entities[tag]
+			return self.tagged_entities[tag].items
 
 		return []
 
+	def _add_to_spatial_hash(self, entity: Entity):
+		collider = getattr(entity, "collider", None)
+		if collider is not None:
+			self.spatial_hash.update(entity, collider.get_bounds())
+
+	@staticmethod
+	def _filter_tag(entities: list[Entity], tag: str | None) -> list[Entity]:
+		if tag is None:
+			return entities
+
+		return [entity for entity in entities if tag in entity.entity_tags]
+
+	def query_rect(self, rect: pygame.Rect | pygame.FRect, tag: str | None = None) -> list[Entity]:
+		"""
+		Broadphase, the colliders of the entities returned still need to be checked
+
+		:param tag: Only return entities with this tag
+		:return: Awake entities with collider bounds overlapping the rect
+		"""
+
+		return self._filter_tag(self.spatial_hash.query_rect(rect), tag)
+
+	def query_radius(self, pos: pygame.typing.Point, radius: float, tag: str | None = None) -> list[Entity]:
+		"""
+		Broadphase, the colliders of the entities returned still need to be checked
+
+		:param tag: Only return entities with this tag
+		:return: Awake entities with collider bounds within radius of pos
+		"""
+
+		return self._filter_tag(self.spatial_hash.query_radius(pos, radius), tag)
+
+	def query_segment(self, start: pygame.typing.Point, end: pygame.typing.Point, tag: str | None = None) -> list[Entity]:
+		"""
+		Broadphase, the colliders of the entities returned still need to be checked
+
+		:param tag: Only return entities with this tag
+		:return: Awake entities with collider bounds touched by the segment
+		"""
+
+		return self._filter_tag(self.spatial_hash.query_segment(start, end), tag)
+
+	def query_interactables(self, rect: pygame.Rect | pygame.FRect) -> list[Entity]:
+		"""
+		Includes interactables of sleeping zones
+
+		:return: Interactable entities with their pos in the rect
+		"""
+
+		return self.interactable_hash.query_rect(rect)
+
 	def get_entities(self, y_pos: int) -> list[Entity]:
-		if y_pos in self.sorted_entities:
-			return [entity for entity in self.sorted_entities[y_pos]]
+		"""
+		:param y_pos: Tile row
+		:return: Entities in the row, in draw order
+		"""
 
-		return []
+		return self.render_queue.get_row(y_pos)
+
+	def set_awake_zones(self, awake_zones: set[Hashable] | None):
+		"""
+		Puts every zone not in awake_zones to sleep, and wakes the rest.
+		Sleeping entities are not updated or drawn.
+
+		:param awake_zones: Zones to keep awake, or None to wake all zones
+		"""
+
+		prev_awake_zones = self.awake_zones
+		self.awake_zones = None if awake_zones is None else set(awake_zones)
+
+		to_sleep = set()
+		for zone, entities in self.zone_entities.items():
+			was_awake = prev_awake_zones is None or zone in prev_awake_zones
+			is_awake = self.is_zone_awake(zone)
+
+			if was_awake and not is_awake:
+				to_sleep.update(entities)
+
+				self._zone_tick_times[zone] = self._time
+				self._zone_tick_queue.append(zone)
+
+				for entity in entities:
+					entity.asleep = True
+					entity.sleep()
+
+					self.spatial_hash.remove(entity)
+
+			elif not was_awake and is_awake:
+				if self._zone_tick_times.pop(zone, None) is not None:
+					self._zone_tick_queue.remove(zone)
+
+				for entity in entities:
+					entity.asleep = False
+					entity.wake()
+
+					self.awake_entities.append(entity)
+					self.render_queue.add(entity)
+					self._add_to_spatial_hash(entity)
+
+		if len(to_sleep) > 0:
+			self.awake_entities = [entity for entity in self.awake_entities if entity not in to_sleep]
+			self.render_queue.remove(to_sleep)
+
+	def get_interpolated_pos(self, entity: Entity, alpha: float) -> pygame.Vector2:
+		"""
+		:param alpha: Fraction of the way from the previous update to the last one
+		:return: Where the entity is drawn
+		"""
+
+		prev_pos = self.prev_positions.get(entity)
+		if prev_pos is None:
+			return entity.pos.copy()
+
+		return pygame.Vector2(prev_pos).lerp(entity.pos, alpha)
+
+	def interpolate_positions(self, alpha: float):
+		"""
+		Moves awake entities between their previous and current positions for drawing.
+		Positions are moved in place so everything linked to them follows, restore_positions must be called after drawing.
+
+		:param alpha: Fraction of the way from the previous update to the last one
+		"""
+
+		drawn_positions = self._drawn_positions
+		moved = set()  # Ids of positions already moved, in case entities share one
+		for entity, (prev_x, prev_y) in self.prev_positions.items():
+			pos = entity.pos
+			if entity.asleep or id(pos) in moved:
+				continue
+
+			x = pos.x
+			y = pos.y
+			if x == prev_x and y == prev_y:
+				continue
+
+			moved.add(id(pos))
+			drawn_positions.append((pos, x, y))
+
+			pos.x = prev_x + (x - prev_x) * alpha
+			pos.y = prev_y + (y - prev_y) * alpha
+
+	def restore_positions(self):
+		for pos, x, y in reversed(self._drawn_positions):
+			pos.x = x
+			pos.y = y
+
+		self._drawn_positions.clear()
+
+	def _add_entities(self):
+		entities_to_add = self.entities_to_add
+		self.entities_to_add = []
+
+		for entity, zone in entities_to_add:
+			if entity in self.entities:
+				continue
+
+			self.entities.append(entity)
+			entity.added()
+
+			if zone is not None:
+				self.zone_entities.setdefault(zone, IndexedList()).append(entity)
+				self.entity_zones[entity] = zone
+
+			if self.is_zone_awake(zone):
+				self.awake_entities.append(entity)
+				self.render_queue.add(entity)
+				self._add_to_spatial_hash(entity)
+			else:
+				entity.asleep = True
+				entity.sleep()
+
+				# First entity of a zone made while asleep, it still needs its coarse ticks
+				if zone is not None and zone not in self._zone_tick_times:
+					self._zone_tick_times[zone] = self._time
+					self._zone_tick_queue.append(zone)
+
+			for tag in dict.fromkeys(entity.entity_tags):
+				self.tagged_entities.setdefault(tag, IndexedList()).append(entity)
+
+			if "interactable" in entity.entity_tags:
+				self.interactable_hash.update(entity, (entity.pos.x, entity.pos.y, entity.pos.x, entity.pos.y))
+				self.interactables_version += 1
 
 	def _remove_entities(self):
-		self.sorted_entities.clear()
+		entities_to_remove = {entity for entity in self.entities_to_remove if entity in self.entities}
+		self.entities_to_remove = set()
 
-		entities_to_remove = self.entities_to_remove.copy()
-		self.entities_to_remove.clear()
+		if len(entities_to_remove) == 0:
+			return
+
+		self.render_queue.remove(entities_to_remove)
+
+		# One pass for every removed entity, so the update order of the rest is kept
+		self.awake_entities = [entity for entity in self.awake_entities if entity not in entities_to_remove]
 
 		for entity in entities_to_remove:
 			self.entities.remove(entity)
+			self.spatial_hash.remove(entity)
+			self.prev_positions.pop(entity, None)  # It may be pooled and reused somewhere else
+
+			if entity in self.interactable_hash:
+				self.interactable_hash.remove(entity)
+				self.interactables_version += 1
+
+			zone = self.entity_zones.pop(entity, None)
+			if zone is not None:
+				zone_entities = self.zone_entities[zone]
+				zone_entities.remove(entity)
+
+				if len(zone_entities) == 0:
+					del self.zone_entities[zone]
+
+					if zone in self._zone_tick_times:
+						del self._zone_tick_times[zone]
+						self._zone_tick_queue.remove(zone)
+
 			entity.removed()
 
-			for tag in entity.tags:
-				self.tagged_entities[tag].remove(entity)
+			for tag in dict.fromkeys(entity.entity_tags):
+				tagged_entities = self.tagged_entities[tag]
+				tagged_entities.remove(entity)
 
-				if len(self.tagged_entities[tag]) == 0:
+				if len(tagged_entities) == 0:
 					del self.tagged_entities[tag]
 
+	def apply_changes(self):
+		"""
+		Sync point, adds then removes the buffered entities.
+		Repeats until nothing is left, in case added or removed hooks add or remove more.
+		"""
+
+		while len(self.entities_to_add) > 0 or len(self.entities_to_remove) > 0:
+			self._add_entities()
+			self._remove_entities()
+
+	def _resolve_damage(self):
+		"""
+		Checks every damageable entity against the damage entities near it, all in one collision batch.
+		An entity is damaged by the first damage entity hitting it.
+		"""
+
+		collision_batch = self.collision_batch
+		collision_batch.clear()
+
+		pairs = []
+		for entity in self.get_entities_of_tag("damageable"):
+			if entity.asleep or not entity.active or not entity.can_be_damaged():  # NoQA
+				continue
+
+			collider = entity.collider  # NoQA
+			for damage_entity in self.query_rect(collider.rect, "damage"):
+				if entity.immune_tag in damage_entity.entity_tags:  # NoQA
+					continue
+
+				collision_batch.add(collider, damage_entity.collider)  # NoQA
+				pairs.append((entity, damage_entity))
+
+		if len(pairs) == 0:
+			return
+
+		events = self.events
+		damaged_entities = set()
+		for (entity, damage_entity), hit in zip(pairs, collision_batch.resolve()):
+			if hit and entity not in damaged_entities:
+				damaged_entities.add(entity)
+
+				if events.has_subscribers(EntityHit):
+					events.publish(EntityHit(entity, damage_entity))
+				entity.take_damage(damage_entity)  # NoQA
+
+	def _tick_sleeping_zone(self):
+		"""
+		Coarse update for the next sleeping zone, at most one zone per frame
+		"""
+
+		if self.sleep_tick_interval is None or len(self._zone_tick_queue) == 0:
+			return
+
+		zone = self._zone_tick_queue[0]
+		elapsed = self._time - self._zone_tick_times[zone]
+		if elapsed < self.sleep_tick_interval:
+			return
+
+		self._zone_tick_queue.rotate(-1)
+		self._zone_tick_times[zone] = self._time
+
+		for entity in self.zone_entities[zone]:
+			if entity.active:
+				entity.update(elapsed)
+
 	def update(self, delta: float):
-		self._remove_entities()
+		self.apply_changes()
+		self._time += delta
+
+		events = self.events
+		prev_positions = {}
+		for entity in self.awake_entities:
+			prev_positions[entity] = entity.pos.x, entity.pos.y
 
-		for entity in self.entities:
 			if not entity.is_alive():
 				self.add_entity_to_remove(entity)
 
-		for entity in self.entities:
+				# Still updated this frame, it is removed at the sync point after
+				if events.has_subscribers(EntityDied):
+					events.publish(EntityDied(entity))
+
+		self.prev_positions = prev_positions
+
+		spatial_hash = self.spatial_hash
+		for entity in self.awake_entities:
 			if entity.active:
 				entity.update(delta)
 
-			y_pos = get_1d_tile_pos(entity.pos.y, TILE_SIZE)
+				# Moved right away, so entities updated after it query where it is now
+				if entity in spatial_hash:
+					spatial_hash.update(entity, entity.collider.get_bounds())  # NoQA
 
-			if y_pos not in self.sorted_entities:
-				self.sorted_entities[y_pos] = []
+		# Attacks made this update join before damage is checked
+		self.apply_changes()
 
-			self.sorted_entities[y_pos].append(entity)
+		self._resolve_damage()
+		self._tick_sleeping_zone()
 
-		for row, entities in self.sorted_entities.items():
-			entities.sort(key=lambda e: e.pos.y * 7 + e.pos.x)
+		self.render_queue.update()
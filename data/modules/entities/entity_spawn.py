@@ -1,24 +1,44 @@
 import pygame
 import pygbase
 
+from data.modules.base.pool import Pool
 from data.modules.base.utils import to_scaled_sequence, to_scaled
 from data.modules.entities.entity import Entity
 from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.events import EntitySpawned
 
 
 class EntitySpawn(Entity):
+	pool: "Pool[EntitySpawn]"  # Use EntitySpawn.pool.get instead of making new spawns
+
 	def __init__(self, pos: pygame.typing.Point, entity_manager: EntityManager, time_to_spawn: float, entity_to_spawn: Entity):
 		super().__init__(pos)
 
-		self.entity_manager = entity_manager
+		self.rect = pygame.Rect((0, 0), to_scaled_sequence((10, 10)))
+
+		self._start(pos, entity_manager, time_to_spawn, entity_to_spawn)
+
+	def reset(self, pos: pygame.typing.Point, entity_manager: EntityManager, time_to_spawn: float, entity_to_spawn: Entity):
+		super().reset(pos)
+
+		self._start(pos, entity_manager, time_to_spawn, entity_to_spawn)
+
+	def _start(self, pos: pygame.typing.Point, entity_manager: EntityManager, time_to_spawn: float, entity_to_spawn: Entity):
+		# Made for each spawn, so nothing of the last spawn's timer or tween is kept
 		self.spawn_timer = pygbase.Timer(time_to_spawn, False, False)
+		self.lerp = pygbase.LinearTween((to_scaled(2), 1), time_to_spawn)
 
+		self.entity_manager = entity_manager
 		self.entity_to_spawn = entity_to_spawn
 
-		self.rect = pygame.Rect((0, 0), to_scaled_sequence((10, 10)))
 		self.rect.center = pos
 
-		self.lerp = pygbase.LinearTween((to_scaled(2), 1), time_to_spawn)
+	def removed(self):
+		# Not kept alive by the pool
+		self.entity_manager = None
+		self.entity_to_spawn = None
+
+		EntitySpawn.pool.release(self)
 
 	def update(self, delta: float):
 		self.spawn_timer.tick(delta)
@@ -26,9 +46,13 @@ class EntitySpawn(Entity):
 
 		if self.spawn_timer.just_done():
 			self.entity_manager.add_entity(self.entity_to_spawn)
+			self.entity_manager.events.publish(EntitySpawned(self.entity_to_spawn, self))
 
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		pygame.draw.rect(surface, (255, 255, 255), camera.world_to_screen_rect(self.rect), width=int(self.lerp.value()))
 
 	def is_alive(self):
 		return not self.spawn_timer.done()
+
+
+EntitySpawn.pool = Pool(EntitySpawn)
@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from data.modules.entities.entity import Entity
+	from data.modules.level.room import Room
+
+
+# Published on the event bus of the entity manager
+
+
+class EntityDied:
+	"""
+	The entity is no longer alive, it is removed at the next sync point
+	"""
+
+	__slots__ = ("entity",)
+
+	def __init__(self, entity: "Entity"):
+		self.entity = entity
+
+
+class EntitySpawned:
+	"""
+	An entity spawn finished and added the entity it was spawning
+	"""
+
+	__slots__ = ("entity", "spawn")
+
+	def __init__(self, entity: "Entity", spawn: "Entity"):
+		self.entity = entity
+		self.spawn = spawn
+
+
+class EntityHit:
+	"""
+	A damage entity hit a damageable entity, published before the damage is taken
+	"""
+
+	__slots__ = ("entity", "damage_entity")
+
+	def __init__(self, entity: "Entity", damage_entity: "Entity"):
+		self.entity = entity
+		self.damage_entity = damage_entity
+
+
+class RoomEntered:
+	__slots__ = ("room",)
+
+	def __init__(self, room: "Room"):
+		self.room = room
+
+
+class InteractableInRange:
+	"""
+	The closest interactable in range of an entity changed
+	"""
+
+	__slots__ = ("entity", "interactable")
+
+	def __init__(self, entity: "Entity", interactable: "Entity | None"):
+		"""
+		:param interactable: None when nothing is in range anymore
+		"""
+
+		self.entity = entity
+		self.interactable = interactable
@@ -0,0 +1,37 @@
+from typing import Hashable, Iterator
+
+
+class IndexedList[T: Hashable]:
+	"""
+	List of unique items that removes in constant time, by moving the last item into the gap.
+	Order is not kept after removals.
+	"""
+
+	def __init__(self):
+		self.items: list[T] = []
+		self._indices: dict[T, int] = {}  # {item: its index in items}
+
+	def __len__(self):
+		return len(self.items)
+
+	def __iter__(self) -> Iterator[T]:
+		return iter(self.items)
+
+	def __contains__(self, item: T):
+		return item in self._indices
+
+	def append(self, item: T):
+		self._indices[item] = len(self.items)
+		self.items.append(item)
+
+	def remove(self, item: T):
+		index = self._indices.pop(item)
+
+		last_item = self.items.pop()
+		if index < len(self.items):
+			self.items[index] = last_item
+			self._indices[last_item] = index
+
+	def clear(self):
+		self.items.clear()
+		self._indices.clear()
@@ -41,7 +41,7 @@ class EnergySword(Item, Registrable):
 
 	def use(self):
 		if self.attack_cooldown.done():
-			self.entity_manager.add_entity(SwordSwing(self.pos, self.angle + (180 if self.flip_x else 0), self.attack_length, self.attack_damage, self.convert_flip()), tags=self.entity_tags)
+			self.entity_manager.add_entity(SwordSwing.pool.get(self.pos, self.angle + (180 if self.flip_x else 0), self.attack_length, self.attack_damage, self.convert_flip()), tags=self.entity_tags)
 			self.attack_cooldown.start()
 
 			self.swinging_down = True
@@ -10,8 +10,10 @@ from data.modules.entities.models.model_part import ImageModelPart
 class CharacterModel:
 	def __init__(self, pos: pygame.Vector2, data: dict):
 		self.pos = pos  # Reference
+		self.name: str | None = None  # Set by ModelLoader, models with the same name share cached poses
 
 		self.parts: dict[str, ImageModelPart] = {}
+		self._parent_order: list[ImageModelPart] = []  # Parents before their children
 
 		part_queue = deque(data["parts"].keys())
 		while len(part_queue) > 0:
@@ -35,6 +37,7 @@ class CharacterModel:
 				continue
 
 			self.parts[part] = part_object
+			self._parent_order.append(part_object)
 
 		# Sort body parts
 		self.parts = {key: value for key, value in sorted(self.parts.items(), key=self._part_sort_key)}
@@ -44,7 +47,7 @@ class CharacterModel:
 		return element[1].layer
 
 	def update(self, delta: float):
-		for part in self.parts.values():
+		for part in self._parent_order:
 			part.update()
 
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
@@ -4,11 +4,19 @@ from typing import Literal
 import pygame
 import pygbase
 
+from data.modules.base.constants import PIXEL_SCALE
 from data.modules.base.registry.registrable import Registrable
 from data.modules.entities.models.character_model import CharacterModel
+from data.modules.entities.models.pose_cache import PoseCache
+
+POSE_ANGLE_STEP = 2  # Degrees, same as the rotate resolution the images are drawn at
+RUN_POSE_STEPS = 64  # Poses per run cycle, about one a frame
 
 
 class HumanoidModel(CharacterModel, Registrable):
+	# Poses are the same for every humanoid with the same model, like a crowd of goblins
+	pose_cache = PoseCache()
+
 	@staticmethod
 	def get_name() -> str:
 		return "humanoid"
@@ -52,8 +60,20 @@ class HumanoidModel(CharacterModel, Registrable):
 
 		self.max_leg_angle = 40
 		self.run_anim_speed = 12
-		self.right_tween = pygbase.LinearTween((-self.max_leg_angle, 0, self.max_leg_angle, -self.max_leg_angle), 2 * (2 * math.pi) / self.run_anim_speed)
-		self.left_tween = pygbase.LinearTween((-self.max_leg_angle, 0, self.max_leg_angle, -self.max_leg_angle), 2 * (2 * math.pi) / self.run_anim_speed)
+		self.run_duration = 2 * (2 * math.pi) / self.run_anim_speed  # One step of each leg, and two body bobs
+		self.right_tween = pygbase.LinearTween((-self.max_leg_angle, 0, self.max_leg_angle, -self.max_leg_angle), self.run_duration)
+		self.left_tween = pygbase.LinearTween((-self.max_leg_angle, 0, self.max_leg_angle, -self.max_leg_angle), self.run_duration)
+
+		# Time into the run cycle, and the pose step it is drawn at
+		self.run_time = 0.0
+		self.run_step = 0
+
+		# Furthest any part is drawn from pos, the body bob stays within a model unit of its offset
+		body_distance = (self.body_part.offset.length() + 1) * PIXEL_SCALE
+		self.pose_radius = max(
+			body_distance + self.body_part.get_radius(),
+			*(body_distance + leg.offset.length() * PIXEL_SCALE + leg.get_radius() for leg in (self.left_leg, self.right_leg))
+		)
 
 	def switch_state(self, new_state: Literal["idle", "run"]):
 		if new_state != self.state:
@@ -61,8 +81,7 @@ class HumanoidModel(CharacterModel, Registrable):
 			self.state_switch_time = pygame.time.get_ticks()
 
 			if new_state == "run":
-				self.right_tween.progress = 0
-				self.left_tween.progress = 0.5
+				self.run_time = 0.0
 
 	@staticmethod
 	def _lerp(start, end, delta: float, lerp_speed: int = 8):
@@ -85,16 +104,16 @@ class HumanoidModel(CharacterModel, Registrable):
 		self.right_leg.angle = self._lerp(self.right_leg.angle, 0, delta, lerp_speed=20)
 
 	def _run_animate(self, delta: float):
-		self.right_tween.tick(delta)
-		self.left_tween.tick(delta)
+		# Legs and body bob are both set from the step of the run cycle, so running is a fixed set of poses
+		self.run_time = (self.run_time + delta) % self.run_duration
+		self.run_step = int(self.run_time / self.run_duration * RUN_POSE_STEPS) % RUN_POSE_STEPS
+		progress = self.run_step / RUN_POSE_STEPS
 
-		if self.right_tween.progress == 1:
-			self.right_tween.progress = 0
-		if self.left_tween.progress == 1:
-			self.left_tween.progress = 0
+		self.right_tween.progress = progress
+		self.left_tween.progress = (progress + 0.5) % 1
 
 		self.body_part.part_offset.y = self._lerp(self.body_part.part_offset.y, 0, delta * 8)
-		self.body_part.offset.y = self.height_offset - (math.sin((pygame.time.get_ticks() - self.state_switch_time) / 1000 * self.run_anim_speed)) * 0.8
+		self.body_part.offset.y = self.height_offset - (math.sin(progress * self.run_duration * self.run_anim_speed)) * 0.8
 
 		# TODO: Fix animation
 		#  If the player goes up, I think it should also reverse itself (down is like running "forwards")
@@ -110,3 +129,28 @@ class HumanoidModel(CharacterModel, Registrable):
 		self.body_part.flipped = self.flipped
 
 		CharacterModel.update(self, delta)
+
+	def _get_pose_key(self) -> tuple:
+		body_part = self.body_part
+		bob_y = round(body_part.part_offset.y * PIXEL_SCALE)
+
+		if self.state == "run":
+			# The step sets the legs and body offset, the idle bob only settles for a few frames after switching
+			return self.name, "run", body_part.flipped, self.direction, self.run_step, bob_y
+
+		# Quantized to a screen pixel and the rotate resolution of the images
+		return (
+			self.name, "idle", body_part.flipped,
+			round(body_part.offset.y * PIXEL_SCALE), bob_y,
+			round(self.left_leg.angle / POSE_ANGLE_STEP), round(self.right_leg.angle / POSE_ANGLE_STEP)
+		)
+
+	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
+		if self.name is None:
+			CharacterModel.draw(self, surface, camera)
+			return
+
+		offset, pose = self.pose_cache.get(self._get_pose_key(), self.pos, self.pose_radius, lambda canvas, canvas_camera: CharacterModel.draw(self, canvas, canvas_camera))
+
+		pos = camera.world_to_screen(self.pos)
+		surface.blit(pose, (pos[0] + offset[0], pos[1] + offset[1]))
@@ -1,3 +1,5 @@
+import math
+
 import pygame.typing
 
 import pygbase
@@ -39,5 +41,12 @@ class ImageModelPart(ModelPart, Registrable):
 	def update(self):
 		self.pos.update(self._parent_pos + self.offset * PIXEL_SCALE)
 
+	def get_radius(self) -> float:
+		"""
+		:return: Furthest the part can be drawn from its position, at any angle
+		"""
+
+		return math.hypot(*self._image.get_image().get_size()) / 2 + math.hypot(*self._pivot)
+
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		self._image.draw(surface, camera.world_to_screen(self._parent_pos + (self.offset + self.part_offset) * PIXEL_SCALE), self.angle, pivot_point=self._pivot, flip=(self.flipped, False), draw_pos="center")
@@ -0,0 +1,86 @@
+import math
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+import pygbase
+
+MAX_CACHED_POSES = 512
+
+
+class PoseCache:
+	"""
+	Models drawn once per pose onto a surface of their own, so drawing the same pose again is a single blit.
+	Shared by every model that can be in the same poses, the least recently used poses are dropped past max_poses.
+	"""
+
+	def __init__(self, max_poses: int = MAX_CACHED_POSES):
+		self.max_poses = max_poses
+
+		# {key: (offset from the model pos, surface)}
+		self._poses: OrderedDict[Hashable, tuple[tuple[int, int], pygame.Surface]] = OrderedDict()
+
+		# Reused to draw poses on before cropping them
+		self._canvas: pygame.Surface | None = None
+
+		self.hits = 0
+		self.misses = 0
+
+	def get_stats(self) -> dict[str, int]:
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"cached": len(self._poses)
+		}
+
+	def get_hit_rate(self) -> float:
+		lookups = self.hits + self.misses
+		return self.hits / lookups if lookups > 0 else 0.0
+
+	def reset_stats(self):
+		self.hits = 0
+		self.misses = 0
+
+	def set_max_poses(self, max_poses: int):
+		self.max_poses = max_poses
+
+		while len(self._poses) > self.max_poses:
+			self._poses.popitem(last=False)
+
+	def clear(self):
+		self._poses.clear()
+
+	def get(self, key: Hashable, pos: pygame.Vector2, radius: float, draw: Callable[[pygame.Surface, pygbase.Camera], None]) -> tuple[tuple[int, int], pygame.Surface]:
+		"""
+		:param pos: Position of the model, the pose is kept relative to it
+		:param radius: Furthest the model can be drawn from pos
+		:param draw: Draws the model in the pose, only called when the pose is not cached
+		:return: Offset of the pose from pos, pose surface
+		"""
+
+		pose = self._poses.get(key)
+		if pose is not None:
+			self.hits += 1
+			self._poses.move_to_end(key)
+			return pose
+
+		self.misses += 1
+
+		size = 2 * math.ceil(radius)
+		if self._canvas is None or self._canvas.get_width() < size:
+			self._canvas = pygame.Surface((size, size), flags=pygame.SRCALPHA)
+
+		self._canvas.fill((0, 0, 0, 0))
+
+		# Pos lands at the middle of the canvas
+		center = self._canvas.get_width() // 2
+		draw(self._canvas, pygbase.Camera(pos=pos - pygame.Vector2(center, center)))
+
+		bounds = self._canvas.get_bounding_rect()
+		pose = self._poses[key] = (bounds.x - center, bounds.y - center), self._canvas.subsurface(bounds).copy()
+
+		# Evict least recently used
+		if len(self._poses) > self.max_poses:
+			self._poses.popitem(last=False)
+
+		return pose
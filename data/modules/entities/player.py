@@ -18,7 +18,9 @@ from data.modules.entities.models.model_loader import ModelLoader
 from data.modules.level.level import Level
 
 
-class Player(Entity, tags=("player",)):
+class Player(Entity, tags=("player", "damageable")):
+	immune_tag = "from_player"  # The player is not damaged by its own attacks
+
 	def __init__(self, pos, camera: pygbase.Camera, entity_manager: EntityManager, level: Level):
 		super().__init__(pos)
 		self.entity_manager = entity_manager
@@ -34,6 +36,11 @@ class Player(Entity, tags=("player",)):
 		self.collider = BoxCollider(to_scaled_sequence((11.2, 8))).link_pos(self.pos)
 
 		self.input = pygame.Vector2()
+
+		# One shot inputs, read once a frame and used by the next tick
+		self.dash_pressed = False
+		self.fireball_pressed = False
+		self.interact_pressed = False
 		self.movement = Movement(800, 10, level, self.collider)
 
 		self.camera = camera
@@ -75,29 +82,41 @@ class Player(Entity, tags=("player",)):
 		else:
 			self.character_model.switch_state("idle")
 
-	def check_damaged(self):
-		if self.damage_timer.done():
-			damage_entities = self.entity_manager.get_entities_of_tag("damage")
-			for entity in damage_entities:
-				if "from_player" in entity.entity_tags:
-					continue
+	def read_frame_input(self):
+		"""
+		Reads presses that are only true for one frame. Called once a frame before the ticks,
+		so a press on a frame without ticks is kept for the next one and a frame with several ticks only uses it once
+		"""
+
+		if not self.active:
+			return
+
+		self.dash_pressed |= pygbase.Input.key_just_pressed(pygame.K_SPACE)
+		self.fireball_pressed |= pygbase.Input.mouse_just_pressed(2)
+		self.interact_pressed |= pygbase.Input.pressed("interact")
 
-				# TODO: Is NoQA really the answer?
-				if self.collider.collides_with(entity.collider):  # NoQA
-					# print(entity)
-					self.health.damage(entity.damage)  # NoQA
+	def can_be_damaged(self) -> bool:
+		return self.damage_timer.done()
 
-					dir_vec = entity.pos - self.pos
-					if dir_vec.length() != 0:
-						dir_vec.normalize_ip()
+	def take_damage(self, entity: Entity):
+		"""
+		Called by the entity manager when a damage entity hits the player
+		"""
 
-					self.movement.velocity -= dir_vec * 2000
+		# TODO: Is NoQA really the answer?
+		self.health.damage(entity.damage)  # NoQA
 
-					self.damage_timer.start()
+		dir_vec = entity.pos - self.pos
+		if dir_vec.length() != 0:
+			dir_vec.normalize_ip()
 
-					self.damaged()
-					break
+		self.movement.velocity -= dir_vec * 2000
 
+		self.damage_timer.start()
+
+		self.damaged()
+
+	def update_hit_effect(self):
 		self.visible = self.damage_timer.done() or not math.sin(pygame.time.get_ticks() / 25) > 0
 
 	def update(self, delta: float):
@@ -106,12 +125,15 @@ class Player(Entity, tags=("player",)):
 		self.get_inputs()
 
 		# Debug
-		if pygbase.Input.key_just_pressed(pygame.K_SPACE):
+		if self.dash_pressed:
+			self.dash_pressed = False
 			self.movement.add_force(self.input, 5000)
-		if pygbase.Input.mouse_just_pressed(2):
+		if self.fireball_pressed:
+			self.fireball_pressed = False
+
 			mouse_world_pos = self.camera.screen_to_world(pygame.mouse.get_pos())
 			angle = pygbase.utils.get_angle_to(self.pos - (0, 30), mouse_world_pos)
-			self.entity_manager.add_entity(Fireball(
+			self.entity_manager.add_entity(Fireball.pool.get(
 				self.pos - (0, 30),
 				angle,
 				to_scaled(128),
@@ -142,9 +164,10 @@ class Player(Entity, tags=("player",)):
 
 		self.item_slot.update(self.camera.screen_to_world(pygame.mouse.get_pos()))
 
-		self.interaction_controller.update(self.entity_manager)
+		self.interaction_controller.update(self.entity_manager, self.interact_pressed)
+		self.interact_pressed = False
 
-		self.check_damaged()
+		self.update_hit_effect()
 
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		self.character_model.draw(surface, camera)
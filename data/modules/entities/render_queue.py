@@ -0,0 +1,104 @@
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from data.modules.base.constants import TILE_SIZE
+
+if TYPE_CHECKING:
+	from data.modules.entities.entity import Entity
+
+
+class RenderQueue:
+	"""
+	Entities in draw order, kept sorted by (tile row, depth) between frames.
+	Entities only move a little each frame, so re-sorting is an insertion sort over an almost sorted list.
+	"""
+
+	def __init__(self):
+		self.entities: list["Entity"] = []
+		self.keys: list[tuple[int, float]] = []  # Sort key of the entity at the same index
+
+		self._added: list["Entity"] = []
+
+		self.num_moved = 0  # Entities that changed place in the last update
+
+	@staticmethod
+	def get_key(entity: "Entity") -> tuple[int, float]:
+		pos = entity.pos
+		return int(pos.y // TILE_SIZE), pos.y * 7 + pos.x
+
+	def add(self, entity: "Entity"):
+		"""
+		The entity is drawn from the next update on
+		"""
+
+		self._added.append(entity)
+
+	def remove(self, entities: set["Entity"]):
+		if len(entities) == 0:
+			return
+
+		self._added = [entity for entity in self._added if entity not in entities]
+
+		kept = [index for index, entity in enumerate(self.entities) if entity not in entities]
+		if len(kept) != len(self.entities):
+			self.entities = [self.entities[index] for index in kept]
+			self.keys = [self.keys[index] for index in kept]
+
+	def clear(self):
+		self.entities.clear()
+		self.keys.clear()
+		self._added.clear()
+
+	def update(self):
+		entities = self.entities
+
+		get_key = self.get_key
+		keys = self.keys = [get_key(entity) for entity in entities]
+
+		# Insertion sort, close to linear when little has moved
+		num_moved = 0
+		for index in range(1, len(entities)):
+			key = keys[index]
+			if keys[index - 1] <= key:
+				continue
+
+			entity = entities[index]
+			num_moved += 1
+
+			other_index = index - 1
+			while other_index >= 0 and keys[other_index] > key:
+				keys[other_index + 1] = keys[other_index]
+				entities[other_index + 1] = entities[other_index]
+				other_index -= 1
+
+			keys[other_index + 1] = key
+			entities[other_index + 1] = entity
+
+		self.num_moved = num_moved
+
+		if len(self._added) > 0:
+			self._merge_added()
+
+	def _merge_added(self):
+		"""
+		Added entities can go anywhere, so they are sorted in instead of insertion sorted.
+		The entities already in the queue are one sorted run, which the sort merges in linear time.
+		"""
+
+		entities = self.entities + self._added
+		keys = self.keys + [self.get_key(entity) for entity in self._added]
+		self._added.clear()
+
+		order = sorted(range(len(entities)), key=keys.__getitem__)
+		self.entities = [entities[index] for index in order]
+		self.keys = [keys[index] for index in order]
+
+	def get_row_start(self, row: int) -> int:
+		"""
+		:return: Index of the first entity in the row or after it
+		"""
+
+		return bisect_left(self.keys, (row, float("-inf")))
+
+	def get_row(self, row: int) -> list["Entity"]:
+		return self.entities[self.get_row_start(row):self.get_row_start(row + 1)]
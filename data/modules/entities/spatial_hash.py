@@ -0,0 +1,219 @@
+import math
+from typing import Hashable
+
+import pygame
+
+type Bounds = tuple[float, float, float, float]  # Left, top, right, bottom
+
+
+class SpatialHash[T: Hashable]:
+	"""
+	Uniform grid of items by their bounds, for finding what is near a point, rect or segment without checking every item.
+	Items are kept in every cell their bounds touch, and only change cells when their bounds cross a cell edge.
+	"""
+
+	def __init__(self, cell_size: float):
+		self.cell_size = cell_size
+
+		# Dicts instead of sets, so queries return items in insertion order
+		self.cells: dict[tuple[int, int], dict[T, None]] = {}
+		self.bounds: dict[T, Bounds] = {}
+		self._cell_ranges: dict[T, tuple[int, int, int, int]] = {}
+
+	def __len__(self):
+		return len(self.bounds)
+
+	def __contains__(self, item: T):
+		return item in self.bounds
+
+	def _get_cell_range(self, bounds: Bounds) -> tuple[int, int, int, int]:
+		cell_size = self.cell_size
+		return (
+			math.floor(bounds[0] / cell_size),
+			math.floor(bounds[1] / cell_size),
+			math.floor(bounds[2] / cell_size),
+			math.floor(bounds[3] / cell_size)
+		)
+
+	def update(self, item: T, bounds: Bounds):
+		"""
+		Adds the item, or moves it to its new bounds
+		"""
+
+		self.bounds[item] = bounds
+
+		cell_range = self._get_cell_range(bounds)
+		prev_cell_range = self._cell_ranges.get(item)
+		if cell_range == prev_cell_range:
+			return
+
+		if prev_cell_range is not None:
+			self._remove_from_cells(item, prev_cell_range)
+
+		self._cell_ranges[item] = cell_range
+
+		cells = self.cells
+		for row in range(cell_range[1], cell_range[3] + 1):
+			for col in range(cell_range[0], cell_range[2] + 1):
+				cell = cells.get((col, row))
+				if cell is None:
+					cells[(col, row)] = {item: None}
+				else:
+					cell[item] = None
+
+	def remove(self, item: T):
+		if item not in self.bounds:
+			return
+
+		del self.bounds[item]
+		self._remove_from_cells(item, self._cell_ranges.pop(item))
+
+	def _remove_from_cells(self, item: T, cell_range: tuple[int, int, int, int]):
+		cells = self.cells
+		for row in range(cell_range[1], cell_range[3] + 1):
+			for col in range(cell_range[0], cell_range[2] + 1):
+				cell = cells[(col, row)]
+				del cell[item]
+
+				if len(cell) == 0:
+					del cells[(col, row)]
+
+	def clear(self):
+		self.cells.clear()
+		self.bounds.clear()
+		self._cell_ranges.clear()
+
+	def _get_candidates(self, cell_range: tuple[int, int, int, int]) -> dict[T, None]:
+		cells = self.cells
+
+		# Small queries usually touch a single cell
+		if cell_range[0] == cell_range[2] and cell_range[1] == cell_range[3]:
+			return cells.get((cell_range[0], cell_range[1]), {})
+
+		candidates = {}
+		for row in range(cell_range[1], cell_range[3] + 1):
+			for col in range(cell_range[0], cell_range[2] + 1):
+				cell = cells.get((col, row))
+				if cell is not None:
+					candidates.update(cell)
+
+		return candidates
+
+	def query_rect(self, rect: pygame.Rect | pygame.FRect) -> list[T]:
+		"""
+		:return: Items with bounds overlapping the rect
+		"""
+
+		left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+
+		bounds = self.bounds
+		items = []
+		for item in self._get_candidates(self._get_cell_range((left, top, right, bottom))):
+			item_left, item_top, item_right, item_bottom = bounds[item]
+			if item_left <= right and left <= item_right and item_top <= bottom and top <= item_bottom:
+				items.append(item)
+
+		return items
+
+	def query_radius(self, pos: pygame.typing.Point, radius: float) -> list[T]:
+		"""
+		:return: Items with bounds within radius of pos
+		"""
+
+		x, y = pos
+		radius_squared = radius * radius
+
+		bounds = self.bounds
+		items = []
+		for item in self._get_candidates(self._get_cell_range((x - radius, y - radius, x + radius, y + radius))):
+			item_left, item_top, item_right, item_bottom = bounds[item]
+
+			# Closest point of the bounds to pos
+			dx = x - max(item_left, min(x, item_right))
+			dy = y - max(item_top, min(y, item_bottom))
+			if dx * dx + dy * dy <= radius_squared:
+				items.append(item)
+
+		return items
+
+	def query_segment(self, start: pygame.typing.Point, end: pygame.typing.Point) -> list[T]:
+		"""
+		Walks the cells the segment passes through, instead of every cell of its bounding box
+
+		:return: Items with bounds touched by the segment
+		"""
+
+		start_x, start_y = start
+		end_x, end_y = end
+		dx = end_x - start_x
+		dy = end_y - start_y
+
+		cell_size = self.cell_size
+		col = math.floor(start_x / cell_size)
+		row = math.floor(start_y / cell_size)
+		end_col = math.floor(end_x / cell_size)
+		end_row = math.floor(end_y / cell_size)
+
+		step_col = 1 if dx > 0 else -1
+		step_row = 1 if dy > 0 else -1
+
+		# Fraction of the segment until the next cell edge, and between cell edges, on each axis
+		if dx != 0:
+			next_edge_x = (col + (step_col > 0)) * cell_size
+			t_max_x = (next_edge_x - start_x) / dx
+			t_delta_x = cell_size / abs(dx)
+		else:
+			t_max_x = t_delta_x = math.inf
+
+		if dy != 0:
+			next_edge_y = (row + (step_row > 0)) * cell_size
+			t_max_y = (next_edge_y - start_y) / dy
+			t_delta_y = cell_size / abs(dy)
+		else:
+			t_max_y = t_delta_y = math.inf
+
+		cells = self.cells
+		candidates = {}
+		for _ in range(abs(end_col - col) + abs(end_row - row) + 1):
+			cell = cells.get((col, row))
+			if cell is not None:
+				candidates.update(cell)
+
+			if t_max_x < t_max_y:
+				col += step_col
+				t_max_x += t_delta_x
+			else:
+				row += step_row
+				t_max_y += t_delta_y
+
+		bounds = self.bounds
+		items = []
+		for item in candidates:
+			if self._segment_touches_bounds(start_x, start_y, dx, dy, bounds[item]):
+				items.append(item)
+
+		return items
+
+	@staticmethod
+	def _segment_touches_bounds(start_x: float, start_y: float, dx: float, dy: float, bounds: Bounds) -> bool:
+		# Slab test, clipping the segment to the bounds one axis at a time
+		t_min = 0.0
+		t_max = 1.0
+
+		for start, delta, low, high in ((start_x, dx, bounds[0], bounds[2]), (start_y, dy, bounds[1], bounds[3])):
+			if delta == 0:
+				if start < low or high < start:
+					return False
+				continue
+
+			t_1 = (low - start) / delta
+			t_2 = (high - start) / delta
+			if t_1 > t_2:
+				t_1, t_2 = t_2, t_1
+
+			t_min = max(t_min, t_1)
+			t_max = min(t_max, t_2)
+			if t_min > t_max:
+				return False
+
+		return True
@@ -2,7 +2,6 @@ import random
 from typing import TYPE_CHECKING
 
 import pygame
-import pygbase
 
 from data.modules.base.constants import PIXEL_SCALE
 from data.modules.base.registry.registrable import Registrable
@@ -57,8 +56,7 @@ class WanderState(EntityState, Registrable):
 			self.pos.y + random.randint(*self.wander_range)
 		)
 
-		tile = self.level.get_tile(random_target)
-		if tile is not None:
+		if self.level.collision_grid.is_solid(random_target):
 			# if tile.sprite_sheet_name != "walls":
 			self.target = pygame.Vector2(random_target)
 			self.time_since_target = 0
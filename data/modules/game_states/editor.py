@@ -2,6 +2,7 @@ import pygame
 import pygbase
 
 from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.modules.base.dirty_tracker import DirtyTracker
 from data.modules.editor.actions.editor_actions import EditorActionQueue
 from data.modules.editor.editor_selection_info import TileSelectionInfo, ObjectSelectionInfo
 from data.modules.editor.editor_states.editor_state import EditorState, EditorStates
@@ -84,9 +85,16 @@ class Editor(pygbase.GameState, name="editor"):
 			text="Quit", alignment="c"
 		), align_with_previous=(True, False), add_on_to_previous=(False, True))
 
+		# Drawn again after input, camera movement, or around objects that changed frame
+		self.dirty = DirtyTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+		self.dirty.add_handlers("editor")
+
 	def enter(self):
 		self.particle_manager.clear()
 
+	def exit(self):
+		self.dirty.remove_handlers("editor")
+
 	def back_to_main_menu(self):
 		from data.modules.game_states.main_menu import MainMenu
 		self.set_next_state_type(MainMenu, ())
@@ -115,9 +123,26 @@ class Editor(pygbase.GameState, name="editor"):
 				if pygbase.Input.check_modifiers(pygame.KMOD_CTRL, pygame.KMOD_SHIFT, use_and=True):
 					self.action_queue.redo_action()
 
+			# Objects placed or erased are only added to or removed from the entity manager here, it is never updated
+			self.entity_manager.apply_changes()
+
 			# Animate objects
+			camera = self.shared_state.camera_controller.camera
+			is_animated = False
 			for game_object in self.room.objects:
-				game_object.animate(delta * 2)
+				if game_object.is_animated:
+					is_animated = True
+
+					frame = game_object.sprite.get_current_image()
+					game_object.animate(delta * 2)
+
+					new_frame = game_object.sprite.get_current_image()
+					if new_frame is not frame:
+						pos = camera.world_to_screen(game_object.pos)
+						self.dirty.mark(frame.get_image().get_rect(midbottom=pos).union(new_frame.get_image().get_rect(midbottom=pos)))
+
+			# The next frame of an animation doesn't come with an event
+			self.dirty.wait_when_idle = not is_animated
 
 			self.particle_manager.update(delta)
 
@@ -128,7 +153,13 @@ class Editor(pygbase.GameState, name="editor"):
 		else:
 			self.overlay_ui.update(delta)
 
+		self.dirty.track_held_input()
+		self.dirty.track_camera(self.shared_state.camera_controller.camera)
+
 	def draw(self, surface: pygame.Surface):
+		if not self.dirty.begin_draw(surface):
+			return
+
 		surface.fill((30, 30, 30))
 
 		self.states[self.current_state].draw(surface)
@@ -139,3 +170,5 @@ class Editor(pygbase.GameState, name="editor"):
 		if self.show_overlay:
 			surface.blit(self.overlay_darken, (0, 0))
 			self.overlay_ui.draw(surface)
+
+		self.dirty.end_draw(surface)
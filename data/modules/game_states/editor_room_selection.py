@@ -5,6 +5,7 @@ import pygame
 import pygbase
 
 from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.modules.base.dirty_tracker import DirtyTracker
 from data.modules.base.paths import ROOM_DIR
 from data.modules.entities.entity_manager import EntityManager
 from data.modules.game_states.editor import Editor
@@ -109,7 +110,13 @@ class EditorRoomSelection(pygbase.GameState, name="editor_room_select"):
 
 		self.entity_manager = EntityManager()
 
+		# Only drawn again after input
+		self.dirty = DirtyTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+		self.dirty.add_handlers("editor_room_select")
+
 	def exit(self):
+		self.dirty.remove_handlers("editor_room_select")
+
 		if self.selected_room is not None:
 			self.selected_room.remove_objects()
 		self.entity_manager.clear_entities()
@@ -144,8 +151,15 @@ class EditorRoomSelection(pygbase.GameState, name="editor_room_select"):
 		if pygbase.Input.key_just_pressed(pygame.K_ESCAPE):
 			self.set_next_state_type(MainMenu, ())
 
+		self.dirty.track_held_input()
+
 	def draw(self, surface: pygame.Surface):
+		if not self.dirty.begin_draw(surface):
+			return
+
 		surface.fill((30, 30, 30))
 		self.ui.draw(surface)
 
 		surface.blit(self.selected_room_image, (SCREEN_WIDTH * 0.52, SCREEN_HEIGHT * 0.02))
+
+		self.dirty.end_draw(surface)
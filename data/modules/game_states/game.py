@@ -2,29 +2,42 @@ import pygame
 import pygbase
 import pygbase.ui.text
 
-from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, LEVEL_DEPTH, ROOM_SEPARATION, WALL_GAP_RADIUS, LEVEL_SEED
+from data.modules.base.fixed_timestep import FixedTimestep
 from data.modules.entities.entity_manager import EntityManager
 from data.modules.entities.player import Player
 from data.modules.level.level import Level, LevelGenerator
 
 
 class Game(pygbase.GameState, name="game"):
-	def __init__(self):
+	def __init__(self, entity_manager: EntityManager | None = None, level: Level | None = None):
+		"""
+		:param entity_manager: Entity manager the level was generated with
+		:param level: Pre-generated level (see Loading), otherwise generated here
+		"""
+
 		super().__init__()
-		self.entity_manager = EntityManager()
 		self.particle_manager: pygbase.ParticleManager = pygbase.Common.get_value("particle_manager")
 		self.lighting_manager: pygbase.LightingManager = pygbase.Common.get_value("lighting_manager")
 
 		self.camera = pygbase.Camera(pos=(-SCREEN_WIDTH / 2, -SCREEN_HEIGHT / 2))
 
-		room_separation = 21
-		self.level: Level = LevelGenerator(20, self.entity_manager, room_separation, 1).generate_level()
+		if level is None:
+			self.entity_manager = EntityManager()
+			self.level: Level = LevelGenerator(LEVEL_DEPTH, self.entity_manager, ROOM_SEPARATION, WALL_GAP_RADIUS, seed=LEVEL_SEED).generate_level()
+		else:
+			self.entity_manager = entity_manager
+			self.level: Level = level
+
+		room_separation = self.level.room_separation
 
 		self.player = Player(((int(room_separation / 2) + 0.5) * TILE_SIZE, room_separation / 2 * TILE_SIZE), self.camera, self.entity_manager, self.level)
 		self.entity_manager.add_entity(self.player)
 
 		self.camera.set_pos(self.player.pos + (-SCREEN_WIDTH / 2, -SCREEN_HEIGHT / 2))
 
+		self.timestep = FixedTimestep()
+
 	def enter(self):
 		pygbase.Common.set_value("camera", self.camera)
 
@@ -36,13 +49,25 @@ class Game(pygbase.GameState, name="game"):
 		self.level.cleanup()
 		self.entity_manager.clear_entities()
 
-	def update(self, delta: float):
+	def simulate(self, delta: float):
 		self.entity_manager.update(delta)
+
+		self.level.update(delta, self.player.pos)
+
+	def update(self, delta: float):
+		self.player.read_frame_input()
+
+		for _ in range(self.timestep.advance(delta)):
+			self.simulate(self.timestep.tick_delta)
+
 		self.particle_manager.update(delta)
 		self.lighting_manager.update(delta)
 
+		# Follows where the player is drawn, not where it was last simulated
+		player_pos = self.entity_manager.get_interpolated_pos(self.player, self.timestep.alpha)
 		self.camera.lerp_to_target(
-			self.player.collider.rect.center
+			player_pos
+			- (0, self.player.collider.rect.height / 2)
 			- pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
 			+ self.player.movement.velocity * delta * 8
 			, delta * 8
@@ -52,8 +77,6 @@ class Game(pygbase.GameState, name="game"):
 		# 	- pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
 		# )
 
-		self.level.update(delta, self.player.pos)
-
 		if pygbase.Input.key_just_pressed(pygame.K_ESCAPE):
 			from data.modules.game_states.main_menu import MainMenu
 			self.set_next_state(MainMenu())
@@ -63,5 +86,9 @@ class Game(pygbase.GameState, name="game"):
 	def draw(self, surface: pygame.Surface):
 		surface.fill((0, 0, 0))
 
+		self.entity_manager.interpolate_positions(self.timestep.alpha)
+
 		self.level.draw(surface, self.camera)
 		self.particle_manager.draw(surface, self.camera)
+
+		self.entity_manager.restore_positions()
@@ -0,0 +1,43 @@
+import pygame
+import pygbase
+import pygbase.ui.text
+
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, LEVEL_DEPTH, ROOM_SEPARATION, WALL_GAP_RADIUS, LEVEL_SEED, GENERATION_TIME_BUDGET
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import LevelGenerator
+
+
+class Loading(pygbase.GameState, name="loading"):
+	def __init__(self, time_budget: float = GENERATION_TIME_BUDGET):
+		super().__init__()
+
+		self.time_budget = time_budget
+
+		self.entity_manager = EntityManager()
+		self.level_generator = LevelGenerator(LEVEL_DEPTH, self.entity_manager, ROOM_SEPARATION, WALL_GAP_RADIUS, seed=LEVEL_SEED)
+
+		self.progress_bar_rect = pygame.Rect(0, 0, SCREEN_WIDTH * 0.6, 30)
+		self.progress_bar_rect.center = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+
+		self.stage_text = pygbase.ui.text.Text((self.progress_bar_rect.right, self.progress_bar_rect.bottom + 10), "arial", 30, (200, 200, 200), text="", use_sys=True, alignment=pygbase.UIAlignment.TOP_RIGHT)
+
+	def update(self, delta: float):
+		if self.level_generator.done:
+			return
+
+		if self.level_generator.step(self.time_budget):
+			from data.modules.game_states.game import Game
+			self.set_next_state(Game(self.entity_manager, self.level_generator.level))
+
+		self.stage_text.set_text(f"Generating {self.level_generator.stage}...")
+
+	def draw(self, surface: pygame.Surface):
+		surface.fill((0, 0, 0))
+
+		progress_rect = self.progress_bar_rect.copy()
+		progress_rect.width = int(self.progress_bar_rect.width * self.level_generator.progress)
+
+		pygame.draw.rect(surface, (200, 200, 200), progress_rect)
+		pygame.draw.rect(surface, (200, 200, 200), self.progress_bar_rect, width=2)
+
+		self.stage_text.draw(surface)
@@ -1,10 +1,12 @@
 import pygame
 import pygbase
 
-from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE, LEVEL_DEPTH, ROOM_SEPARATION, WALL_GAP_RADIUS, LEVEL_SEED
+from data.modules.base.fixed_timestep import FixedTimestep
 from data.modules.entities.entity_manager import EntityManager
 from data.modules.entities.player import Player
 from data.modules.level.level import Level
+from data.modules.level.level_pregenerator import LevelPregenerator
 
 
 class Lobby(pygbase.GameState, name="lobby"):
@@ -24,8 +26,13 @@ class Lobby(pygbase.GameState, name="lobby"):
 		self.player = Player((4.5 * TILE_SIZE, 6 * TILE_SIZE), self.camera, self.entity_manager, self.level)
 		self.entity_manager.add_entity(self.player)
 
+		self.timestep = FixedTimestep()
+
 		pygbase.Events.add_handler("lobby", "start_game", self.start_game_callback)
 
+		# Build the dungeon while the player walks to the altar
+		LevelPregenerator.start(LEVEL_DEPTH, ROOM_SEPARATION, WALL_GAP_RADIUS, seed=LEVEL_SEED)
+
 	def enter(self):
 		self.particle_manager.clear()
 
@@ -36,23 +43,38 @@ class Lobby(pygbase.GameState, name="lobby"):
 		pygbase.Events.remove_handler(self.start_game_callback, "lobby", "start_game")
 
 	def start_game_callback(self, event: pygame.Event):
-		from data.modules.game_states.game import Game
-		self.set_next_state(Game())
+		entity_manager = EntityManager()
+		level = LevelPregenerator.get_level(entity_manager)
+
+		if level is not None:
+			from data.modules.game_states.game import Game
+			self.set_next_state(Game(entity_manager, level))
+		else:
+			# Not pregenerated in time, generate over the next frames instead
+			from data.modules.game_states.loading import Loading
+			self.set_next_state(Loading())
+
+	def simulate(self, delta: float):
+		self.entity_manager.update(delta)
+
+		self.level.update(delta, self.player.pos)
 
 	def update(self, delta: float):
 		self.particle_manager.update(delta)
 		self.lighting_manager.update(delta)
 		self.dialogue_manager.update(delta)
-		self.entity_manager.update(delta)
-
-		self.level.update(delta, self.player.pos)
 
 		if self.dialogue_manager.current_node != "":
 			self.player.disable()
 		else:
 			self.player.enable()
 
-		self.camera.lerp_to_target(self.player.collider.rect.center - pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2), delta * 5)
+		self.player.read_frame_input()
+		for _ in range(self.timestep.advance(delta)):
+			self.simulate(self.timestep.tick_delta)
+
+		player_pos = self.entity_manager.get_interpolated_pos(self.player, self.timestep.alpha)
+		self.camera.lerp_to_target(player_pos - (0, self.player.collider.rect.height / 2) - pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2), delta * 5)
 
 		if pygbase.Input.key_just_pressed(pygame.K_ESCAPE):
 			from data.modules.game_states.main_menu import MainMenu
@@ -61,7 +83,11 @@ class Lobby(pygbase.GameState, name="lobby"):
 	def draw(self, surface: pygame.Surface):
 		surface.fill((0, 0, 0))
 
+		self.entity_manager.interpolate_positions(self.timestep.alpha)
+
 		self.level.draw(surface, self.camera)
 
 		self.particle_manager.draw(surface, self.camera)
+
+		self.entity_manager.restore_positions()
 		self.dialogue_manager.draw(surface)
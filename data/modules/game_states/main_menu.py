@@ -2,6 +2,9 @@ import pygame
 
 import pygbase
 
+from data.modules.base.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.modules.base.dirty_tracker import DirtyTracker
+
 
 class MainMenu(pygbase.GameState, name="main_menu"):
 	def __init__(self):
@@ -63,12 +66,26 @@ class MainMenu(pygbase.GameState, name="main_menu"):
 			text="Quit"
 		), add_on_to_previous=(False, True))
 
+		# Only drawn again after input
+		self.dirty = DirtyTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+		self.dirty.add_handlers("main_menu")
+
+	def exit(self):
+		self.dirty.remove_handlers("main_menu")
+
 	def update(self, delta: float):
 		self.ui.update(delta)
 
 		if pygbase.Input.key_just_pressed(pygame.K_ESCAPE):
 			pygbase.Events.run_handlers("all", pygame.QUIT)
 
+		self.dirty.track_held_input()
+
 	def draw(self, surface: pygame.Surface):
+		if not self.dirty.begin_draw(surface):
+			return
+
 		surface.fill((30, 30, 30))
 		self.ui.draw(surface)
+
+		self.dirty.end_draw(surface)
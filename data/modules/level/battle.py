@@ -33,6 +33,10 @@ class Battle:
 		for wave_data in battle_data["waves"]:
 			self.waves.append(EnemyWave(wave_data, self.entity_manager))
 
+	def cleanup(self):
+		for wave in self.waves:
+			wave.cleanup()
+
 	def update(self):
 		"""
 
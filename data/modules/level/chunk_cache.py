@@ -0,0 +1,134 @@
+import math
+from collections import OrderedDict
+from typing import Callable, TYPE_CHECKING
+
+import pygame
+import pygbase
+
+from data.modules.base.constants import TILE_SIZE
+from data.modules.level.tile_storage import TileStorage, EMPTY_ID
+
+if TYPE_CHECKING:
+	from data.modules.level.tile import TileType
+
+BAKE_CHUNK_SIZE = 8  # Tiles per baked surface side, smaller than storage chunks to keep surfaces small
+MAX_CACHED_SURFACES = 48
+
+
+class ChunkSurfaceCache:
+	"""
+	Bakes static tile layers into one surface per chunk, so drawing a layer is a handful of blits.
+	Chunks are only rebaked once a tile inside them is changed.
+	"""
+
+	def __init__(self, tiles: TileStorage, get_tile_type: Callable[[int], "TileType"], layers: tuple[int, ...], max_surfaces: int = MAX_CACHED_SURFACES):
+		self.tiles = tiles
+		self._get_tile_type = get_tile_type
+
+		self.layers = layers
+		self.max_surfaces = max_surfaces
+
+		# {(layer, chunk_pos): (world_pos, surface | None)}, None when the chunk has no tiles
+		self._surfaces: OrderedDict[tuple[int, tuple[int, int]], tuple[tuple[int, int], pygame.Surface | None]] = OrderedDict()
+		self._dirty: set[tuple[int, tuple[int, int]]] = set()
+
+		self.hits = 0
+		self.misses = 0
+		self.rebakes = 0
+
+	def get_stats(self) -> dict[str, int]:
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"rebakes": self.rebakes,
+			"cached": len(self._surfaces)
+		}
+
+	def reset_stats(self):
+		self.hits = 0
+		self.misses = 0
+		self.rebakes = 0
+
+	def invalidate(self, layer: int, tile_pos: tuple[int, int]):
+		if layer not in self.layers:
+			return
+
+		key = layer, (tile_pos[0] // BAKE_CHUNK_SIZE, tile_pos[1] // BAKE_CHUNK_SIZE)
+
+		if key in self._surfaces:
+			self._dirty.add(key)
+
+	def clear(self):
+		self._surfaces.clear()
+		self._dirty.clear()
+
+	def _bake(self, layer: int, chunk_pos: tuple[int, int]) -> tuple[tuple[int, int], pygame.Surface | None]:
+		start_col = chunk_pos[0] * BAKE_CHUNK_SIZE
+		start_row = chunk_pos[1] * BAKE_CHUNK_SIZE
+
+		# Tile rects are the same as if drawn individually, including any overhang past the tile
+		blits = []
+		for row in range(start_row, start_row + BAKE_CHUNK_SIZE):
+			bottom = int((row + 1) * TILE_SIZE)
+
+			for col in range(start_col, start_col + BAKE_CHUNK_SIZE):
+				palette_id = self.tiles.get_id(layer, col, row)
+				if palette_id != EMPTY_ID:
+					tile_type = self._get_tile_type(palette_id)
+					image_surface = tile_type.image.get_image()
+
+					blits.append((image_surface, image_surface.get_rect(topleft=(int(col * TILE_SIZE), bottom - tile_type.height))))
+
+		if len(blits) == 0:
+			return (0, 0), None
+
+		bounds = blits[0][1].unionall([rect for _, rect in blits[1:]])
+
+		surface = pygame.Surface(bounds.size, flags=pygame.SRCALPHA)
+		surface.fblits([(image_surface, (rect.x - bounds.x, rect.y - bounds.y)) for image_surface, rect in blits])
+
+		return bounds.topleft, surface
+
+	def _get_surface(self, layer: int, chunk_pos: tuple[int, int]) -> tuple[tuple[int, int], pygame.Surface | None]:
+		key = layer, chunk_pos
+
+		baked = self._surfaces.get(key)
+		if baked is None:
+			self.misses += 1
+
+			baked = self._surfaces[key] = self._bake(layer, chunk_pos)
+
+			# Evict least recently used
+			if len(self._surfaces) > self.max_surfaces:
+				evicted_key, _ = self._surfaces.popitem(last=False)
+				self._dirty.discard(evicted_key)
+		elif key in self._dirty:
+			self.rebakes += 1
+			self._dirty.remove(key)
+
+			baked = self._surfaces[key] = self._bake(layer, chunk_pos)
+			self._surfaces.move_to_end(key)
+		else:
+			self.hits += 1
+			self._surfaces.move_to_end(key)
+
+		return baked
+
+	def draw(self, layer: int, surface: pygame.Surface, camera: pygbase.Camera, top_left: tuple[int, int], bottom_right: tuple[int, int]):
+		"""
+		Draws every chunk overlapping the tile range
+
+		:param top_left: Tile position of top left (inclusive)
+		:param bottom_right: Tile position of bottom right (exclusive)
+		"""
+
+		# Tiles have integer world positions, so offsetting by the floored camera position lines up with drawing them individually
+		offset_x = math.floor(-camera.pos.x)
+		offset_y = math.floor(-camera.pos.y)
+
+		for chunk_row in range(top_left[1] // BAKE_CHUNK_SIZE, (bottom_right[1] - 1) // BAKE_CHUNK_SIZE + 1):
+			for chunk_col in range(top_left[0] // BAKE_CHUNK_SIZE, (bottom_right[0] - 1) // BAKE_CHUNK_SIZE + 1):
+				world_pos, chunk_surface = self._get_surface(layer, (chunk_col, chunk_row))
+
+				if chunk_surface is not None:
+					surface.blit(chunk_surface, (world_pos[0] + offset_x, world_pos[1] + offset_y))
@@ -0,0 +1,108 @@
+import pygame
+
+from data.modules.base.constants import TILE_SIZE
+from data.modules.level.tile_storage import TileStorage, CHUNK_SHIFT, CHUNK_MASK, CHUNK_AREA, EMPTY_ID
+
+
+class CollisionGrid:
+	"""
+	Solid / non-solid bitmap of the level tiles, one bytearray per chunk.
+	Kept in sync with layer 1 by the level, and queried by anything that needs to collide with walls.
+	"""
+
+	def __init__(self):
+		self.chunks: dict[tuple[int, int], bytearray] = {}
+
+	def clear(self):
+		self.chunks.clear()
+
+	def load_layer(self, tiles: TileStorage, layer: int):
+		"""
+		Replaces the grid with the tiles of a layer
+		"""
+
+		self.chunks = {
+			chunk_pos: bytearray(palette_id != EMPTY_ID for palette_id in chunk.ids)
+			for chunk_pos, chunk in tiles.layers.get(layer, {}).items()
+		}
+
+	def set_solid(self, tile_pos: tuple[int, int], solid: bool):
+		chunk_pos = tile_pos[0] >> CHUNK_SHIFT, tile_pos[1] >> CHUNK_SHIFT
+
+		chunk = self.chunks.get(chunk_pos)
+		if chunk is None:
+			if not solid:
+				return
+
+			chunk = self.chunks[chunk_pos] = bytearray(CHUNK_AREA)
+
+		chunk[((tile_pos[1] & CHUNK_MASK) << CHUNK_SHIFT) | (tile_pos[0] & CHUNK_MASK)] = solid
+
+	def is_solid_at_tile(self, col: int, row: int) -> bool:
+		chunk = self.chunks.get((col >> CHUNK_SHIFT, row >> CHUNK_SHIFT))
+		if chunk is None:
+			return False
+
+		return chunk[((row & CHUNK_MASK) << CHUNK_SHIFT) | (col & CHUNK_MASK)] == 1
+
+	def is_solid(self, pos: pygame.typing.Point) -> bool:
+		"""
+		:param pos: Position in pixels
+		"""
+
+		return self.is_solid_at_tile(int(pos[0] // TILE_SIZE), int(pos[1] // TILE_SIZE))
+
+	def row_span_is_solid(self, row: int, start_col: int, end_col: int) -> bool:
+		"""
+		:return: True if any tile in the row from start_col to end_col (inclusive) is solid
+		"""
+
+		chunk_row = row >> CHUNK_SHIFT
+		row_index = (row & CHUNK_MASK) << CHUNK_SHIFT
+
+		for chunk_col in range(start_col >> CHUNK_SHIFT, (end_col >> CHUNK_SHIFT) + 1):
+			chunk = self.chunks.get((chunk_col, chunk_row))
+			if chunk is None:
+				continue
+
+			first = row_index | (max(start_col, chunk_col << CHUNK_SHIFT) & CHUNK_MASK)
+			last = row_index | (min(end_col, ((chunk_col + 1) << CHUNK_SHIFT) - 1) & CHUNK_MASK)
+			if chunk.find(1, first, last + 1) != -1:
+				return True
+
+		return False
+
+	def col_span_is_solid(self, col: int, start_row: int, end_row: int) -> bool:
+		"""
+		:return: True if any tile in the column from start_row to end_row (inclusive) is solid
+		"""
+
+		chunk_col = col >> CHUNK_SHIFT
+		col_index = col & CHUNK_MASK
+
+		for chunk_row in range(start_row >> CHUNK_SHIFT, (end_row >> CHUNK_SHIFT) + 1):
+			chunk = self.chunks.get((chunk_col, chunk_row))
+			if chunk is None:
+				continue
+
+			first = ((max(start_row, chunk_row << CHUNK_SHIFT) & CHUNK_MASK) << CHUNK_SHIFT) | col_index
+			last = ((min(end_row, ((chunk_row + 1) << CHUNK_SHIFT) - 1) & CHUNK_MASK) << CHUNK_SHIFT) | col_index
+			if 1 in chunk[first:last + 1:1 << CHUNK_SHIFT]:
+				return True
+
+		return False
+
+	def rect_is_solid(self, rect: pygame.Rect | pygame.FRect) -> bool:
+		"""
+		:param rect: Rect in pixels, with its right and bottom edges included
+		:return: True if the rect overlaps any solid tile
+		"""
+
+		start_col = int(rect.left // TILE_SIZE)
+		end_col = int(rect.right // TILE_SIZE)
+
+		for row in range(int(rect.top // TILE_SIZE), int(rect.bottom // TILE_SIZE) + 1):
+			if self.row_span_is_solid(row, start_col, end_col):
+				return True
+
+		return False
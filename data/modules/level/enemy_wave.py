@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from data.modules.entities.entity_manager import EntityManager
 from data.modules.entities.entity_spawn import EntitySpawn
+from data.modules.entities.events import EntityDied
 
 if TYPE_CHECKING:
 	from data.modules.level.level import Level
@@ -14,26 +15,46 @@ class EnemyWave:
 
 		self.wave_data: dict = wave_data
 		self.enemies = []
+		self.enemies_alive = set()  # Removed from as EntityDied events come in
 
 		self.wave_in_progress = False
 
 	def spawn_wave(self, level: "Level", room: "Room"):
 		from data.modules.entities.enemies.enemy_loader import EnemyLoader
 
+		enemies = []
 		for enemy_type, num_enemies in self.wave_data.items():
 			for _ in range(num_enemies):
 				spawn_pos = room.generate_spawn_pos()
 				enemy = EnemyLoader.create_enemy(enemy_type, spawn_pos, level, self.entity_manager)
-				spawn = EntitySpawn(spawn_pos, self.entity_manager, 0.7, enemy)
+				spawn = EntitySpawn.pool.get(spawn_pos, self.entity_manager, 0.7, enemy)
 
-				self.enemies.append(enemy)
+				enemies.append(enemy)
 				self.entity_manager.add_entity(spawn)
 
+		self.watch_enemies(enemies)
+
 		self.wave_in_progress = True
 
-	def check_done(self):
-		for enemy in self.enemies:
-			if enemy.is_alive():
-				return False
+	def watch_enemies(self, enemies: list):
+		"""
+		The wave is done once every enemy watched has died
+		"""
+
+		self.enemies.extend(enemies)
+
+		if len(self.enemies_alive) == 0 and len(enemies) > 0:
+			self.entity_manager.events.subscribe(EntityDied, self.on_entity_died)
+		self.enemies_alive.update(enemies)
 
-		return True
+	def on_entity_died(self, event: EntityDied):
+		self.enemies_alive.discard(event.entity)
+
+		if len(self.enemies_alive) == 0:
+			self.entity_manager.events.unsubscribe(EntityDied, self.on_entity_died)
+
+	def cleanup(self):
+		self.entity_manager.events.unsubscribe(EntityDied, self.on_entity_died)
+
+	def check_done(self):
+		return len(self.enemies_alive) == 0
@@ -1,33 +1,73 @@
 import gc
-import json
 import logging
 import os
+import pickle
 import random
+import time
 from collections import deque
+from typing import Generator
 
 import pygame
 import pygbase
 
-from data.modules.base.constants import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
-from data.modules.base.paths import ROOM_DIR, BATTLE_DIR
+from data.modules.base.constants import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, AWAKE_ROOM_RADIUS
+from data.modules.base.draw_batch import DrawBatch
+from data.modules.base.paths import BATTLE_DIR
 from data.modules.base.utils import get_tile_pos, one_if_even
 from data.modules.entities.entity_manager import EntityManager
+from data.modules.entities.events import RoomEntered
+from data.modules.level.chunk_cache import ChunkSurfaceCache
+from data.modules.level.collision_grid import CollisionGrid
+from data.modules.level.level_cache import LevelCache, TILE_SPRITE_SHEETS
 from data.modules.level.room import Room, Hallway
-from data.modules.level.tile import Tile
+from data.modules.level.room_templates import RoomTemplate, RoomTemplates
+from data.modules.level.tile_ring_buffer import TileRingBuffer
+from data.modules.level.tile import Tile, TileType
+from data.modules.level.tile_storage import TileStorage, CHUNK_SHIFT, CHUNK_MASK, EMPTY_ID
 
 
 class Level:
-	def __init__(self, entity_manager: EntityManager, room_separation: int, wall_gap_radius: int):
+	def __init__(self, entity_manager: EntityManager | None, room_separation: int, wall_gap_radius: int, seed: int | None = None, sprite_sheet_lengths: dict[str, int] | None = None, headless: bool = False):
+		"""
+		:param seed: Seed of the tile and spawn randomness, random if None
+		:param sprite_sheet_lengths: Image counts of the tile sprite sheets, looked up from resources when missing
+		:param headless: Only generate tile data, without objects or drawing. Used when generating outside the game
+		"""
+
 		self.entity_manager = entity_manager
-		self.particle_manager: pygbase.ParticleManager = pygbase.Common.get_value("particle_manager")
-		self.lighting_manager: pygbase.LightingManager = pygbase.Common.get_value("lighting_manager")
+		self.headless = headless
+
+		if not self.headless:
+			self.particle_manager: pygbase.ParticleManager | None = pygbase.Common.get_value("particle_manager")
+			self.lighting_manager: pygbase.LightingManager | None = pygbase.Common.get_value("lighting_manager")
+		else:
+			self.particle_manager = None
+			self.lighting_manager = None
+
+		self.sprite_sheet_lengths: dict[str, int] = {} if sprite_sheet_lengths is None else dict(sprite_sheet_lengths)
+
+		# Separate streams, so spawns are the same whether the tiles were generated or loaded
+		self.seed: int = seed if seed is not None else random.randrange(1 << 32)
+		self.tile_random = random.Random(f"{self.seed}:tiles")
+		self.spawn_random = random.Random(f"{self.seed}:spawns")
 
 		# TODO: Rework to separate tiles from rooms
 		# A game room is responsible for its location, loading the tiles, and special tiles
 		# The level is responsible for feeding collision data, rendering tiles, etc.
 
 		# layer[0: Ground, 1: Player | Walls, 2: Above]
-		self.tiles: dict[int, dict[tuple[int, int], Tile]] = {}
+		self.tiles = TileStorage()
+		self._tile_types: list[TileType | None] = []  # Indexed by palette id
+
+		# Layers without entities between tiles are drawn from baked surfaces
+		self.chunk_cache = ChunkSurfaceCache(self.tiles, self._get_tile_type, (0, 2))
+		self.ground_buffer: TileRingBuffer | None = None  # Made on first draw
+
+		# Tiles of layer 1 and the entities between them are blitted together
+		self.draw_batch = DrawBatch()
+
+		# Solid tiles of layer 1
+		self.collision_grid = CollisionGrid()
 
 		self.rooms: dict[tuple[int, int], Room] = {}
 		self.connections = {}
@@ -37,42 +77,123 @@ class Level:
 
 		self.prev_player_room_pos = None
 
+		# Objects of rooms further than this from the player sleep
+		self.awake_room_radius = AWAKE_ROOM_RADIUS
+		self.awake_room_pos: tuple[int, int] | None = None
+
+	@classmethod
+	def from_level_data(cls, level_data: bytes, entity_manager: EntityManager) -> "Level":
+		"""
+		Rebuilds a level packed with get_level_data. Tiles are restored as is, and rooms only load their objects
+
+		:param level_data: Buffer from get_level_data
+		:param entity_manager: Entity manager of the game
+		:return: Level
+		"""
+
+		data = pickle.loads(level_data)
+
+		level = cls(entity_manager, data["room_separation"], data["wall_gap_radius"], seed=data["seed"])
+		level.set_tile_storage(TileStorage.from_data(data["tiles"]))
+
+		for room_pos, room_name, connections, battle_name in data["rooms"]:
+			level.add_room_ex(room_pos, room_name, connections, battle_name, RoomTemplates.get(room_name), populate_tiles=False)
+
+		return level
+
+	def get_level_data(self) -> bytes:
+		"""
+		Packs the rooms and tiles into a compact buffer, which can be sent between processes
+
+		:return: Buffer for from_level_data
+		"""
+
+		return pickle.dumps({
+			"seed": self.seed,
+			"room_separation": self.room_separation,
+			"wall_gap_radius": self.wall_gap_radius,
+			"rooms": [
+				(room_pos, room.name, room.connections, room.battle_name)
+				for room_pos, room in self.rooms.items()
+			],
+			"tiles": self.tiles.to_data()
+		}, protocol=pickle.HIGHEST_PROTOCOL)
+
+	def set_tile_storage(self, tiles: TileStorage):
+		self.tiles = tiles
+		self._tile_types.clear()
+
+		self.chunk_cache = ChunkSurfaceCache(self.tiles, self._get_tile_type, (0, 2))
+		self.ground_buffer = None
+		self.collision_grid.load_layer(self.tiles, 1)
+
+	def get_sprite_sheet_length(self, sprite_sheet_name: str) -> int:
+		length = self.sprite_sheet_lengths.get(sprite_sheet_name)
+		if length is None:
+			length = self.sprite_sheet_lengths[sprite_sheet_name] = pygbase.Resources.get_resource("sprite_sheets", sprite_sheet_name).length
+
+		return length
+
 	def cleanup(self):
 		"""
-		Removes objects from rooms
+		Removes objects from rooms, and stops battles listening for events
 		"""
 
 		for room in self.rooms.values():
 			room.remove_objects()
 
+			if room.battle is not None:
+				room.battle.cleanup()
+
 	def check_is_tile(self, layer: int, pos: tuple[int, int]) -> bool:
-		return layer in self.tiles and pos in self.tiles[layer]
+		return self.tiles.has(layer, pos)
 
 	def add_tile(self, layer: int, tile_pos: tuple[int, int], tile: Tile):
 		assert tile is not None
 		# logging.debug(f"Adding tile at {layer}, {tile_pos} with position {tile.rect}")
-		self.tiles.setdefault(layer, {})[tile_pos] = tile
+		self.set_tile(layer, tile_pos, tile.sprite_sheet_name, tile.image_index)
+
+	def set_tile(self, layer: int, tile_pos: tuple[int, int], sprite_sheet_name: str, image_index: int):
+		self.tiles.set(layer, tile_pos, sprite_sheet_name, image_index)
+		self.chunk_cache.invalidate(layer, tile_pos)
+		if layer == 0 and self.ground_buffer is not None:
+			self.ground_buffer.invalidate(tile_pos)
+
+		if layer == 1:
+			self.collision_grid.set_solid(tile_pos, True)
 
 	def remove_tile(self, layer: int, tile_pos: tuple[int, int]):
-		if self.check_is_tile(layer, tile_pos):
-			del self.tiles[layer][tile_pos]
+		if self.tiles.remove(layer, tile_pos):
+			self.chunk_cache.invalidate(layer, tile_pos)
+			if layer == 0 and self.ground_buffer is not None:
+				self.ground_buffer.invalidate(tile_pos)
 
-			if len(self.tiles[layer].values()) == 0:
-				del self.tiles[layer]
+			if layer == 1:
+				self.collision_grid.set_solid(tile_pos, False)
 
-	def get_tile(self, pos: pygame.Vector2 | tuple[float, float], layer: int = 1) -> Tile | None:
-		tile_pos = get_tile_pos(pos, (TILE_SIZE, TILE_SIZE))
+	def get_tile(self, pos: pygame.Vector2 | tuple[float, float], layer: int = 1) -> TileType | None:
+		return self.get_tile_at_tile_pos(get_tile_pos(pos, (TILE_SIZE, TILE_SIZE)), layer)
 
-		if not self.check_is_tile(layer, tile_pos):
+	def get_tile_at_tile_pos(self, tile_pos: tuple[int, int], layer: int = 1) -> TileType | None:
+		"""
+		:return: The shared type of the tile, or None if empty. Its bottom left is (tile_pos[0] * TILE_SIZE, (tile_pos[1] + 1) * TILE_SIZE)
+		"""
+
+		palette_id = self.tiles.get_id(layer, tile_pos[0], tile_pos[1])
+		if palette_id == EMPTY_ID:
 			return None
 
-		return self.tiles[layer][tile_pos]
+		return self._get_tile_type(palette_id)
 
-	def get_tile_at_tile_pos(self, tile_pos: tuple[int, int], layer: int = 1) -> Tile | None:
-		if not self.check_is_tile(layer, tile_pos):
-			return None
+	def _get_tile_type(self, palette_id: int) -> TileType:
+		if palette_id >= len(self._tile_types):
+			self._tile_types.extend([None] * (palette_id + 1 - len(self._tile_types)))
 
-		return self.tiles[layer][tile_pos]
+		tile_type = self._tile_types[palette_id]
+		if tile_type is None:
+			tile_type = self._tile_types[palette_id] = TileType.get(*self.tiles.palette[palette_id])
+
+		return tile_type
 
 	def add_room(self, room_pos: tuple[int, int], room_name: str, battle_name: str = ""):
 		room = Room(
@@ -83,24 +204,25 @@ class Level:
 			offset=(
 				room_pos[0] * self.room_separation,
 				room_pos[1] * self.room_separation
-			)
+			),
+			zone=room_pos
 		)
 
 		self.rooms[room_pos] = room
 		room.populate_tiles()
 		return room
 
-	def add_room_ex(self, room_pos: tuple[int, int], room_name: str, connections: tuple[bool, bool, bool, bool], battle_name: str, room_data: dict):
+	def add_room_ex(self, room_pos: tuple[int, int], room_name: str, connections: tuple[bool, bool, bool, bool], battle_name: str, room_template: RoomTemplate, populate_tiles: bool = True):
 		offset = (
-			(self.room_separation - room_data["cols"]) // 2,
-			(self.room_separation - room_data["rows"]) // 2
+			(self.room_separation - room_template.n_cols) // 2,
+			(self.room_separation - room_template.n_rows) // 2
 		)
 
 		odd_sep_offset = (0, 0)
 		if self.room_separation % 2 != 0:
 			odd_sep_offset = (
-				one_if_even(room_data["cols"]),
-				one_if_even(room_data["rows"])
+				one_if_even(room_template.n_cols),
+				one_if_even(room_template.n_rows)
 			)
 
 		room = Room(
@@ -112,11 +234,15 @@ class Level:
 				room_pos[0] * self.room_separation + offset[0] + odd_sep_offset[0],
 				room_pos[1] * self.room_separation + offset[1] + odd_sep_offset[1]
 			),
-			connections=connections
+			connections=connections,
+			zone=room_pos
 		)
 
 		self.rooms[room_pos] = room
-		room.populate_tiles()
+		if populate_tiles:
+			room.populate_tiles()
+		else:
+			room.populate_objects()
 		return room
 
 	def add_hallway(self, room_pos: tuple[int, int], connected_room_pos: tuple[int, int], room: Room, connecting_room: Room):
@@ -217,8 +343,22 @@ class Level:
 	def get_room_from_room_pos(self, room_pos: tuple[int, int]) -> Room | None:
 		return self.rooms.get(room_pos)
 
+	def _update_awake_rooms(self, room_pos: tuple[int, int]):
+		awake_rooms = set()
+		for row in range(room_pos[1] - self.awake_room_radius, room_pos[1] + self.awake_room_radius + 1):
+			for col in range(room_pos[0] - self.awake_room_radius, room_pos[0] + self.awake_room_radius + 1):
+				awake_rooms.add((col, row))
+
+		self.entity_manager.set_awake_zones(awake_rooms)
+
 	def update(self, delta: float, player_pos: pygame.Vector2):
 		player_room_pos = get_tile_pos(player_pos, (self.room_separation * TILE_SIZE, self.room_separation * TILE_SIZE))
+
+		# Wake the rooms around the player before it reaches them
+		if player_room_pos != self.awake_room_pos:
+			self.awake_room_pos = player_room_pos
+			self._update_awake_rooms(player_room_pos)
+
 		current_room = self.get_room_from_room_pos(player_room_pos)
 		if current_room is None:
 			return
@@ -233,9 +373,11 @@ class Level:
 			self.prev_player_room_pos = player_room_pos
 
 			current_room.entered()
+			self.entity_manager.events.publish(RoomEntered(current_room))
 		elif self.prev_player_room_pos != player_room_pos and 1 <= player_room_tile_pos[0] < current_room.n_cols - 1 and 1 <= player_room_tile_pos[1] < current_room.n_rows - 1:
 			current_room.entered()
 			self.get_room_from_room_pos(self.prev_player_room_pos).exited()
+			self.entity_manager.events.publish(RoomEntered(current_room))
 
 			self.prev_player_room_pos = player_room_pos
 
@@ -243,13 +385,63 @@ class Level:
 		self.get_room(player_pos).update(delta)  # Could replace with current room?
 
 	def draw_tile(self, layer: int, tile_pos: tuple[int, int], surface: pygame.Surface, camera: pygbase.Camera):
-		# room = self.get_room((pos[0] * TILE_SIZE, pos[1] * TILE_SIZE))
-		#
-		# if room is not None:
-		# 	room.draw_tile(level, pos, display, camera, with_offset=True)
-		tile = self.get_tile_at_tile_pos(tile_pos, layer)
-		if tile is not None:
-			tile.draw(surface, camera)
+		palette_id = self.tiles.get_id(layer, tile_pos[0], tile_pos[1])
+		if palette_id != EMPTY_ID:
+			# Placed with its bottomleft at the bottom of its tile
+			self._get_tile_type(palette_id).draw(surface, camera, (tile_pos[0] * TILE_SIZE, (tile_pos[1] + 1) * TILE_SIZE))
+
+	def _draw_tile_row(self, layer: int, row: int, start_col: int, end_col: int, batch: DrawBatch, camera: pygbase.Camera):
+		chunks = self.tiles.layers.get(layer)
+		if chunks is None:
+			return
+
+		chunk_row = row >> CHUNK_SHIFT
+		row_index = (row & CHUNK_MASK) << CHUNK_SHIFT
+		bottom = int((row + 1) * TILE_SIZE)
+
+		# Each chunk is only looked up once per row
+		for chunk_col in range(start_col >> CHUNK_SHIFT, ((end_col - 1) >> CHUNK_SHIFT) + 1):
+			chunk = chunks.get((chunk_col, chunk_row))
+			if chunk is None:
+				continue
+
+			ids = chunk.ids
+			for col in range(max(start_col, chunk_col << CHUNK_SHIFT), min(end_col, (chunk_col + 1) << CHUNK_SHIFT)):
+				palette_id = ids[row_index | (col & CHUNK_MASK)]
+				if palette_id != EMPTY_ID:
+					tile_type = self._get_tile_type(palette_id)
+					batch.add(tile_type.image.get_image(), camera.world_to_screen((int(col * TILE_SIZE), bottom - tile_type.height)))
+
+	def _draw_ground(self, surface: pygame.Surface, camera: pygbase.Camera):
+		# Most frames the camera moves a few pixels, the ground is kept around the view and only uncovered tiles are drawn
+		if self.ground_buffer is None:
+			self.ground_buffer = TileRingBuffer(self.tiles, self._get_tile_type, 0, surface.get_size())
+
+		self.ground_buffer.draw(surface, camera)
+
+	def _draw_rows(self, surface: pygame.Surface, camera: pygbase.Camera, top_left: tuple[int, int], bottom_right: tuple[int, int]):
+		# Merge the sorted entities with the tile rows, entities in a row are drawn over its tiles
+		render_queue = self.entity_manager.render_queue
+		entities = render_queue.entities
+		keys = render_queue.keys
+		num_entities = len(entities)
+		index = render_queue.get_row_start(top_left[1])
+
+		batch = self.draw_batch
+		for row in range(top_left[1], bottom_right[1]):
+			self._draw_tile_row(1, row, top_left[0], bottom_right[0], batch, camera)
+
+			while index < num_entities and keys[index][0] == row:
+				entity = entities[index]
+				if entity.visible and not entity.draw_batched(batch, camera):
+					# Drawn straight to the surface, after everything before it
+					batch.flush(surface)
+					entity.draw(surface, camera)
+					batch.num_direct += 1
+
+				index += 1
+
+		batch.flush(surface)
 
 	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
 		top_left = get_tile_pos(camera.pos, (TILE_SIZE, TILE_SIZE))
@@ -257,32 +449,46 @@ class Level:
 		top_left = top_left[0], top_left[1]
 		bottom_right = bottom_right[0] + 2, bottom_right[1] + 2
 
-		for layer in range(0, 3):
-			for row in range(top_left[1], bottom_right[1]):
-				for col in range(top_left[0], bottom_right[0]):
-					self.draw_tile(layer, (col, row), surface, camera)
+		self._draw_ground(surface, camera)
+		self.lighting_manager.draw_shadows(surface, camera)
 
-				if layer == 1:
-					entities = self.entity_manager.get_entities(row)
-					for entity in entities:
-						if entity.visible:
-							entity.draw(surface, camera)
+		self.draw_batch.reset_stats()
+		self._draw_rows(surface, camera, top_left, bottom_right)
 
-			if layer == 0:
-				self.lighting_manager.draw_shadows(surface, camera)
+		self.chunk_cache.draw(2, surface, camera, top_left, bottom_right)
 
 		self.lighting_manager.draw_lights(surface, camera)
 
 
 class LevelGenerator:
-	def __init__(self, depth: int, entity_manager: EntityManager, room_separation: int, wall_gap_radius: int):
+	def __init__(
+			self,
+			depth: int,
+			entity_manager: EntityManager | None,
+			room_separation: int,
+			wall_gap_radius: int,
+			seed: int | None = None,
+			use_cache: bool = True,
+			sprite_sheet_lengths: dict[str, int] | None = None,
+			headless: bool = False
+	):
+		"""
+		:param seed: Levels with the same seed and room data are identical, random if None
+		:param use_cache: Load and save the level in the level cache. Only used with an explicit seed, random seeds are not worth caching
+		"""
+
 		self.depth: int = depth
 		self.entity_manager = entity_manager
 		self.room_separation = room_separation
 		self.wall_gap_radius = wall_gap_radius
 
+		self.seed: int = seed if seed is not None else random.randrange(1 << 32)
+		self.random = random.Random(f"{self.seed}:layout")
+
+		self.use_cache = use_cache and seed is not None and not headless
+
 		# Room data
-		self.rooms: dict[str, dict] = {}
+		self.rooms: dict[str, RoomTemplate] = {}
 		self.room_names: list[str] = []
 		self._load_room_data()
 
@@ -304,28 +510,34 @@ class LevelGenerator:
 		self.generated_rooms: dict[tuple[int, int], str] = {}  # {room_pos: room_name}
 
 		# Level
-		self.level = Level(self.entity_manager, self.room_separation, self.wall_gap_radius)
+		self.level = Level(self.entity_manager, self.room_separation, self.wall_gap_radius, seed=self.seed, sprite_sheet_lengths=sprite_sheet_lengths, headless=headless)
+
+		# Incremental generation
+		self._generation_steps: Generator[tuple[str, float], None, None] | None = None
+		self.done = False
+
+		self.stage = ""
+		self.progress = 0.0
+		self.stage_times: dict[str, float] = {}  # {stage: seconds spent}
+		self.stage_steps: dict[str, int] = {}  # {stage: frames worked on}
 
 	def _load_room_data(self):
-		for _, _, file_names in os.walk(ROOM_DIR):
-			for file_name in file_names:
-				name = file_name[:-5]  # Remove .json
+		for name in RoomTemplates.get_names():  # Sorted so room choices only depend on the seed
+			room_template = RoomTemplates.get(name)
 
-				# Ensure only rooms of correct size
-				with open(ROOM_DIR / file_name) as room_file:
-					room_data = json.load(room_file)
-					if room_data["rows"] > self.room_separation or room_data["cols"] > self.room_separation:
-						continue
+			# Ensure only rooms of correct size
+			if room_template.n_rows > self.room_separation or room_template.n_cols > self.room_separation:
+				continue
 
-					self.rooms[name] = room_data
+			self.rooms[name] = room_template
 
-				# Ignore special rooms
-				if name not in ("lobby", "start", "start2"):
-					self.room_names.append(name)
+			# Ignore special rooms
+			if name not in ("lobby", "start", "start2"):
+				self.room_names.append(name)
 
 	def _load_battle_data(self):
 		for _, _, file_names in os.walk(BATTLE_DIR):
-			for file_name in file_names:
+			for file_name in sorted(file_names):
 				name = file_name[:-5]  # Remove .json
 
 				self.battle_names.append(name)
@@ -377,6 +589,8 @@ class LevelGenerator:
 			self._add_connection((0, 0), direction)
 
 		while len(self.room_queue) > 0:
+			yield 0.0
+
 			# Get room info, and move to end of queue
 			room_info = self.room_queue.popleft()
 			room_pos = room_info[0]
@@ -397,9 +611,9 @@ class LevelGenerator:
 				continue
 
 			# Have a chance to spread, with the end trying to decrease the change the further the room
-			if random.random() < 0.85 - room_depth * (1 / self.depth) * 0.5:
+			if self.random.random() < 0.85 - room_depth * (1 / self.depth) * 0.5:
 				# Find direction to spread
-				direction = random.choice(available_directions)
+				direction = self.random.choice(available_directions)
 				new_pos = room_pos[0] + direction[0], room_pos[1] + direction[1]
 
 				self.rooms_to_generate.add(new_pos)
@@ -413,8 +627,8 @@ class LevelGenerator:
 
 	def _generate_rooms_from_graph(self):
 		rooms_added = set()
-		for room_pos in self.rooms_to_generate:
-			room_name = random.choice(self.room_names) if room_pos != (0, 0) else "start2"
+		for index, room_pos in enumerate(self.rooms_to_generate):
+			room_name = self.random.choice(self.room_names) if room_pos != (0, 0) else "start2"
 
 			room_connections = self._get_connections(room_pos)
 
@@ -427,7 +641,7 @@ class LevelGenerator:
 				self.level.add_room_ex(
 					room_pos, room_name,
 					room_connections,
-					random.choice(self.battle_names),
+					self.random.choice(self.battle_names),
 					self.rooms[room_name]
 				)
 			else:
@@ -440,6 +654,8 @@ class LevelGenerator:
 
 			self.generated_rooms[room_pos] = room_name
 
+			yield (index + 1) / len(self.rooms_to_generate)
+
 	def _generate_hallway_graph(self):
 		"""
 		Processes the connection_data graph to be one dimensional
@@ -452,6 +668,8 @@ class LevelGenerator:
 		self.visited_connections.add(connection_graph_start)
 
 		while len(connection_graph_queue) > 0:
+			yield 0.0
+
 			current = connection_graph_queue.popleft()
 
 			for connection in self.connection_data[current]:
@@ -462,7 +680,7 @@ class LevelGenerator:
 					connection_graph_queue.append(connection)
 
 	def _generate_hallways_from_graph(self):
-		for room_pos, connections in self.hallway_connections.items():
+		for index, (room_pos, connections) in enumerate(self.hallway_connections.items()):
 			for connection in connections:
 				self.level.add_hallway(
 					room_pos,
@@ -471,14 +689,117 @@ class LevelGenerator:
 					self.level.get_room_from_room_pos(connection)
 				)
 
-	# TODO: Redo generation to be over multiple frames
-	def generate_level(self) -> Level:
-		self._generate_room_graph()
-		self._generate_rooms_from_graph()
-
-		self._generate_hallway_graph()
-		self._generate_hallways_from_graph()
+			yield (index + 1) / len(self.hallway_connections)
 
+	def _collect_garbage(self):
 		gc.collect()
 
+		yield 1.0
+
+	def generate_level_steps(self) -> Generator[tuple[str, float], None, None]:
+		"""
+		Generates the level in small steps
+
+		:return: Generator of (stage, overall progress) after each step
+		"""
+
+		# (stage name, stage, share of total progress)
+		stages = (
+			("room graph", self._generate_room_graph, 0.05),
+			("rooms", self._generate_rooms_from_graph, 0.6),
+			("hallway graph", self._generate_hallway_graph, 0.05),
+			("hallways", self._generate_hallways_from_graph, 0.25),
+			("cleanup", self._collect_garbage, 0.05)
+		)
+
+		completed = 0.0
+		for stage_name, stage, share in stages:
+			for stage_progress in stage():
+				yield stage_name, completed + stage_progress * share
+
+			completed += share
+			yield stage_name, completed
+
+	def step(self, time_budget: float) -> bool:
+		"""
+		Continues generation until the time budget is used up
+
+		:param time_budget: Seconds allowed for this step
+		:return: True once the level is fully generated
+		"""
+
+		if self.done:
+			return True
+
+		if self._generation_steps is None:
+			if self.use_cache and self._load_cached_level():
+				self.done = True
+				self.progress = 1.0
+				return True
+
+			self._generation_steps = self.generate_level_steps()
+
+		start_time = time.perf_counter()
+		prev_time = start_time
+		stages_worked_on = set()
+
+		while True:
+			next_step = next(self._generation_steps, None)
+			current_time = time.perf_counter()
+
+			if next_step is None:
+				self.done = True
+				self._log_stage_time(self.stage)
+				logging.info(f"Level generated in {sum(self.stage_times.values()) * 1000:.1f} ms")
+
+				if self.use_cache:
+					LevelCache.save(self.get_cache_key(), self.level.get_level_data())
+				break
+
+			stage, self.progress = next_step
+
+			self.stage_times[stage] = self.stage_times.get(stage, 0.0) + current_time - prev_time
+			if stage not in stages_worked_on:
+				stages_worked_on.add(stage)
+				self.stage_steps[stage] = self.stage_steps.get(stage, 0) + 1
+
+			if stage != self.stage:
+				self._log_stage_time(self.stage)
+				self.stage = stage
+
+			prev_time = current_time
+			if current_time - start_time >= time_budget:
+				break
+
+		return self.done
+
+	def get_cache_key(self) -> str:
+		sprite_sheet_lengths = {sprite_sheet_name: self.level.get_sprite_sheet_length(sprite_sheet_name) for sprite_sheet_name in TILE_SPRITE_SHEETS}
+
+		return LevelCache.get_key(self.seed, self.depth, self.room_separation, self.wall_gap_radius, sprite_sheet_lengths)
+
+	def _load_cached_level(self) -> bool:
+		"""
+		:return: True if the level was loaded from the cache
+		"""
+
+		start_time = time.perf_counter()
+
+		level_data = LevelCache.load(self.get_cache_key())
+		if level_data is None:
+			return False
+
+		self.level = Level.from_level_data(level_data, self.entity_manager)
+
+		logging.info(f"Level loaded from cache in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+		return True
+
+	def _log_stage_time(self, stage: str):
+		if stage in self.stage_times:
+			logging.info(f"Level generation stage \"{stage}\" took {self.stage_times[stage] * 1000:.1f} ms over {self.stage_steps[stage]} frames")
+
+	def generate_level(self) -> Level:
+		while not self.step(float("inf")):
+			pass
+
 		return self.level
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import os
+
+from data.modules.base.paths import ROOM_DIR, BATTLE_DIR, LEVEL_CACHE_DIR
+
+LEVEL_CACHE_VERSION = 2  # Bump when the level data format or generation changes
+MAX_CACHED_LEVELS = 16
+
+TILE_SPRITE_SHEETS = ("tiles", "walls")
+
+
+class LevelCache:
+	"""
+	Generated levels stored on disk as Level.get_level_data buffers.
+	Keys cover everything generation depends on, so a level made from old room data is never loaded.
+	"""
+
+	@classmethod
+	def get_catalog_hash(cls) -> str:
+		"""
+		:return: Hash of the room and battle files levels are generated from
+		"""
+
+		catalog_hash = hashlib.sha1()
+
+		for directory in (ROOM_DIR, BATTLE_DIR):
+			for file_name in sorted(os.listdir(directory)):
+				catalog_hash.update(file_name.encode())
+
+				with open(directory / file_name, "rb") as file:
+					catalog_hash.update(file.read())
+
+		return catalog_hash.hexdigest()
+
+	@classmethod
+	def get_key(cls, seed: int, depth: int, room_separation: int, wall_gap_radius: int, sprite_sheet_lengths: dict[str, int]) -> str:
+		settings = (
+			LEVEL_CACHE_VERSION,
+			seed, depth, room_separation, wall_gap_radius,
+			tuple(sorted(sprite_sheet_lengths.items())),
+			cls.get_catalog_hash()
+		)
+
+		return hashlib.sha1(repr(settings).encode()).hexdigest()
+
+	@classmethod
+	def load(cls, key: str) -> bytes | None:
+		path = LEVEL_CACHE_DIR / f"{key}.level"
+		if not path.is_file():
+			return None
+
+		with open(path, "rb") as file:
+			level_data = file.read()
+
+		os.utime(path)  # Mark as recently used
+		logging.info(f"Loaded level {key} from cache")
+
+		return level_data
+
+	@classmethod
+	def save(cls, key: str, level_data: bytes):
+		LEVEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+		# Write then rename, so a level being saved by another process is never read half written
+		path = LEVEL_CACHE_DIR / f"{key}.level"
+		temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+		with open(temp_path, "wb") as file:
+			file.write(level_data)
+		os.replace(temp_path, path)
+
+		cls._evict()
+
+	@classmethod
+	def _evict(cls):
+		"""
+		Removes the least recently used levels over MAX_CACHED_LEVELS
+		"""
+
+		paths = sorted(LEVEL_CACHE_DIR.glob("*.level"), key=lambda level_path: level_path.stat().st_mtime, reverse=True)
+
+		for path in paths[MAX_CACHED_LEVELS:]:
+			path.unlink(missing_ok=True)
@@ -0,0 +1,111 @@
+import logging
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor, Future
+
+import pygbase
+
+from data.modules.entities.entity_manager import EntityManager
+from data.modules.level.level import Level, LevelGenerator
+from data.modules.level.level_cache import LevelCache, TILE_SPRITE_SHEETS
+
+
+def generate_level_data(seed: int, depth: int, room_separation: int, wall_gap_radius: int, sprite_sheet_lengths: dict[str, int], use_cache: bool) -> bytes:
+	"""
+	Generates a level without objects or resources, run in a worker process
+
+	:return: Buffer for Level.from_level_data
+	"""
+
+	if use_cache:
+		cache_key = LevelCache.get_key(seed, depth, room_separation, wall_gap_radius, sprite_sheet_lengths)
+
+		level_data = LevelCache.load(cache_key)
+		if level_data is not None:
+			return level_data
+
+	level_generator = LevelGenerator(depth, None, room_separation, wall_gap_radius, seed=seed, sprite_sheet_lengths=sprite_sheet_lengths, headless=True)
+	level_data = level_generator.generate_level().get_level_data()
+
+	if use_cache:
+		LevelCache.save(cache_key, level_data)
+
+	return level_data
+
+
+class LevelPregenerator:
+	"""
+	Generates the next level in a worker process while the player is idle.
+	The result is only attached to the game once it is asked for, so an unfinished level is never waited on.
+	One worker process is shared by the whole app, and a level nobody took is kept for the next lobby that asks for the same kind.
+	"""
+
+	# Started with the first pregenerated level, stopped by shutdown when the app closes
+	_executor: ProcessPoolExecutor | None = None
+
+	_future: Future[bytes] | None = None
+	_future_args: tuple[int, int, int, int | None] | None = None  # (depth, room_separation, wall_gap_radius, seed) of _future
+
+	@classmethod
+	def start(cls, depth: int, room_separation: int, wall_gap_radius: int, seed: int | None = None):
+		"""
+		Starts generating a level, unless one with the same arguments is already generating or waiting to be taken
+
+		:param seed: Seed of the level, random if None. Levels are only cached with an explicit seed
+		"""
+
+		args = depth, room_separation, wall_gap_radius, seed
+		if cls._future is not None:
+			failed = cls._future.done() and (cls._future.cancelled() or cls._future.exception() is not None)
+			if args == cls._future_args and not failed:
+				return
+
+			cls._future.cancel()
+
+		if cls._executor is None:
+			# Spawn instead of fork, so the worker does not inherit the display
+			cls._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+		sprite_sheet_lengths = {
+			sprite_sheet_name: pygbase.Resources.get_resource("sprite_sheets", sprite_sheet_name).length
+			for sprite_sheet_name in TILE_SPRITE_SHEETS
+		}
+
+		use_cache = seed is not None
+		level_seed = seed if seed is not None else random.randrange(1 << 32)
+
+		cls._future = cls._executor.submit(generate_level_data, level_seed, depth, room_separation, wall_gap_radius, sprite_sheet_lengths, use_cache)
+		cls._future_args = args
+
+	@classmethod
+	def get_level(cls, entity_manager: EntityManager) -> Level | None:
+		"""
+		Takes the pregenerated level, the next call to start generates a new one
+
+		:return: The pregenerated level, or None if the worker has not finished or failed
+		"""
+
+		future = cls._future
+		if future is None or not future.done() or future.cancelled():
+			return None
+
+		cls._future = None
+		cls._future_args = None
+
+		exception = future.exception()
+		if exception is not None:
+			logging.warning(f"Level pregeneration failed: {exception!r}")
+			return None
+
+		return Level.from_level_data(future.result(), entity_manager)
+
+	@classmethod
+	def shutdown(cls):
+		if cls._future is not None:
+			cls._future.cancel()
+			cls._future = None
+			cls._future_args = None
+
+		if cls._executor is not None:
+			cls._executor.shutdown(wait=False, cancel_futures=True)
+			cls._executor = None
@@ -1,18 +1,16 @@
 import json
 import logging
-import os
-import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Hashable
 
 import pygame
 import pygbase
 
 from data.modules.base.constants import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
-from data.modules.base.paths import ROOM_DIR
 from data.modules.base.utils import one_if_even, get_tile_pos
 from data.modules.entities.entity_manager import EntityManager
 from data.modules.level.battle import Battle
-from data.modules.level.tile import Tile
+from data.modules.level.room_templates import RoomTemplates
+from data.modules.level.tile import Tile, TileType
 from data.modules.objects.game_object import GameObject
 from data.modules.objects.object_loader import ObjectLoader
 
@@ -21,8 +19,13 @@ if TYPE_CHECKING:
 
 
 class BaseRoom:
-	def __init__(self, name: str, entity_manager: EntityManager, n_rows: int, n_cols: int, offset: tuple = (0, 0)):
+	def __init__(self, name: str, entity_manager: EntityManager, n_rows: int, n_cols: int, offset: tuple = (0, 0), zone: Hashable | None = None):
+		"""
+		:param zone: Entity manager zone of the room objects, None to keep them always awake
+		"""
+
 		self.name = name
+		self.zone = zone
 
 		self.n_rows = n_rows
 		self.n_cols = n_cols
@@ -52,7 +55,7 @@ class BaseRoom:
 		return None
 
 	def add_object(self, game_object: GameObject, tags: tuple[str, ...]):
-		self.entity_manager.add_entity(game_object, tags=tags)
+		self.entity_manager.add_entity(game_object, tags=tags, zone=self.zone)
 		self.objects.append(game_object)
 
 	def remove_object(self, game_object: GameObject):
@@ -67,8 +70,8 @@ class BaseRoom:
 
 
 class LevelRoom(BaseRoom):
-	def __init__(self, name: str, entity_manager: EntityManager, level: "Level", n_rows: int = 10, n_cols: int = 10, offset: tuple = (0, 0)):
-		super().__init__(name, entity_manager, n_rows, n_cols, offset)
+	def __init__(self, name: str, entity_manager: EntityManager, level: "Level", n_rows: int = 10, n_cols: int = 10, offset: tuple = (0, 0), zone: Hashable | None = None):
+		super().__init__(name, entity_manager, n_rows, n_cols, offset, zone)
 
 		self.level: "Level" = level
 
@@ -81,6 +84,9 @@ class LevelRoom(BaseRoom):
 	def add_tile(self, layer: int, tile_pos: tuple[int, int], tile: Tile):
 		self.level.add_tile(layer, (tile_pos[0] + self.tile_offset[0], tile_pos[1] + self.tile_offset[1]), tile)
 
+	def set_tile(self, layer: int, tile_pos: tuple[int, int], sprite_sheet_name: str, image_index: int):
+		self.level.set_tile(layer, (tile_pos[0] + self.tile_offset[0], tile_pos[1] + self.tile_offset[1]), sprite_sheet_name, image_index)
+
 	def remove_tile(self, layer: int, tile_pos: tuple[int, int]):
 		self.level.remove_tile(layer, (tile_pos[0] + self.tile_offset[0], tile_pos[1] + self.tile_offset[1]))
 
@@ -96,22 +102,22 @@ class Room(LevelRoom):
 			n_rows: int = 10, n_cols: int = 10,
 			offset: tuple = (0, 0),
 			connections=(False, False, False, False),
-			random_floor=True
+			random_floor=True,
+			zone: Hashable | None = None
 	):
 		self.connections = connections
 		self.random_floor = random_floor
 		self.gap_radius = gap_radius
 
-		super().__init__(name, entity_manager, level, n_rows, n_cols, offset)
+		super().__init__(name, entity_manager, level, n_rows, n_cols, offset, zone)
 
 		self.battle_in_progress = False
+		self.battle_name = battle_name
 		self.battle = Battle(battle_name, level, self, self.entity_manager) if battle_name != "" else None
 
 		self.hallway_connection_tiles: list[tuple[int, int]] = []
 
-		self.save_path = ROOM_DIR / f"{name}.json"
-		if not os.path.isfile(self.save_path):
-			raise ValueError(f"Room not found at: {self.save_path}")
+		self.template = RoomTemplates.get(name)
 
 		self.left_hallway_pos: tuple[int, int] | None = None
 		self.right_hallway_pos: tuple[int, int] | None = None
@@ -119,21 +125,30 @@ class Room(LevelRoom):
 		self.bottom_hallway_pos: tuple[int, int] | None = None
 
 	def populate_tiles(self):
-		self.load()
+		self.load(load_objects=not self.level.headless)
 
 		if self.random_floor:
 			self.generate_floor()
 
 		self.generate_walls(self.connections)
 
-	def generate_walls(self, connections):
+	def populate_objects(self):
 		"""
-		Generates walls with gaps
+		Loads the objects and hallway connections of a room whose tiles are already in the level
+		"""
+
+		self.load(load_tiles=False)
+
+		self._setup_hallway_connections(self.connections)
+
+	def _setup_hallway_connections(self, connections):
+		"""
+		Finds the hallway positions and the wall tiles left open for hallways
 
 		:param connections: Up, Down, Left, Right
 		"""
 
-		wall_sheet = pygbase.Resources.get_resource("sprite_sheets", "walls")
+		self.hallway_connection_tiles = []
 
 		# Horizontal
 		y_mid_point = self.n_rows // 2 - one_if_even(self.n_rows)  # Slightly different midpoints for odd vs even sized rooms
@@ -147,53 +162,12 @@ class Room(LevelRoom):
 			y_mid_point - self.gap_radius + self.tile_offset[1]
 		)
 
-		# Left and Right
-		for row in range(self.n_rows):
+		for row in range(y_mid_point - self.gap_radius, y_mid_point + self.gap_radius + 1):
 			if connections[2]:
-				if row < y_mid_point - self.gap_radius or row > y_mid_point + self.gap_radius:
-					self.add_tile(
-						1, (0, row),
-						Tile(
-							"walls",
-							random.randrange(0, wall_sheet.length),
-							(self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-						)
-					)
-				else:
-					self.remove_tile(1, (0, row))
-					self.hallway_connection_tiles.append((0, row))
-			else:
-				self.add_tile(
-					1, (0, row),
-					Tile(
-						"walls",
-						random.randrange(0, wall_sheet.length),
-						(self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-					)
-				)
+				self.hallway_connection_tiles.append((0, row))
 
 			if connections[3]:
-				if row < y_mid_point - self.gap_radius or row > y_mid_point + self.gap_radius:
-					self.add_tile(
-						1, (self.n_cols - 1, row),
-						Tile(
-							"walls",
-							random.randrange(0, wall_sheet.length),
-							((self.n_cols - 1) * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-						)
-					)
-				else:
-					self.remove_tile(1, (self.n_cols - 1, row))
-					self.hallway_connection_tiles.append((self.n_cols - 1, row))
-			else:
-				self.add_tile(
-					1, (self.n_cols - 1, row),
-					Tile(
-						"walls",
-						random.randrange(0, wall_sheet.length),
-						((self.n_cols - 1) * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-					)
-				)
+				self.hallway_connection_tiles.append((self.n_cols - 1, row))
 
 		# Vertical
 		x_mid_point = self.n_cols // 2 - one_if_even(self.n_cols)
@@ -207,102 +181,73 @@ class Room(LevelRoom):
 			self.n_rows - 1 + self.tile_offset[1]
 		)
 
-		# Top and bottom
-		for col in range(self.n_cols):
+		for col in range(x_mid_point - self.gap_radius, x_mid_point + self.gap_radius + 1):
 			if connections[0]:
-				if col < x_mid_point - self.gap_radius or col > x_mid_point + self.gap_radius:
-					self.add_tile(
-						1, (col, 0),
-						Tile(
-							"walls",
-							random.randrange(0, wall_sheet.length),
-							(col * TILE_SIZE + self.offset[0], TILE_SIZE + self.offset[1])
-						)
-					)
-				else:
-					self.remove_tile(1, (col, 0))
-					self.hallway_connection_tiles.append((col, 0))
-			else:
-				self.add_tile(
-					1, (col, 0),
-					Tile(
-						"walls",
-						random.randrange(0, wall_sheet.length),
-						(col * TILE_SIZE + self.offset[0], TILE_SIZE + self.offset[1])
-					)
-				)
+				self.hallway_connection_tiles.append((col, 0))
 
 			if connections[1]:
-				if col < x_mid_point - self.gap_radius or col > x_mid_point + self.gap_radius:
-					self.add_tile(
-						1, (col, self.n_rows - 1),
-						Tile(
-							"walls",
-							random.randrange(0, wall_sheet.length),
-							(col * TILE_SIZE + self.offset[0], self.n_rows * TILE_SIZE + self.offset[1])
-						)
-					)
+				self.hallway_connection_tiles.append((col, self.n_rows - 1))
+
+	def generate_walls(self, connections):
+		"""
+		Generates walls with gaps
+
+		:param connections: Up, Down, Left, Right
+		"""
+
+		self._setup_hallway_connections(connections)
+		gaps = set(self.hallway_connection_tiles)
+
+		walls_length = self.level.get_sprite_sheet_length("walls")
+
+		# Left and Right
+		for row in range(self.n_rows):
+			for tile_pos in ((0, row), (self.n_cols - 1, row)):
+				if tile_pos in gaps:
+					self.remove_tile(1, tile_pos)
+				else:
+					self.set_tile(1, tile_pos, "walls", self.level.tile_random.randrange(0, walls_length))
+
+		# Top and bottom
+		for col in range(self.n_cols):
+			for tile_pos in ((col, 0), (col, self.n_rows - 1)):
+				if tile_pos in gaps:
+					self.remove_tile(1, tile_pos)
 				else:
-					self.remove_tile(1, (col, self.n_rows - 1))
-					self.hallway_connection_tiles.append((col, self.n_rows - 1))
-
-			else:
-				self.add_tile(
-					1, (col, self.n_rows - 1),
-					Tile(
-						"walls",
-						random.randrange(0, wall_sheet.length),
-						(col * TILE_SIZE + self.offset[0], self.n_rows * TILE_SIZE + self.offset[1])
-					)
-				)
+					self.set_tile(1, tile_pos, "walls", self.level.tile_random.randrange(0, walls_length))
 
 	def generate_floor(self):
-		tiles_sheet = pygbase.Resources.get_resource("sprite_sheets", "tiles")
+		tiles_length = self.level.get_sprite_sheet_length("tiles")
 		for row in range(self.n_rows):
 			for col in range(self.n_cols):
-				self.add_tile(0, (col, row), Tile(
-					"tiles",
-					random.randrange(0, tiles_sheet.length),
-					(col * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-				))
-
-	def load(self):
-		with open(self.save_path) as file:
-			room_data: dict = json.load(file)
+				self.set_tile(0, (col, row), "tiles", self.level.tile_random.randrange(0, tiles_length))
 
-		self.n_rows = room_data["rows"]
-		self.n_cols = room_data["cols"]
+	def load(self, load_tiles: bool = True, load_objects: bool = True):
+		self.n_rows = self.template.n_rows
+		self.n_cols = self.template.n_cols
 
 		# self.tiles = generate_3d_list(3, self.n_rows, self.n_cols)
 
-		for layer, tiles in enumerate(room_data["tiles"]):
-			for tile in tiles:
-				row = tile["pos"][0] + self.offset[0]
-				col = tile["pos"][1] + self.offset[1]
-				self.add_tile(
-					layer, (col, row),
-					Tile(
-						tile["image_info"][0],
-						tile["image_info"][1],
-						(col * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-					)
-				)
+		if load_tiles:
+			for layer, tiles in enumerate(self.template.tiles):
+				for pos, image_info in tiles:
+					row = pos[0]
+					col = pos[1]
+					self.set_tile(layer, (col, row), image_info[0], image_info[1])
 
-		for object_data in room_data["objects"]:
-			object_name = object_data["name"]
-			pos = object_data["pos"]
+		if load_objects:
+			for object_name, pos in self.template.objects:
+				game_object, tags = ObjectLoader.create_object(object_name, (pos[0] + self.tile_offset[0], pos[1] + self.tile_offset[1]))
 
-			game_object, tags = ObjectLoader.create_object(object_name, (pos[0] + self.tile_offset[0], pos[1] + self.tile_offset[1]))
-
-			self.add_object(game_object, tags=tags)
+				self.add_object(game_object, tags=tags)
 
 	def is_valid_spawn(self, tile_pos: tuple[int, int]):
 		# TODO: Replace with a list of valid spawns that room tracks?
-		return not self.level.check_is_tile(1, (tile_pos[0] + self.offset[0], tile_pos[1] + self.offset[1]))
+		return not self.level.collision_grid.is_solid_at_tile(tile_pos[0] + self.tile_offset[0], tile_pos[1] + self.tile_offset[1])
 
 	def generate_spawn_pos(self) -> tuple[float, float]:
 		# Generate initial guess for spawn position
-		spawn_pos = random.randrange(1, self.n_cols - 1), random.randrange(1, self.n_rows - 1)
+		spawn_pos = self.level.spawn_random.randrange(1, self.n_cols - 1), self.level.spawn_random.randrange(1, self.n_rows - 1)
 		found = self.is_valid_spawn(spawn_pos)
 
 		directions = ((0, 1), (1, 0), (0, -1), (-1, 0))
@@ -321,13 +266,13 @@ class Room(LevelRoom):
 
 			step_size += 1
 
-		return (spawn_pos[0] + random.uniform(0.45, 0.55)) * TILE_SIZE + self.offset[0], (spawn_pos[1] + random.uniform(0.5, 0.7)) * TILE_SIZE + self.offset[1]
+		return (spawn_pos[0] + self.level.spawn_random.uniform(0.45, 0.55)) * TILE_SIZE + self.offset[0], (spawn_pos[1] + self.level.spawn_random.uniform(0.5, 0.7)) * TILE_SIZE + self.offset[1]
 
 	def activate_walls(self):
-		wall_sheet = pygbase.Resources.get_resource("sprite_sheets", "walls")
+		walls_length = self.level.get_sprite_sheet_length("walls")
 
 		for tile_pos in self.hallway_connection_tiles:
-			self.add_tile(1, tile_pos, Tile("walls", random.randrange(0, wall_sheet.length), (tile_pos[0] * TILE_SIZE + self.offset[0], (tile_pos[1] + 1) * TILE_SIZE + self.offset[1])))
+			self.set_tile(1, tile_pos, "walls", self.level.tile_random.randrange(0, walls_length))
 
 	def deactivate_walls(self):
 		for tile_pos in self.hallway_connection_tiles:
@@ -364,11 +309,12 @@ class EditorRoom(BaseRoom):
 		super().__init__(name, entity_manager, n_rows, n_cols)
 
 		# layer[0: Ground, 1: Player | Walls, 2: Above]
-		self.tiles: dict[int, dict[tuple[int, int], Tile]] = {}
+		# Only the shared tile type is stored, positions come from the tile position
+		self.tiles: dict[int, dict[tuple[int, int], TileType]] = {}
 
 		# New room
-		self.save_path = os.path.join(ROOM_DIR, f"{name}.json")
-		if not os.path.isfile(self.save_path):
+		self.save_path = RoomTemplates.get_path(name)
+		if not RoomTemplates.exists(name):
 			logging.debug("Creating new editor room")
 		else:
 			self.load()
@@ -381,7 +327,8 @@ class EditorRoom(BaseRoom):
 			pos = pos[0] - self.tile_offset[0], pos[1] - self.tile_offset[1]
 
 		if self.check_is_tile(layer, pos):
-			return self.tiles[layer][pos]
+			tile_type = self.tiles[layer][pos]
+			return Tile(tile_type.sprite_sheet_name, tile_type.image_index, (pos[0] * TILE_SIZE, (pos[1] + 1) * TILE_SIZE))
 
 		return None
 
@@ -389,7 +336,7 @@ class EditorRoom(BaseRoom):
 		assert tile is not None
 
 		if self.check_bounds(pos):
-			self.tiles.setdefault(layer, {})[pos] = tile
+			self.tiles.setdefault(layer, {})[pos] = tile.tile_type
 
 	def remove_tile(self, layer: int, pos: tuple[int, int]):
 		if self.check_is_tile(layer, pos):
@@ -399,24 +346,21 @@ class EditorRoom(BaseRoom):
 				del self.tiles[layer]
 
 	def load(self):
-		with open(self.save_path) as file:
-			room_data: dict = json.load(file)
+		room_template = RoomTemplates.get(self.name)
 
-		self.n_rows = room_data["rows"]
-		self.n_cols = room_data["cols"]
+		self.n_rows = room_template.n_rows
+		self.n_cols = room_template.n_cols
 
 		# self.tiles = generate_3d_list(3, self.n_rows, self.n_cols)
 
-		for level, tiles in enumerate(room_data["tiles"]):
-			for tile in tiles:
-				row = tile["pos"][0]
-				col = tile["pos"][1]
-				self.add_tile(level, (col, row), Tile(tile["image_info"][0], tile["image_info"][1], (col * TILE_SIZE, (row + 1) * TILE_SIZE)))
-
-		for game_object in room_data["objects"]:
-			object_type = game_object["name"]
-			pos = game_object["pos"]
+		for level, tiles in enumerate(room_template.tiles):
+			for pos, image_info in tiles:
+				row = pos[0]
+				col = pos[1]
+				if self.check_bounds((col, row)):
+					self.tiles.setdefault(level, {})[(col, row)] = TileType.get(image_info[0], image_info[1])
 
+		for object_type, pos in room_template.objects:
 			game_object, tags = ObjectLoader.create_object(object_type, pos)
 			self.add_object(game_object, tags)
 
@@ -429,10 +373,10 @@ class EditorRoom(BaseRoom):
 		}
 
 		for level, level_data in self.tiles.items():
-			for pos, tile in level_data.items():
+			for pos, tile_type in level_data.items():
 				tile_data = {
 					"pos": pos,
-					"image_info": [tile.sprite_sheet_name, tile.image_index],
+					"image_info": [tile_type.sprite_sheet_name, tile_type.image_index],
 				}
 				data["tiles"][level].append(tile_data)
 
@@ -445,6 +389,8 @@ class EditorRoom(BaseRoom):
 		with open(self.save_path, "w") as file:
 			file.write(json.dumps(data))
 
+		RoomTemplates.invalidate(self.name)
+
 		logging.info("Level Saved")
 
 	def draw_tile(self, layer: int, pos: tuple[int, int], display: pygame.Surface, camera: pygbase.Camera, with_offset: bool = False):
@@ -453,7 +399,7 @@ class EditorRoom(BaseRoom):
 
 		# print(pos, self.check_is_tile(layer, pos), self.get_tile(layer, pos))
 		if self.check_is_tile(layer, pos):
-			self.get_tile(layer, pos, with_offset=False).draw(display, camera)
+			self.tiles[layer][pos].draw(display, camera, (pos[0] * TILE_SIZE, (pos[1] + 1) * TILE_SIZE))
 
 	def draw_room_to_surface(self, surface: pygame.Surface):
 		surface_size = surface.get_size()
@@ -497,34 +443,20 @@ class Hallway(LevelRoom):
 		self.create()
 
 	def create(self):
-		tiles_sheet = pygbase.Resources.get_resource("sprite_sheets", "tiles")
-		walls_sheet = pygbase.Resources.get_resource("sprite_sheets", "walls")
+		tiles_length = self.level.get_sprite_sheet_length("tiles")
+		walls_length = self.level.get_sprite_sheet_length("walls")
 
 		if self.horizontal:
 			# Create floor
 			for row in range(self.n_rows - 2):
 				row = row + 1
 				for col in range(self.n_cols):
-					self.add_tile(0, (col, row), Tile(
-						"tiles",
-						random.randrange(0, tiles_sheet.length),
-						(col * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-					))
+					self.set_tile(0, (col, row), "tiles", self.level.tile_random.randrange(0, tiles_length))
 
 			# Create walls
 			for col in range(self.n_cols):
-				self.add_tile(1, (col, 0), Tile(
-					"walls",
-					random.randrange(0, walls_sheet.length),
-					(col * TILE_SIZE + self.offset[0], TILE_SIZE + self.offset[1])
-				))
-
-				self.add_tile(1, (col, self.n_rows - 1), Tile(
-					"walls",
-					random.randrange(0, walls_sheet.length),
-					(col * TILE_SIZE + self.offset[0], self.n_rows * TILE_SIZE + self.offset[1])
-				))
-
+				self.set_tile(1, (col, 0), "walls", self.level.tile_random.randrange(0, walls_length))
+				self.set_tile(1, (col, self.n_rows - 1), "walls", self.level.tile_random.randrange(0, walls_length))
 
 		else:
 			# Create floor
@@ -532,22 +464,9 @@ class Hallway(LevelRoom):
 				for col in range(self.n_cols - 2):
 					col = col + 1
 
-					self.add_tile(0, (col, row), Tile(
-						"tiles",
-						random.randrange(0, tiles_sheet.length),
-						(col * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-					))
+					self.set_tile(0, (col, row), "tiles", self.level.tile_random.randrange(0, tiles_length))
 
 			# Create walls
 			for row in range(self.n_rows):
-				self.add_tile(1, (0, row), Tile(
-					"walls",
-					random.randrange(0, walls_sheet.length),
-					(self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-				))
-
-				self.add_tile(1, (self.n_cols - 1, row), Tile(
-					"walls",
-					random.randrange(0, walls_sheet.length),
-					((self.n_cols - 1) * TILE_SIZE + self.offset[0], (row + 1) * TILE_SIZE + self.offset[1])
-				))
+				self.set_tile(1, (0, row), "walls", self.level.tile_random.randrange(0, walls_length))
+				self.set_tile(1, (self.n_cols - 1, row), "walls", self.level.tile_random.randrange(0, walls_length))
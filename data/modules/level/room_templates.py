@@ -0,0 +1,91 @@
+import json
+import logging
+import os
+import pathlib
+
+from data.modules.base.paths import ROOM_DIR
+
+
+class RoomTemplate:
+	"""
+	Parsed room file, shared by every room made from it, so it is read only
+	"""
+
+	__slots__ = ("name", "n_rows", "n_cols", "tiles", "objects")
+
+	def __init__(self, name: str, room_data: dict):
+		self.name: str = name
+
+		self.n_rows: int = room_data["rows"]
+		self.n_cols: int = room_data["cols"]
+
+		# Per layer: ((pos, (sprite_sheet_name, image_index)), ...), with pos as stored in the file
+		self.tiles: tuple[tuple[tuple[tuple[int, int], tuple[str, int]], ...], ...] = tuple(
+			tuple((tuple(tile["pos"]), tuple(tile["image_info"])) for tile in tiles)
+			for tiles in room_data["tiles"]
+		)
+
+		# ((object_name, tile_pos), ...)
+		self.objects: tuple[tuple[str, tuple[int, int]], ...] = tuple(
+			(object_data["name"], tuple(object_data["pos"]))
+			for object_data in room_data["objects"]
+		)
+
+
+class RoomTemplates:
+	"""
+	Process wide cache of parsed room files.
+	Each file is parsed once, and again only when its modification time or size changes.
+	"""
+
+	# {room_name: ((mtime_ns, size), template)}
+	_templates: dict[str, tuple[tuple[int, int], RoomTemplate]] = {}
+
+	num_parses: int = 0
+
+	@classmethod
+	def get_path(cls, room_name: str) -> pathlib.Path:
+		return ROOM_DIR / f"{room_name}.json"
+
+	@classmethod
+	def get_names(cls) -> list[str]:
+		return sorted(file_name[:-5] for file_name in os.listdir(ROOM_DIR) if file_name.endswith(".json"))
+
+	@classmethod
+	def exists(cls, room_name: str) -> bool:
+		return cls.get_path(room_name).is_file()
+
+	@classmethod
+	def get(cls, room_name: str) -> RoomTemplate:
+		path = cls.get_path(room_name)
+
+		try:
+			stat = os.stat(path)
+		except FileNotFoundError:
+			raise ValueError(f"Room not found at: {path}") from None
+
+		file_version = stat.st_mtime_ns, stat.st_size
+
+		cached = cls._templates.get(room_name)
+		if cached is not None and cached[0] == file_version:
+			return cached[1]
+
+		with open(path) as file:
+			room_template = RoomTemplate(room_name, json.load(file))
+
+		cls._templates[room_name] = file_version, room_template
+		cls.num_parses += 1
+
+		logging.debug(f"Parsed room template \"{room_name}\"")
+		return room_template
+
+	@classmethod
+	def invalidate(cls, room_name: str | None = None):
+		"""
+		:param room_name: Room to parse again on next use, or None for all rooms
+		"""
+
+		if room_name is None:
+			cls._templates.clear()
+		else:
+			cls._templates.pop(room_name, None)
@@ -3,13 +3,79 @@ from pygbase import Resources, Camera
 from pygbase.graphics.image import Image
 
 
-class Tile:
-	def __init__(self, sprite_sheet_name: str, image_index: int, pos: tuple | pygame.Vector2):
+class TileType:
+	"""
+	Image data shared by every tile with the same sprite sheet and image index.
+	Interned, so get returns the same object for the same pair.
+	"""
+
+	__slots__ = ("sprite_sheet_name", "image_index", "image", "height")
+
+	_tile_types: dict[tuple[str, int], "TileType"] = {}
+
+	def __init__(self, sprite_sheet_name: str, image_index: int):
 		self.sprite_sheet_name = sprite_sheet_name
 		self.image_index = image_index
 
 		self.image: Image = Resources.get_resource("sprite_sheets", sprite_sheet_name).get_image(image_index)
-		self.rect: pygame.Rect = self.image.get_image().get_rect(bottomleft=pos)
+		self.height: int = self.image.get_image().get_height()
+
+	@classmethod
+	def get(cls, sprite_sheet_name: str, image_index: int) -> "TileType":
+		key = sprite_sheet_name, image_index
+
+		tile_type = cls._tile_types.get(key)
+		if tile_type is None:
+			tile_type = cls._tile_types[key] = cls(sprite_sheet_name, image_index)
+
+		return tile_type
+
+	def get_top_left(self, pos: tuple | pygame.Vector2) -> tuple[int, int]:
+		"""
+		:param pos: Bottom left of the tile in pixels
+		:return: Top left of the image, the same as its rect would have
+		"""
+
+		return int(pos[0]), int(pos[1]) - self.height
+
+	def draw(self, surface: pygame.Surface, camera: Camera, pos: tuple | pygame.Vector2, flag: int = 0):
+		"""
+		:param pos: Bottom left of the tile in pixels
+		"""
+
+		self.image.draw(surface, camera.world_to_screen(self.get_top_left(pos)), flags=flag)
+
+
+class Tile:
+	"""
+	A placed tile. Only the position is stored per tile, the image comes from its TileType
+	"""
+
+	__slots__ = ("tile_type", "pos")
+
+	def __init__(self, sprite_sheet_name: str, image_index: int, pos: tuple | pygame.Vector2):
+		"""
+		:param pos: Bottom left of the tile in pixels
+		"""
+
+		self.tile_type = TileType.get(sprite_sheet_name, image_index)
+		self.pos: tuple[float, float] = pos[0], pos[1]
+
+	@property
+	def sprite_sheet_name(self) -> str:
+		return self.tile_type.sprite_sheet_name
+
+	@property
+	def image_index(self) -> int:
+		return self.tile_type.image_index
+
+	@property
+	def image(self) -> Image:
+		return self.tile_type.image
+
+	@property
+	def rect(self) -> pygame.Rect:
+		return pygame.Rect(self.tile_type.get_top_left(self.pos), self.tile_type.image.get_image().get_size())
 
 	def draw(self, surface: pygame.Surface, camera: Camera, flag: int = 0):
-		self.image.draw(surface, camera.world_to_screen(self.rect.topleft), flags=flag)
+		self.tile_type.draw(surface, camera, self.pos, flag)
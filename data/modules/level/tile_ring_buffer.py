@@ -0,0 +1,161 @@
+import math
+from typing import Callable, TYPE_CHECKING
+
+import pygame
+import pygbase
+
+from data.modules.base.constants import TILE_SIZE
+from data.modules.level.tile_storage import TileStorage, EMPTY_ID
+
+if TYPE_CHECKING:
+	from data.modules.level.tile import TileType
+
+type Region = tuple[int, int, int, int]  # Left, top, right, bottom in world pixels
+
+
+class TileRingBuffer:
+	"""
+	Off screen copy of a tile layer around the view, which wraps around at its edges.
+	World pixel (x, y) is kept at (x mod width, y mod height), so when the camera moves only the tiles it uncovers are drawn,
+	and the view is drawn with four blits wherever the wrap edges fall.
+	"""
+
+	def __init__(self, tiles: TileStorage, get_tile_type: Callable[[int], "TileType"], layer: int, view_size: tuple[int, int]):
+		self.tiles = tiles
+		self._get_tile_type = get_tile_type
+		self.layer = layer
+
+		# A tile more than the view on every side, so the view always fits between tile edges (and rounding)
+		margin = 2 * math.ceil(TILE_SIZE) + 2
+		self.width = view_size[0] + margin
+		self.height = view_size[1] + margin
+		self.surface = pygame.Surface((self.width, self.height))
+
+		self.tile_pos: tuple[int, int] | None = None  # Top left tile of the buffered region
+
+		self._dirty_regions: list[Region] = []
+
+		self.num_tiles_drawn = 0
+
+	def get_region(self, tile_pos: tuple[int, int]) -> Region:
+		"""
+		:param tile_pos: Top left tile of the buffered region
+		:return: World pixels buffered
+		"""
+
+		left = int(tile_pos[0] * TILE_SIZE)
+		top = int(tile_pos[1] * TILE_SIZE)
+		return left, top, left + self.width, top + self.height
+
+	def invalidate(self, tile_pos: tuple[int, int]):
+		"""
+		Redraws the tile and its neighbours before the next draw, in case the image of a removed tile overhung them
+		"""
+
+		if self.tile_pos is not None:
+			self._dirty_regions.append((
+				int((tile_pos[0] - 1) * TILE_SIZE),
+				int((tile_pos[1] - 1) * TILE_SIZE),
+				int((tile_pos[0] + 2) * TILE_SIZE),
+				int((tile_pos[1] + 2) * TILE_SIZE)
+			))
+
+	def _move_to(self, tile_pos: tuple[int, int]):
+		prev_tile_pos = self.tile_pos
+		self.tile_pos = tile_pos
+
+		new_left, new_top, new_right, new_bottom = self.get_region(tile_pos)
+		if prev_tile_pos is None:
+			self._dirty_regions = [(new_left, new_top, new_right, new_bottom)]
+			return
+
+		left, top, right, bottom = self.get_region(prev_tile_pos)
+
+		# Strips uncovered on each axis, everything if it moved further than the buffer
+		if new_left < left:
+			self._dirty_regions.append((new_left, new_top, min(left, new_right), new_bottom))
+		elif right < new_right:
+			self._dirty_regions.append((max(right, new_left), new_top, new_right, new_bottom))
+
+		if new_top < top:
+			self._dirty_regions.append((new_left, new_top, new_right, min(top, new_bottom)))
+		elif bottom < new_bottom:
+			self._dirty_regions.append((new_left, max(bottom, new_top), new_right, new_bottom))
+
+	def _draw_region(self, region: Region):
+		"""
+		Draws the tiles of the region, clipped to it, in the same order as drawing them one by one
+		"""
+
+		left, top, right, bottom = region
+
+		# Images overhang a pixel into the next column (see PIXEL_SCALE), and can be taller than a tile
+		start_col = math.floor(left / TILE_SIZE) - 1
+		end_col = math.floor(right / TILE_SIZE) + 1
+		start_row = math.floor(top / TILE_SIZE)
+		end_row = math.floor(bottom / TILE_SIZE) + 2
+
+		blits = []
+		for row in range(start_row, end_row):
+			tile_bottom = int((row + 1) * TILE_SIZE)
+
+			for col in range(start_col, end_col):
+				palette_id = self.tiles.get_id(self.layer, col, row)
+				if palette_id != EMPTY_ID:
+					tile_type = self._get_tile_type(palette_id)
+					blits.append((tile_type.image.get_image(), int(col * TILE_SIZE), tile_bottom - tile_type.height))
+
+		self.num_tiles_drawn += len(blits)
+
+		# Split where the region wraps around the buffer, at most in four
+		width = self.width
+		height = self.height
+		for piece_top, piece_bottom in ((top, min(bottom, (top // height + 1) * height)), ((top // height + 1) * height, bottom)):
+			for piece_left, piece_right in ((left, min(right, (left // width + 1) * width)), ((left // width + 1) * width, right)):
+				if piece_left >= piece_right or piece_top >= piece_bottom:
+					continue
+
+				offset_x = piece_left % width - piece_left
+				offset_y = piece_top % height - piece_top
+
+				clip = pygame.Rect(piece_left + offset_x, piece_top + offset_y, piece_right - piece_left, piece_bottom - piece_top)
+				self.surface.set_clip(clip)
+				self.surface.fill((0, 0, 0), clip)
+				self.surface.fblits([(image_surface, (x + offset_x, y + offset_y)) for image_surface, x, y in blits])
+
+		self.surface.set_clip(None)
+
+	def draw(self, surface: pygame.Surface, camera: pygbase.Camera):
+		# Tiles have integer world positions, offset by the floored camera position like the chunk cache
+		view_x = -math.floor(-camera.pos.x)
+		view_y = -math.floor(-camera.pos.y)
+
+		tile_pos = math.floor(view_x / TILE_SIZE) - 1, math.floor(view_y / TILE_SIZE) - 1
+		if tile_pos != self.tile_pos:
+			self._move_to(tile_pos)
+
+		if len(self._dirty_regions) > 0:
+			buffer_left, buffer_top, buffer_right, buffer_bottom = self.get_region(self.tile_pos)
+
+			for left, top, right, bottom in self._dirty_regions:
+				# Only the part still in the buffer
+				left = max(left, buffer_left)
+				top = max(top, buffer_top)
+				right = min(right, buffer_right)
+				bottom = min(bottom, buffer_bottom)
+
+				if left < right and top < bottom:
+					self._draw_region((left, top, right, bottom))
+
+			self._dirty_regions.clear()
+
+		# The view starts at its wrapped position, the rest of it comes from the other side of the buffer
+		start_x = view_x % self.width
+		start_y = view_y % self.height
+		split_x = self.width - start_x
+		split_y = self.height - start_y
+
+		surface.blit(self.surface, (0, 0), (start_x, start_y, split_x, split_y))
+		surface.blit(self.surface, (split_x, 0), (0, start_y, start_x, split_y))
+		surface.blit(self.surface, (0, split_y), (start_x, 0, split_x, start_y))
+		surface.blit(self.surface, (split_x, split_y), (0, 0, start_x, start_y))
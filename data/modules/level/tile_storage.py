@@ -0,0 +1,179 @@
+from array import array
+from typing import Iterator
+
+CHUNK_SHIFT = 4
+CHUNK_SIZE = 1 << CHUNK_SHIFT  # Tiles per chunk side
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_AREA = CHUNK_SIZE * CHUNK_SIZE
+
+EMPTY_ID = 0
+
+
+def get_chunk_pos(tile_pos: tuple[int, int]) -> tuple[int, int]:
+	return tile_pos[0] >> CHUNK_SHIFT, tile_pos[1] >> CHUNK_SHIFT
+
+
+def get_chunk_index(col: int, row: int) -> int:
+	return ((row & CHUNK_MASK) << CHUNK_SHIFT) | (col & CHUNK_MASK)
+
+
+class TileChunk:
+	__slots__ = ("ids", "count")
+
+	def __init__(self):
+		# Row major palette ids, EMPTY_ID where there is no tile
+		self.ids: array = array("H", bytes(CHUNK_AREA * 2))
+		self.count: int = 0
+
+
+class TileStorage:
+	"""
+	Stores tiles as palette ids in fixed size chunks, one chunk map per layer.
+	The palette maps an id to the (sprite_sheet_name, image_index) pair of the tile.
+	"""
+
+	def __init__(self):
+		self.palette: list[tuple[str, int] | None] = [None]  # Index 0 is EMPTY_ID
+		self._palette_ids: dict[tuple[str, int], int] = {}
+
+		# {layer: {chunk_pos: chunk}}
+		self.layers: dict[int, dict[tuple[int, int], TileChunk]] = {}
+
+	def get_palette_id(self, sprite_sheet_name: str, image_index: int) -> int:
+		key = sprite_sheet_name, image_index
+
+		palette_id = self._palette_ids.get(key)
+		if palette_id is None:
+			palette_id = len(self.palette)
+			if palette_id > 0xFFFF:
+				raise ValueError("Tile palette is full")
+
+			self.palette.append(key)
+			self._palette_ids[key] = palette_id
+
+		return palette_id
+
+	def get_chunk(self, layer: int, chunk_pos: tuple[int, int]) -> TileChunk | None:
+		chunks = self.layers.get(layer)
+		if chunks is None:
+			return None
+
+		return chunks.get(chunk_pos)
+
+	def get_id(self, layer: int, col: int, row: int) -> int:
+		chunks = self.layers.get(layer)
+		if chunks is None:
+			return EMPTY_ID
+
+		chunk = chunks.get((col >> CHUNK_SHIFT, row >> CHUNK_SHIFT))
+		if chunk is None:
+			return EMPTY_ID
+
+		return chunk.ids[((row & CHUNK_MASK) << CHUNK_SHIFT) | (col & CHUNK_MASK)]
+
+	def has(self, layer: int, tile_pos: tuple[int, int]) -> bool:
+		return self.get_id(layer, tile_pos[0], tile_pos[1]) != EMPTY_ID
+
+	def get(self, layer: int, tile_pos: tuple[int, int]) -> tuple[str, int] | None:
+		"""
+		:return: (sprite_sheet_name, image_index) of the tile, or None if empty
+		"""
+
+		return self.palette[self.get_id(layer, tile_pos[0], tile_pos[1])]
+
+	def set_id(self, layer: int, tile_pos: tuple[int, int], palette_id: int):
+		chunk_pos = tile_pos[0] >> CHUNK_SHIFT, tile_pos[1] >> CHUNK_SHIFT
+
+		chunks = self.layers.setdefault(layer, {})
+		chunk = chunks.get(chunk_pos)
+		if chunk is None:
+			chunk = chunks[chunk_pos] = TileChunk()
+
+		index = get_chunk_index(tile_pos[0], tile_pos[1])
+		if chunk.ids[index] == EMPTY_ID:
+			chunk.count += 1
+
+		chunk.ids[index] = palette_id
+
+	def set(self, layer: int, tile_pos: tuple[int, int], sprite_sheet_name: str, image_index: int):
+		self.set_id(layer, tile_pos, self.get_palette_id(sprite_sheet_name, image_index))
+
+	def remove(self, layer: int, tile_pos: tuple[int, int]) -> bool:
+		"""
+		:return: True if a tile was removed
+		"""
+
+		chunks = self.layers.get(layer)
+		if chunks is None:
+			return False
+
+		chunk_pos = tile_pos[0] >> CHUNK_SHIFT, tile_pos[1] >> CHUNK_SHIFT
+		chunk = chunks.get(chunk_pos)
+		if chunk is None:
+			return False
+
+		index = get_chunk_index(tile_pos[0], tile_pos[1])
+		if chunk.ids[index] == EMPTY_ID:
+			return False
+
+		chunk.ids[index] = EMPTY_ID
+		chunk.count -= 1
+
+		# Free empty chunks and layers
+		if chunk.count == 0:
+			del chunks[chunk_pos]
+
+			if len(chunks) == 0:
+				del self.layers[layer]
+
+		return True
+
+	def iter_tiles(self, layer: int) -> Iterator[tuple[tuple[int, int], int]]:
+		"""
+		:return: Iterator of (tile_pos, palette_id) for every tile in the layer
+		"""
+
+		for chunk_pos, chunk in self.layers.get(layer, {}).items():
+			base_col = chunk_pos[0] << CHUNK_SHIFT
+			base_row = chunk_pos[1] << CHUNK_SHIFT
+
+			for index, palette_id in enumerate(chunk.ids):
+				if palette_id != EMPTY_ID:
+					yield (base_col + (index & CHUNK_MASK), base_row + (index >> CHUNK_SHIFT)), palette_id
+
+	def get_num_tiles(self, layer: int | None = None) -> int:
+		if layer is not None:
+			return sum(chunk.count for chunk in self.layers.get(layer, {}).values())
+
+		return sum(self.get_num_tiles(layer) for layer in self.layers)
+
+	def get_num_chunks(self) -> int:
+		return sum(len(chunks) for chunks in self.layers.values())
+
+	def to_data(self) -> tuple[list[tuple[str, int]], dict[int, dict[tuple[int, int], bytes]]]:
+		"""
+		:return: (palette without EMPTY_ID, {layer: {chunk_pos: raw ids}}), plain data that pickles compactly
+		"""
+
+		return (
+			self.palette[1:],
+			{layer: {chunk_pos: chunk.ids.tobytes() for chunk_pos, chunk in chunks.items()} for layer, chunks in self.layers.items()}
+		)
+
+	@classmethod
+	def from_data(cls, data: tuple[list[tuple[str, int]], dict[int, dict[tuple[int, int], bytes]]]) -> "TileStorage":
+		palette, layers = data
+
+		tiles = cls()
+		for sprite_sheet_name, image_index in palette:
+			tiles.get_palette_id(sprite_sheet_name, image_index)
+
+		for layer, chunks in layers.items():
+			layer_chunks = tiles.layers[layer] = {}
+
+			for chunk_pos, raw_ids in chunks.items():
+				chunk = layer_chunks[chunk_pos] = TileChunk()
+				chunk.ids = array("H", raw_ids)
+				chunk.count = CHUNK_AREA - chunk.ids.count(EMPTY_ID)
+
+		return tiles
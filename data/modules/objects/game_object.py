@@ -3,6 +3,7 @@ import pygbase
 from pygbase import Camera
 
 from data.modules.base.constants import TILE_SIZE
+from data.modules.base.draw_batch import DrawBatch
 from data.modules.entities.entity import Entity
 
 
@@ -65,3 +66,18 @@ class GameObject(Entity, tags=("object",)):
 			self.sprite.draw(surface, camera.world_to_screen(self.pos), draw_pos="midbottom", flags=flags)
 
 		pygbase.Debug.draw_rect(camera.world_to_screen_rect(self.hitbox), "dark green", 2)
+
+	def draw_batched(self, batch: DrawBatch, camera: Camera) -> bool:
+		if type(self).draw is not GameObject.draw:
+			return False
+
+		if self.is_animated:
+			image = self.sprite.get_current_image().get_image()
+		else:
+			image = self.sprite.get_image(0)
+
+		batch.add(image, image.get_rect(midbottom=camera.world_to_screen(self.pos)).topleft)
+
+		# After the sprite is blitted, or it would cover it
+		batch.defer(pygbase.Debug.draw_rect, camera.world_to_screen_rect(self.hitbox), "dark green", 2)
+		return True
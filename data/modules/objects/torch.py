@@ -29,5 +29,14 @@ class Torch(GameObject, Registrable):
 		self.lighting_manager.add_light(self.light)
 
 	def removed(self):
+		if not self.asleep:
+			self.particle_manager.remove_spawner(self.fire)
+			self.lighting_manager.remove_light(self.light)
+
+	def sleep(self):
 		self.particle_manager.remove_spawner(self.fire)
 		self.lighting_manager.remove_light(self.light)
+
+	def wake(self):
+		self.particle_manager.add_spawner(self.fire)
+		self.lighting_manager.add_light(self.light)
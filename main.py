@@ -17,6 +17,7 @@ from data.modules.entities.states.melee_attack_state import MeleeAttackState
 from data.modules.entities.states.stunned_state import StunnedState
 from data.modules.entities.states.wander_state import WanderState
 from data.modules.game_states.main_menu import MainMenu
+from data.modules.level.level_pregenerator import LevelPregenerator
 from data.modules.objects.altars import RuneAltar
 from data.modules.objects.object_loader import ObjectLoader
 from data.modules.objects.torch import Torch
@@ -54,10 +55,7 @@ def toggle_debug(event: pygame.Event):
 		pygbase.Debug.toggle()
 
 
-if __name__ == '__main__':
-	# profiler = cProfile.Profile()
-	# profiler.enable()
-
+def setup():
 	pygbase.init((SCREEN_WIDTH, SCREEN_HEIGHT), logging_level=logging.DEBUG, rotate_resolution=2, light_radius_interval=3, shadow_ratio=1.6)
 	# pygbase.Debug.show()
 
@@ -104,9 +102,10 @@ if __name__ == '__main__':
 		((0, 0), (0, 0))
 	)
 
-	# Run app
+
+def run(start_state: type[pygbase.GameState]):
 	app = pygbase.App(
-		MainMenu,
+		start_state,
 		# Game,,
 		"Catacombs of Time",
 		run_on_load_complete=(
@@ -119,7 +118,16 @@ if __name__ == '__main__':
 	)
 	app.run()
 
+	LevelPregenerator.shutdown()
 	pygbase.quit()
 
+
+if __name__ == '__main__':
+	# profiler = cProfile.Profile()
+	# profiler.enable()
+
+	setup()
+	run(MainMenu)
+
 # profiler.disable()
 # profiler.dump_stats("stats.prof")